@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the roulette engine.
+
+Scenarios cover a single spin, bet placement plus settlement at 1, 100 and
+10,000 bets per spin, a mixed color/number slip and a headless full round.
+Every scenario is seeded, so runs are reproducible. Each reports ops/sec
+(best of several repeats) and the peak bytes allocated by one operation.
+
+Results are compared against benchmarks/baseline.json. A scenario that is
+slower, or allocates more, than the baseline by more than the threshold
+fails the run with exit code 1.
+
+Usage:
+    python -m benchmarks.bench_roulette
+    python -m benchmarks.bench_roulette --update-baseline
+    python -m benchmarks.bench_roulette --threshold 0.5 --output bench_output.txt
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from random import Random
+from typing import Callable, Dict, List, Optional
+
+from src.bet import Bet, BetType
+from src.game_controller import GameController
+from src.player import Player
+from src.simulation import BetRequest, MixedSlipPolicy
+from src.table import Table
+from src.wheel import Color, Wheel
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.30
+SEED = 20240101
+
+Scenario = Callable[[], Callable[[], None]]
+
+
+def _seeded_table() -> Table:
+    table = Table()
+    table.wheel = Wheel(seed=SEED)
+    return table
+
+
+def _random_bets(count: int, players: List[Player], mixed: bool) -> List[Bet]:
+    rng = Random(SEED)
+    colors = list(Color)
+    bets = []
+    for index in range(count):
+        player = players[index % len(players)]
+        if mixed and rng.random() < 0.5:
+            bets.append(Bet(rng.randint(1, 50), player, BetType.NUMBER, rng.randint(0, 36)))
+        else:
+            bets.append(Bet(rng.randint(1, 50), player, BetType.COLOR, rng.choice(colors)))
+    return bets
+
+
+def single_spin() -> Callable[[], None]:
+    wheel = Wheel(seed=SEED)
+    return wheel.spin
+
+
+def bets_per_spin(count: int, mixed: bool = False) -> Scenario:
+    def setup() -> Callable[[], None]:
+        table = _seeded_table()
+        players = [Player(10 ** 12) for _ in range(8)]
+        bets = _random_bets(count, players, mixed)
+        place_bet = table.place_bet
+
+        def op() -> None:
+            for bet in bets:
+                place_bet(bet)
+            table.spin_wheel_and_payout()
+
+        return op
+
+    return setup
+
+
+def headless_round() -> Callable[[], None]:
+    controller = GameController()
+    controller.table = _seeded_table()
+    controller.player = Player(10 ** 12)
+    policy = MixedSlipPolicy([
+        BetRequest(BetType.COLOR, Color.RED, 10),
+        BetRequest(BetType.NUMBER, 17, 5),
+        BetRequest(BetType.COLOR, Color.GREEN, 1),
+    ])
+
+    def op() -> None:
+        for _ in controller.iter_headless_rounds(policy, 1):
+            pass
+
+    return op
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "single_spin": single_spin,
+    "bets_per_spin_1": bets_per_spin(1),
+    "bets_per_spin_100": bets_per_spin(100),
+    "bets_per_spin_10k": bets_per_spin(10_000),
+    "mixed_slip_100": bets_per_spin(100, mixed=True),
+    "headless_full_round": headless_round,
+}
+
+
+def _time_op(op: Callable[[], None], repeats: int, min_time: float) -> float:
+    """Return the best ops/sec over several repeats of an auto-sized loop."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        best = min(best, (time.perf_counter() - start) / number)
+    return 1.0 / best if best > 0 else float("inf")
+
+
+def _peak_bytes(op: Callable[[], None]) -> int:
+    """Return the peak bytes allocated while running one operation."""
+    op()  # Warm up caches so one-off allocations are not counted
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - baseline)
+
+
+def run_benchmarks(
+    names: Optional[List[str]] = None, repeats: int = 5, min_time: float = 0.1
+) -> Dict[str, dict]:
+    """Run the selected scenarios and return their measurements."""
+    results = {}
+    for name in names or list(SCENARIOS):
+        op = SCENARIOS[name]()
+        results[name] = {
+            "ops_per_sec": round(_time_op(op, repeats, min_time), 1),
+            "peak_bytes": _peak_bytes(op),
+        }
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, dict], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """List the scenarios that regressed beyond the threshold."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if result["ops_per_sec"] < reference["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:,.0f} ops/sec "
+                f"vs baseline {reference['ops_per_sec']:,.0f}"
+            )
+        # Allow a small absolute slack so tiny scenarios do not flap
+        if result["peak_bytes"] > reference["peak_bytes"] * (1 + threshold) + 1024:
+            regressions.append(
+                f"{name}: {result['peak_bytes']:,} peak bytes "
+                f"vs baseline {reference['peak_bytes']:,}"
+            )
+    return regressions
+
+
+def format_results(results: Dict[str, dict], baseline: Dict[str, dict]) -> str:
+    lines = [f"{'scenario':<24}{'ops/sec':>16}{'baseline':>16}{'peak bytes':>14}"]
+    for name, result in results.items():
+        reference = baseline.get(name, {}).get("ops_per_sec")
+        reference_text = f"{reference:,.0f}" if reference else "-"
+        lines.append(
+            f"{name:<24}{result['ops_per_sec']:>16,.0f}{reference_text:>16}"
+            f"{result['peak_bytes']:>14,}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Roulette engine benchmarks")
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed regression as a fraction (default: 0.30)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--output", help="also write the report to this file")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.scenarios or None, repeats=args.repeats)
+    baseline = load_baseline(args.baseline)
+    report = format_results(results, baseline)
+
+    exit_code = 0
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as handle:
+            json.dump(baseline, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        report += f"\n\nBaseline written to {args.baseline}"
+    else:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            report += "\n\nREGRESSIONS:\n" + "\n".join(f"  {line}" for line in regressions)
+            exit_code = 1
+
+    print(report)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(report + "\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Load generator for the roulette game server.
+
+Opens many bot connections on localhost. Each bot joins a table, deposits a
+bankroll and plays rounds of randomized mixed color/number bet slips through
+the line protocol, so every bet goes through the server's Player, Bet and
+Table path. The round trip of every BET is recorded as bet placement
+latency and the round trip of every SPIN as settlement latency. With a round
+timer, settlement latency also includes the wait for the table's next spin,
+so the default spins on request.
+
+By default the server runs in a separate process so bots and server do not
+share an event loop, and --bot-processes spreads the bots over several
+client processes so the load generator is not the bottleneck. The report is
+JSON with p50/p99/p999 latencies in milliseconds.
+
+Usage:
+    python -m benchmarks.load_server --players 2000 --tables 50 --rounds 5
+    python -m benchmarks.load_server --connect 127.0.0.1:8737 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from typing import Dict, List, Optional, Tuple
+
+from src.server import RouletteServer
+
+
+BANKROLL = 1_000_000
+COLORS = ("red", "black", "green")
+PERCENTILES = (("p50", 0.50), ("p99", 0.99), ("p999", 0.999))
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    """Summarize latencies in seconds as count, mean, percentiles and max in milliseconds."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    summary = {"count": len(ordered), "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3)}
+    for name, fraction in PERCENTILES:
+        # Nearest-rank percentile
+        rank = max(1, -(-len(ordered) * fraction // 1))
+        summary[f"{name}_ms"] = round(ordered[int(rank) - 1] * 1000, 3)
+    summary["max_ms"] = round(ordered[-1] * 1000, 3)
+    return summary
+
+
+class _Recorder:
+    """Latencies and counters shared by all bots."""
+
+    def __init__(self):
+        self.bet_latencies: List[float] = []
+        self.settle_latencies: List[float] = []
+        self.errors = 0
+        self.total_bet = 0
+        self.total_won = 0
+        self.failed_bots = 0
+
+
+async def _bot(address, index: int, tables: int, rounds: int, max_bets: int,
+               seed: int, recorder: _Recorder) -> None:
+    rng = Random(seed * 1_000_003 + index)
+    if isinstance(address, str):
+        reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        reader, writer = await asyncio.open_connection(*address)
+
+    async def send(command: str) -> str:
+        writer.write(command.encode() + b"\n")
+        await writer.drain()
+        return (await reader.readline()).decode()
+
+    clock = time.perf_counter
+    staked = 0
+    try:
+        await send(f"JOIN {index % tables}")
+        await send(f"DEPOSIT {BANKROLL}")
+        for _ in range(rounds):
+            for _ in range(rng.randint(1, max_bets)):
+                amount = rng.randint(1, 20)
+                if rng.random() < 0.5:
+                    command = f"BET COLOR {rng.choice(COLORS)} {amount}"
+                else:
+                    command = f"BET NUMBER {rng.randint(0, 36)} {amount}"
+                start = clock()
+                reply = await send(command)
+                recorder.bet_latencies.append(clock() - start)
+                if reply.startswith("OK"):
+                    staked += amount
+                else:
+                    recorder.errors += 1
+
+            start = clock()
+            reply = await send("SPIN")
+            recorder.settle_latencies.append(clock() - start)
+            if not reply.startswith("RESULT"):
+                recorder.errors += 1
+        # A slip can straddle a spin, so winnings are taken from the final balance
+        balance = int((await send("BALANCE")).split()[2])
+        recorder.total_bet += staked
+        recorder.total_won += balance - BANKROLL + staked
+        await send("QUIT")
+    finally:
+        writer.close()
+
+
+async def _play(address, start: int, stop: int, tables: int, rounds: int,
+                max_bets: int, seed: int) -> _Recorder:
+    """Run bots start to stop - 1 concurrently."""
+    recorder = _Recorder()
+    results = await asyncio.gather(
+        *(_bot(address, index, tables, rounds, max_bets, seed, recorder) for index in range(start, stop)),
+        return_exceptions=True,
+    )
+    recorder.failed_bots = sum(1 for result in results if isinstance(result, BaseException))
+    return recorder
+
+
+def _play_in_process(*args) -> _Recorder:
+    return asyncio.run(_play(*args))
+
+
+def _report(recorders: List[_Recorder], elapsed: float, config: dict) -> dict:
+    bet_latencies = [sample for recorder in recorders for sample in recorder.bet_latencies]
+    settle_latencies = [sample for recorder in recorders for sample in recorder.settle_latencies]
+    return {
+        "config": config,
+        "elapsed_sec": round(elapsed, 3),
+        "bets_per_sec": round(len(bet_latencies) / elapsed, 1) if elapsed else None,
+        "failed_bots": sum(recorder.failed_bots for recorder in recorders),
+        "errors": sum(recorder.errors for recorder in recorders),
+        "total_bet": sum(recorder.total_bet for recorder in recorders),
+        "total_won": sum(recorder.total_won for recorder in recorders),
+        "bet_placement": latency_summary(bet_latencies),
+        "settlement": latency_summary(settle_latencies),
+    }
+
+
+def run_load(address, players: int = 1000, tables: int = 50, rounds: int = 5,
+             max_bets: int = 5, seed: int = 0, bot_processes: int = 1) -> dict:
+    """Drive a running server with bot players and report latencies.
+
+    Args:
+        address: (host, port) of a TCP server or the path of a Unix socket
+        players: Number of concurrent bot connections
+        tables: Bots are spread over tables 0 to tables - 1
+        rounds: Rounds each bot plays
+        max_bets: Each round's slip has 1 to max_bets bets
+        seed: Seed for the bots' bet choices
+        bot_processes: Number of client processes to spread the bots over
+
+    Returns:
+        JSON-serializable report.
+    """
+    config = {
+        "players": players, "tables": tables, "rounds": rounds,
+        "max_bets": max_bets, "seed": seed, "bot_processes": bot_processes,
+    }
+    common = (tables, rounds, max_bets, seed)
+    start = time.perf_counter()
+    if bot_processes <= 1:
+        recorders = [asyncio.run(_play(address, 0, players, *common))]
+    else:
+        bounds = [players * part // bot_processes for part in range(bot_processes + 1)]
+        with ProcessPoolExecutor(bot_processes) as pool:
+            futures = [
+                pool.submit(_play_in_process, address, low, high, *common)
+                for low, high in zip(bounds, bounds[1:])
+            ]
+            recorders = [future.result() for future in futures]
+    return _report(recorders, time.perf_counter() - start, config)
+
+
+def _serve(connection, round_interval: Optional[float], seed: int, unix: Optional[str]) -> None:
+    """Run a server in this (child) process and send its address back."""
+
+    async def main() -> None:
+        server = RouletteServer(round_interval, seed)
+        address = await server.start(path=unix)
+        connection.send(address)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def _start_server_process(round_interval: Optional[float], seed: int,
+                          unix: Optional[str]) -> Tuple[multiprocessing.Process, object]:
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(child, round_interval, seed, unix), daemon=True)
+    process.start()
+    return process, parent.recv()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the roulette game server")
+    parser.add_argument("--players", type=int, default=1000, help="concurrent bot connections")
+    parser.add_argument("--tables", type=int, default=50, help="tables to spread the bots over")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds each bot plays")
+    parser.add_argument("--max-bets", type=int, default=5, help="maximum bets per slip")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--round-interval", type=float, default=0.0,
+                        help="server round timer in seconds (0 to spin on request)")
+    parser.add_argument("--bot-processes", type=int, default=1, help="client processes running the bots")
+    parser.add_argument("--unix", metavar="PATH", help="use a Unix socket instead of TCP")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="load an already running server")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        address = (host or "127.0.0.1", int(port))
+    else:
+        process, address = _start_server_process(args.round_interval or None, args.seed, args.unix)
+    try:
+        report = run_load(
+            address, args.players, args.tables, args.rounds, args.max_bets, args.seed,
+            args.bot_processes,
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.join()
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    return 1 if report["failed_bots"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,13 +11,68 @@ Features:
 - Multiple bets per round
 - Interactive user interface
 - Comprehensive input validation
+- Multi-core Monte Carlo simulation of betting strategies
+- Asyncio multi-table game server with a line protocol
 
 Usage:
     python main.py
+    python main.py --record rounds.log
+    python main.py simulate --strategy red --sessions 10000 --rounds 100
+    python main.py serve --port 8737 --round-interval 1
+    python main.py --profile profile.json simulate --backend thread
     python -m src.Rouletee
 """
 
+import argparse
+
 from src.Rouletee import main
+from src import monte_carlo, profiling, server
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Enhanced Roulette Game")
+    parser.add_argument("--record", metavar="PATH", help="append every round to a binary round log")
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="time the round phases and write the results here on exit "
+        "(simulation worker processes are not profiled; use --backend thread)",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=profiling.PROFILE_FORMATS,
+        default="json",
+        help="json histograms or a chrome trace (default: json)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    simulate_parser = subparsers.add_parser(
+        "simulate", help="run a multi-core Monte Carlo simulation of a strategy"
+    )
+    monte_carlo.add_arguments(simulate_parser)
+    serve_parser = subparsers.add_parser(
+        "serve", help="host tables for many players over a local socket"
+    )
+    server.add_arguments(serve_parser)
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> None:
+    if args.command == "simulate":
+        monte_carlo.run_from_args(args)
+    elif args.command == "serve":
+        server.run_from_args(args)
+    else:
+        main(args.record)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args()
+    if not args.profile:
+        run(args)
+    else:
+        profiler = profiling.PROFILER.enable()
+        try:
+            run(args)
+        finally:
+            profiler.disable()
+            profiler.dump(args.profile, args.profile_format)
@@ -1,16 +1,29 @@
+from typing import Optional
+
 from .game_controller import GameController
+from .round_log import RoundRecorder
+
 
+def main(record_path: Optional[str] = None):
+    """Main entry point for the roulette game.
 
-def main():
-    """Main entry point for the roulette game."""
+    Args:
+        record_path: If given, append every round to this binary round log
+    """
+    recorder = None
     try:
         game = GameController()
+        if record_path:
+            recorder = RoundRecorder(record_path).attach(game.table)
         game.run_game()
     except KeyboardInterrupt:
         print("\n\nGame interrupted by user. Thanks for playing!")
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         print("Please try running the game again.")
+    finally:
+        if recorder is not None:
+            recorder.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+"""
+Exact analytics for a slip of bets on one spin.
+
+The wheel has 37 equally likely positions, so a slip's net outcome is fully
+described by its net result on each position. Bets on the same target are
+merged first, which keeps the work at O(37 x distinct targets) regardless of
+how many bets are on the table. All probabilities are exact Fractions.
+"""
+
+from collections import defaultdict
+from fractions import Fraction
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from .bet import Bet, PAYOUT_MATRIX, bet_slot
+
+
+class SlipAnalysis(NamedTuple):
+    """Exact distribution and moments of a slip's net outcome for one round."""
+
+    total_bet: int
+    net_by_position: List[int]
+    distribution: Dict[int, Fraction]
+    expected_value: Fraction
+    variance: Fraction
+    risk_of_ruin: Optional[Fraction]
+
+
+def net_by_position(bets: Iterable[Bet]) -> List[int]:
+    """Compute the slip's net result (payout minus stakes) for every position.
+
+    Args:
+        bets: The bets of one round, e.g. Table.bets
+
+    Returns:
+        List of 37 net results indexed by winning position.
+    """
+    stakes_by_slot = defaultdict(int)
+    total_bet = 0
+    for bet in bets:
+        total_bet += bet.amount
+        slot = bet_slot(bet.bet_type, bet.bet_value)
+        if slot is not None:
+            stakes_by_slot[slot] += bet.amount
+
+    nets = [-total_bet] * 37
+    for (kind, target), amount in stakes_by_slot.items():
+        row = PAYOUT_MATRIX[kind][target]
+        for position in range(37):
+            odds = row[position]
+            if odds:
+                nets[position] += amount * odds
+    return nets
+
+
+def risk_of_ruin(nets: List[int], total_bet: int, balance: int, rounds: int = 1) -> Fraction:
+    """Probability of being unable to cover the slip again within a number of rounds.
+
+    The slip is replayed every round while the balance covers it. Balances are
+    tracked exactly with integer path counts over 37 ** rounds outcomes.
+
+    Args:
+        nets: Net result per position, from net_by_position
+        total_bet: Total stake of the slip
+        balance: Bankroll before the first slip is staked
+        rounds: Number of rounds the slip is replayed
+
+    Returns:
+        Exact probability that the balance drops below total_bet.
+    """
+    outcome_counts = defaultdict(int)
+    for net in nets:
+        outcome_counts[net] += 1
+
+    states = {balance: 1}
+    ruined = 0
+    scale = 1
+    for _ in range(rounds):
+        next_states = defaultdict(int)
+        ruined *= 37
+        for current, count in states.items():
+            if current < total_bet:
+                ruined += count * 37
+                continue
+            for net, ways in outcome_counts.items():
+                next_states[current + net] += count * ways
+        states = next_states
+        scale *= 37
+
+    ruined += sum(count for current, count in states.items() if current < total_bet)
+    return Fraction(ruined, scale)
+
+
+def analyze_bets(
+    bets: Iterable[Bet], balance: Optional[int] = None, rounds: int = 1
+) -> SlipAnalysis:
+    """Analyze a slip of bets exactly.
+
+    Args:
+        bets: The bets of one round, exactly as they sit in Table.bets
+        balance: Optional bankroll before the slip is staked. For bets already
+            on the table, that is the player's balance plus the staked total.
+        rounds: Number of replays of the slip used for the risk of ruin
+
+    Returns:
+        SlipAnalysis with the net outcome distribution, expected value,
+        variance and (if a balance is given) risk of ruin.
+    """
+    bets = list(bets)
+    total_bet = sum(bet.amount for bet in bets)
+    nets = net_by_position(bets)
+
+    distribution = defaultdict(int)
+    for net in nets:
+        distribution[net] += 1
+    distribution = {net: Fraction(count, 37) for net, count in sorted(distribution.items())}
+
+    expected_value = Fraction(sum(nets), 37)
+    variance = Fraction(sum(net * net for net in nets), 37) - expected_value ** 2
+
+    ruin = None
+    if balance is not None:
+        ruin = risk_of_ruin(nets, total_bet, balance, rounds)
+
+    return SlipAnalysis(total_bet, nets, distribution, expected_value, variance, ruin)
@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import Union
-from .wheel import Color
+from typing import Optional, Tuple, Union
+from .wheel import Color, CODE_COLORS, COLOR_CODES, WHEEL_LAYOUT
 from .player import Player
 
 
@@ -9,8 +9,74 @@ class BetType(Enum):
     NUMBER = "number"
 
 
+# Compact bet kind codes. A bet's target is a color code (see COLOR_CODES)
+# for color bets and a wheel position for number bets.
+BET_KIND_CODES = {BetType.COLOR: 0, BetType.NUMBER: 1}
+
+
+def _build_payout_matrix() -> tuple:
+    """Build the (bet kind, target) x winning position -> odds matrix.
+
+    Color bets pay 35:1 on green and 2:1 on red or black; number bets pay
+    35:1 on an exact match. Every other entry is 0 (the bet loses).
+    """
+    color_rows = tuple(
+        bytes(
+            (35 if color == Color.GREEN else 2) if WHEEL_LAYOUT.color_codes[position] == code else 0
+            for position in range(37)
+        )
+        for code, color in enumerate(CODE_COLORS)
+    )
+    number_rows = tuple(
+        bytes(35 if position == target else 0 for position in range(37))
+        for target in range(37)
+    )
+    return (color_rows, number_rows)
+
+
+PAYOUT_MATRIX = _build_payout_matrix()
+
+# Odds paid when a (bet kind, target) bet wins
+WINNING_ODDS = tuple(tuple(max(row) for row in rows) for rows in PAYOUT_MATRIX)
+
+
+# Color bet slots keyed by id(color): hashing a Color runs in Python, and
+# bet_slot is called for every bet placed
+_COLOR_SLOTS = {
+    id(color): (BET_KIND_CODES[BetType.COLOR], code) for color, code in COLOR_CODES.items()
+}
+_NUMBER_KIND = BET_KIND_CODES[BetType.NUMBER]
+
+
+def bet_slot(bet_type: BetType, bet_value: Union[Color, int]) -> Optional[Tuple[int, int]]:
+    """Get the (bet kind, target) row of PAYOUT_MATRIX for a bet.
+
+    Returns:
+        Tuple of kind code and target, or None if the bet can never win.
+    """
+    if bet_type is BetType.COLOR:
+        return _COLOR_SLOTS.get(id(bet_value))
+    if bet_type is BetType.NUMBER and type(bet_value) is int and 0 <= bet_value <= 36:
+        return (_NUMBER_KIND, bet_value)
+    return None
+
+
+def winning_odds(bet_type: BetType, bet_value: Union[Color, int]) -> int:
+    """Get the odds a bet pays if it wins (0 if it can never win)."""
+    slot = bet_slot(bet_type, bet_value)
+    return WINNING_ODDS[slot[0]][slot[1]] if slot is not None else 0
+
+
+def payout_odds(bet_type: BetType, bet_value: Union[Color, int], winning_position: int) -> int:
+    """Get the odds a bet pays for a winning position (0 if it loses)."""
+    slot = bet_slot(bet_type, bet_value)
+    return PAYOUT_MATRIX[slot[0]][slot[1]][winning_position] if slot is not None else 0
+
+
 class Bet:
 
+    __slots__ = ("amount", "player", "bet_type", "bet_value", "color")
+
     def __init__(self, amount: int, player: Player, bet_type: BetType = None, bet_value: Union[Color, int] = None, color: Color = None):
         self.amount = amount
         self.player = player
@@ -24,35 +90,29 @@ class Bet:
             self.bet_type = bet_type
             self.bet_value = bet_value
             # Set color attribute for backward compatibility when it's a color bet
-            if bet_type == BetType.COLOR:
-                self.color = bet_value
+            self.color = bet_value if bet_type == BetType.COLOR else None
 
     def payout(self, winning_color: Color, winning_position: int = None) -> None:
         # Handle backward compatibility - if only color is provided
         if winning_position is None:
             # Old method signature - assume color betting
-            if hasattr(self, 'color') and self.color == winning_color:
-                odds = 35 if winning_color == Color.GREEN else 2
-                winnings = self.amount * odds
-                self.player.add_to_balance(winnings)
+            if self.color is not None and self.color == winning_color:
+                odds = WINNING_ODDS[BET_KIND_CODES[BetType.COLOR]][COLOR_CODES[winning_color]]
+                self.player.add_to_balance(self.amount * odds)
             return
-        
+
         # New method with both winning_color and winning_position
-        won = False
-        odds = 0
-        
+        slot = bet_slot(self.bet_type, self.bet_value)
+        if slot is None:
+            return
+        kind, target = slot
+
         if self.bet_type == BetType.COLOR:
-            # Color bet logic
-            if self.bet_value == winning_color:
-                won = True
-                odds = 35 if winning_color == Color.GREEN else 2
-        elif self.bet_type == BetType.NUMBER:
-            # Number bet logic - exact position match
-            if self.bet_value == winning_position:
-                won = True
-                odds = 35  # 35:1 for number bets
-        
-        if won:
-            winnings = self.amount * odds
-            self.player.add_to_balance(winnings)
+            # Color bets are settled on the winning color they are given
+            odds = WINNING_ODDS[kind][target] if self.bet_value == winning_color else 0
+        else:
+            odds = PAYOUT_MATRIX[kind][target][winning_position]
+
+        if odds:
+            self.player.add_to_balance(self.amount * odds)
         # If bet loses, no payout is made (amount was already deducted when bet was placed)
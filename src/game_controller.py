@@ -1,7 +1,9 @@
-from typing import Optional, Union
+from typing import Iterator, List, Optional, Union
 from .player import Player
 from .table import Table
-from .bet import Bet, BetType
+from .bet import Bet, BetType, payout_odds, winning_odds
+from .limits import MAX_AMOUNT
+from .simulation import BettingPolicy, RoundResult, is_valid_bet_request
 from .wheel import Color
 
 
@@ -75,9 +77,9 @@ class GameController:
                 return None
 
             # Check for extremely large numbers that might cause issues
-            if num > 1000000:  # 1 million limit
+            if num > MAX_AMOUNT:
                 self.display_message(
-                    f"Error: {field_name} is too large. Maximum allowed is $1,000,000."
+                    f"Error: {field_name} is too large. Maximum allowed is ${MAX_AMOUNT:,}."
                 )
                 return None
 
@@ -408,39 +410,21 @@ class GameController:
             if color_choice is not None:
                 break
 
-        # Deduct bet amount from player balance and place bet
+        # Reserve the stake and place the bet; a failed placement is refunded by the ledger
         try:
-            # Double-check balance before deducting (edge case protection)
-            if bet_amount > self.player.get_balance():
-                self.display_message(
-                    "Error: Balance changed unexpectedly. Please try again."
-                )
-                return False
-
-            self.player.subtract_from_balance(bet_amount)
-            bet = Bet(bet_amount, self.player, BetType.COLOR, color_choice)
-            self.table.place_bet(bet)
-
-            # Display bet confirmation
-            self.display_bet_confirmation(BetType.COLOR, bet_amount, color_choice)
-            self.display_message(f"Remaining balance: ${self.player.get_balance()}")
-            return True
-
+            self._place_bet(BetType.COLOR, bet_amount, color_choice)
         except ValueError as e:
             self.display_message(f"Error placing bet: {e}")
-            # Restore balance if bet placement failed after deduction
-            try:
-                self.player.add_to_balance(bet_amount)
-                self.display_message("Bet amount has been refunded to your balance.")
-            except:
-                self.display_message(
-                    "Warning: There may be an issue with your balance. Please check."
-                )
             return False
         except Exception as e:
             self.display_message(f"Unexpected error placing bet: {e}")
             return False
 
+        # Display bet confirmation
+        self.display_bet_confirmation(BetType.COLOR, bet_amount, color_choice)
+        self.display_message(f"Remaining balance: ${self.player.get_balance()}")
+        return True
+
     def _handle_number_betting(self, bet_amount: int) -> bool:
         """Handle number betting flow.
         
@@ -463,39 +447,34 @@ class GameController:
             if number_choice is not None:
                 break
 
-        # Deduct bet amount from player balance and place bet
+        # Reserve the stake and place the bet; a failed placement is refunded by the ledger
         try:
-            # Double-check balance before deducting (edge case protection)
-            if bet_amount > self.player.get_balance():
-                self.display_message(
-                    "Error: Balance changed unexpectedly. Please try again."
-                )
-                return False
-
-            self.player.subtract_from_balance(bet_amount)
-            bet = Bet(bet_amount, self.player, BetType.NUMBER, number_choice)
-            self.table.place_bet(bet)
-
-            # Display bet confirmation
-            self.display_bet_confirmation(BetType.NUMBER, bet_amount, number_choice)
-            self.display_message(f"Remaining balance: ${self.player.get_balance()}")
-            return True
-
+            self._place_bet(BetType.NUMBER, bet_amount, number_choice)
         except ValueError as e:
             self.display_message(f"Error placing bet: {e}")
-            # Restore balance if bet placement failed after deduction
-            try:
-                self.player.add_to_balance(bet_amount)
-                self.display_message("Bet amount has been refunded to your balance.")
-            except:
-                self.display_message(
-                    "Warning: There may be an issue with your balance. Please check."
-                )
             return False
         except Exception as e:
             self.display_message(f"Unexpected error placing bet: {e}")
             return False
 
+        # Display bet confirmation
+        self.display_bet_confirmation(BetType.NUMBER, bet_amount, number_choice)
+        self.display_message(f"Remaining balance: ${self.player.get_balance()}")
+        return True
+
+    def _place_bet(self, bet_type: BetType, bet_amount: int, selection: Union[Color, int]) -> None:
+        """Reserve the bet amount from the player and place the bet on the table.
+
+        Args:
+            bet_type: The type of bet (COLOR or NUMBER)
+            bet_amount: The amount to bet
+            selection: The color or number selected
+
+        Raises:
+            ValueError: If the player's balance is insufficient.
+        """
+        self.table.reserve_and_place_bet(Bet(bet_amount, self.player, bet_type, selection))
+
     def execute_round(self) -> None:
         """Execute a game round - spin wheel and process payouts with detailed results for multiple bets."""
         self.display_message("\n" + "=" * 30)
@@ -577,20 +556,9 @@ class GameController:
             bet_amount = bet_detail['amount']
             
             # Determine if bet won and calculate winnings
-            won = False
-            winnings = 0
-            odds = 0
-            
-            if bet_type == BetType.COLOR:
-                if bet_value == winning_color:
-                    won = True
-                    odds = 35 if winning_color == Color.GREEN else 2
-                    winnings = bet_amount * odds
-            elif bet_type == BetType.NUMBER:
-                if bet_value == winning_position:
-                    won = True
-                    odds = 35
-                    winnings = bet_amount * odds
+            odds = payout_odds(bet_type, bet_value, winning_position)
+            won = odds > 0
+            winnings = bet_amount * odds
 
             # Display bet result
             if bet_type == BetType.COLOR:
@@ -701,10 +669,11 @@ class GameController:
         self.display_message("BET CONFIRMATION")
         self.display_message("-" * 25)
         
+        odds = winning_odds(bet_type, selection)
+        potential_payout = amount * odds
+
         if bet_type == BetType.COLOR:
             color_name = selection.value.upper()
-            odds = 35 if selection == Color.GREEN else 2
-            potential_payout = amount * odds
             
             self.display_message(f"Bet Type: Color")
             self.display_message(f"Selection: {color_name}")
@@ -713,12 +682,10 @@ class GameController:
             self.display_message(f"Potential Payout: ${potential_payout}")
             
         elif bet_type == BetType.NUMBER:
-            potential_payout = amount * 35
-            
             self.display_message(f"Bet Type: Number")
             self.display_message(f"Selection: {selection}")
             self.display_message(f"Bet Amount: ${amount}")
-            self.display_message(f"Odds: 35:1")
+            self.display_message(f"Odds: {odds}:1")
             self.display_message(f"Potential Payout: ${potential_payout}")
         
         self.display_message("-" * 25)
@@ -735,6 +702,80 @@ class GameController:
             self.display_message("💸 Better luck next time!")
         self.display_message("=" * 40)
 
+    def iter_headless_rounds(
+        self, policy: BettingPolicy, rounds: int
+    ) -> Iterator[RoundResult]:
+        """Play rounds without any console input or output.
+
+        Runs the same round logic as handle_multiple_bets and execute_round,
+        with the betting policy standing in for the prompts. Bets the prompts
+        would reject are skipped. Play stops early when the player cannot make
+        the minimum bet or the policy places no bets.
+
+        Args:
+            policy: The betting policy choosing each round's bets
+            rounds: Maximum number of rounds to play
+
+        Yields:
+            A RoundResult for every round played.
+        """
+        if self.player is None:
+            raise ValueError("A player is required to run a headless simulation")
+
+        player = self.player
+        table = self.table
+        last_result = None
+
+        for round_number in range(1, rounds + 1):
+            balance = player.get_balance()
+            if balance < 1:
+                return
+
+            bets_placed = 0
+            total_bet = 0
+            for request in policy.bets_for_round(balance, last_result):
+                if not is_valid_bet_request(request, balance - total_bet):
+                    continue
+                self._place_bet(request.bet_type, request.amount, request.bet_value)
+                bets_placed += 1
+                total_bet += request.amount
+
+            if not bets_placed:
+                return
+
+            balance_before = player.get_balance()
+            table.spin_wheel_and_payout()
+            winning_position, winning_color = table.wheel.get_ball_position()
+            balance_after = player.get_balance()
+
+            last_result = RoundResult(
+                round_number,
+                winning_position,
+                winning_color,
+                bets_placed,
+                total_bet,
+                balance_after - balance_before,
+                balance_after,
+            )
+            yield last_result
+
+    def run_headless(
+        self, policy: BettingPolicy, rounds: int, initial_balance: Optional[int] = None
+    ) -> List[RoundResult]:
+        """Run a headless simulation and collect every round's result.
+
+        Args:
+            policy: The betting policy choosing each round's bets
+            rounds: Maximum number of rounds to play
+            initial_balance: If given, start with a new player with this balance
+
+        Returns:
+            List of RoundResult, one per round played.
+        """
+        if initial_balance is not None:
+            self.player = Player(initial_balance)
+        return list(self.iter_headless_rounds(policy, rounds))
+
     def run_game(self) -> None:
         """Main game loop that orchestrates the entire game with comprehensive error handling."""
         try:
@@ -0,0 +1,251 @@
+"""
+Bit-packed history of winning positions.
+
+A wheel position (0-36) fits in 6 bits, so RoundHistory packs four
+positions into three bytes: each group of four is a little-endian 24-bit
+word with position k of the group in bits 6k to 6k + 5. A full history
+costs 0.75 bytes per spin instead of a list slot and an int per spin,
+which lets long-running tables keep every outcome in memory.
+
+Positions that do not yet fill a group wait in a small integer tail until
+the fourth one arrives. to_bytes serializes the history as a 12-byte header
+(magic and count) followed by the packed groups, the last one zero-padded.
+"""
+
+import struct
+from typing import Iterable, Iterator, List, Union
+
+from .ledger import LedgerEntry
+from .table import Table
+from .wheel import Color
+
+
+HISTORY_MAGIC = b"RHST"
+HISTORY_HEADER = struct.Struct("<4sQ")
+MAX_POSITION = 36
+
+
+def _table(function) -> bytes:
+    return bytes(function(value) & 0xFF for value in range(256))
+
+
+# Byte translation tables moving each position's bits to or from its place
+# in the group's three bytes
+_LOW6 = _table(lambda value: value & 63)
+_SHR2 = _table(lambda value: value >> 2)
+_SHR4 = _table(lambda value: value >> 4)
+_SHR6 = _table(lambda value: value >> 6)
+_SHL2 = _table(lambda value: value << 2)
+_LOW2_SHL4 = _table(lambda value: (value & 3) << 4)
+_LOW2_SHL6 = _table(lambda value: (value & 3) << 6)
+_LOW4_SHL2 = _table(lambda value: (value & 15) << 2)
+_LOW4_SHL4 = _table(lambda value: (value & 15) << 4)
+
+
+def _merge(first: bytes, second: bytes) -> bytes:
+    """Bytewise OR of two equal-length strings whose set bits do not overlap."""
+    merged = int.from_bytes(first, "little") | int.from_bytes(second, "little")
+    return merged.to_bytes(len(first), "little")
+
+
+def _interleave(lanes: List[bytes]) -> bytearray:
+    """Interleave equal-length lanes byte by byte."""
+    out = bytearray(len(lanes[0]) * len(lanes))
+    for lane_index, lane in enumerate(lanes):
+        out[lane_index::len(lanes)] = lane
+    return out
+
+
+def _pack(positions: bytes) -> bytearray:
+    """Pack positions (a multiple of four) into three bytes per group."""
+    # Every step is a C-level slice, translate or big-int operation
+    p0, p1, p2, p3 = (positions[lane::4] for lane in range(4))
+    return _interleave([
+        _merge(p0, p1.translate(_LOW2_SHL6)),
+        _merge(p1.translate(_SHR2), p2.translate(_LOW4_SHL4)),
+        _merge(p2.translate(_SHR4), p3.translate(_SHL2)),
+    ])
+
+
+def _unpack(packed: bytes) -> bytearray:
+    """Unpack whole groups, one byte per position."""
+    b0, b1, b2 = (bytes(packed[lane::3]) for lane in range(3))
+    return _interleave([
+        b0.translate(_LOW6),
+        _merge(b0.translate(_SHR6), b1.translate(_LOW4_SHL2)),
+        _merge(b1.translate(_SHR4), b2.translate(_LOW2_SHL4)),
+        b2.translate(_SHR2),
+    ])
+
+
+class RoundHistory:
+    """Compact, append-only sequence of winning positions."""
+
+    __slots__ = ("_packed", "_tail", "_length")
+
+    def __init__(self, positions: Iterable[int] = ()):
+        """Create a history.
+
+        Args:
+            positions: Initial positions, oldest first
+        """
+        self._packed = bytearray()
+        # Positions of the incomplete last group, packed the same way
+        self._tail = 0
+        self._length = 0
+        self.extend(positions)
+
+    def attach(self, table: Table) -> "RoundHistory":
+        """Append the winning position of every round the table settles from now on."""
+        table.add_round_listener(self)
+        return self
+
+    def detach(self, table: Table) -> None:
+        table.remove_round_listener(self)
+
+    def __call__(self, round_id: int, position: int, color: Color, entries: List[LedgerEntry]) -> None:
+        self.append(position)
+
+    def append(self, position: int) -> None:
+        """Append one winning position.
+
+        Raises:
+            ValueError: If the position is not on the wheel.
+        """
+        if not 0 <= position <= MAX_POSITION:
+            raise ValueError(f"Invalid wheel position: {position}")
+        length = self._length
+        slot = length & 3
+        tail = self._tail | (position << (6 * slot))
+        if slot == 3:
+            self._packed += tail.to_bytes(3, "little")
+            tail = 0
+        self._tail = tail
+        self._length = length + 1
+
+    def extend(self, positions: Iterable[int]) -> None:
+        """Append many winning positions.
+
+        Raises:
+            ValueError: If a position is not on the wheel; nothing is appended.
+        """
+        # bytes(n) would append n zeros
+        if isinstance(positions, int):
+            raise ValueError("Positions must be an iterable of integers, not an integer")
+        # bytes() rejects anything outside 0-255 in one C-level pass
+        try:
+            data = bytes(positions)
+        except (TypeError, ValueError):
+            raise ValueError("Positions must be integers from 0 to 36") from None
+        if not data:
+            return
+        if max(data) > MAX_POSITION:
+            raise ValueError(f"Invalid wheel position: {max(data)}")
+
+        start = min(-self._length & 3, len(data))
+        for position in data[:start]:
+            self.append(position)
+        stop = start + (len(data) - start) // 4 * 4
+        if stop > start:
+            self._packed += _pack(data[start:stop])
+            self._length += stop - start
+        for position in data[stop:]:
+            self.append(position)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, "RoundHistory"]:
+        """Get one position, or a slice as a new RoundHistory."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._length))
+            if not indices:
+                return RoundHistory()
+            first = min(indices[0], indices[-1])
+            base = first & ~3
+            window = self._unpack_range(first, max(indices[0], indices[-1]) + 1)
+            return RoundHistory(window[indices.start - base::indices.step][:len(indices)])
+
+        length = self._length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("History index out of range")
+        offset = (index >> 2) * 3
+        packed = self._packed
+        if offset < len(packed):
+            word = packed[offset] | packed[offset + 1] << 8 | packed[offset + 2] << 16
+        else:
+            word = self._tail
+        return (word >> (6 * (index & 3))) & 63
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.positions())
+
+    def _unpack_range(self, start: int, stop: int) -> bytearray:
+        """Unpack the groups holding positions start to stop - 1, from the start of start's group."""
+        packed = self._packed
+        unpacked = _unpack(packed[(start >> 2) * 3:min((stop + 3) >> 2, len(packed) // 3) * 3])
+        if stop > len(packed) // 3 * 4:
+            tail = self._tail
+            for _ in range(self._length & 3):
+                unpacked.append(tail & 63)
+                tail >>= 6
+        return unpacked
+
+    def positions(self) -> bytes:
+        """Unpack the whole history, one byte per position."""
+        return bytes(self._unpack_range(0, self._length))
+
+    def tolist(self) -> List[int]:
+        return list(self.positions())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the packed positions."""
+        return len(self._packed) + (3 if self._length & 3 else 0)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the history (header, then the packed groups)."""
+        parts = [HISTORY_HEADER.pack(HISTORY_MAGIC, self._length), bytes(self._packed)]
+        if self._length & 3:
+            parts.append(self._tail.to_bytes(3, "little"))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RoundHistory":
+        """Deserialize a history written by to_bytes.
+
+        Raises:
+            ValueError: If the data is not a serialized history.
+        """
+        if len(data) < HISTORY_HEADER.size:
+            raise ValueError("Data is too short for a round history")
+        magic, length = HISTORY_HEADER.unpack_from(data)
+        if magic != HISTORY_MAGIC:
+            raise ValueError("Data is not a round history")
+        groups, extra = divmod(length, 4)
+        size = HISTORY_HEADER.size + 3 * (groups + (1 if extra else 0))
+        if len(data) != size:
+            raise ValueError("Round history size does not match its length")
+
+        history = cls()
+        body = HISTORY_HEADER.size
+        history._packed = bytearray(data[body:body + 3 * groups])
+        if extra:
+            tail = int.from_bytes(data[body + 3 * groups:size], "little")
+            history._tail = tail & ((1 << 6 * extra) - 1)
+        history._length = length
+        # 6 bits hold up to 63; anything past the wheel is not a valid history
+        highest = max(history.positions(), default=0)
+        if highest > MAX_POSITION:
+            raise ValueError(f"Invalid wheel position in round history: {highest}")
+        return history
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RoundHistory):
+            return NotImplemented
+        return (self._length, self._tail, self._packed) == (other._length, other._tail, other._packed)
+
+    def __repr__(self) -> str:
+        return f"RoundHistory(<{self._length} positions>)"
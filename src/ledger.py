@@ -0,0 +1,147 @@
+"""
+Round ledger: atomic stake reservation, refunds and batched settlement.
+
+A stake is reserved by taking it off the player's balance atomically, so
+concurrent bets for the same player can never overdraw it. The ledger
+records what each player has staked this round; a refund gives back part of
+a reserved stake and can never exceed it. Winnings are only recorded as
+pending and commit applies them with one balance update per player.
+
+The public methods take the ledger's lock, for callers sharing a ledger
+across threads. A Table does not touch its ledger per bet: it works out
+each player's stake from its settlement columns when the round is settled
+and records stakes and winnings together with settle_and_commit.
+"""
+
+import threading
+from functools import partial
+from typing import Dict, Iterable, List, NamedTuple, Sequence
+
+from .player import Player
+
+
+class LedgerEntry(NamedTuple):
+    """One player's stakes and winnings for a committed round."""
+
+    player: Player
+    staked: int
+    winnings: int
+
+
+# Builds a LedgerEntry from a (player, staked, winnings) tuple without going
+# through the Python-level NamedTuple constructor
+_make_entry = partial(tuple.__new__, LedgerEntry)
+
+
+class Ledger:
+    """Thread-safe record of a round's stakes and winnings per player."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # id(player) -> [player, staked, winnings]
+        self._entries: Dict[int, list] = {}
+
+    def reserve(self, player: Player, amount: int) -> None:
+        """Take a stake off the player's balance for this round.
+
+        Raises:
+            ValueError: If the player's balance is insufficient.
+        """
+        if amount <= 0:
+            raise ValueError("Stake must be greater than 0")
+        player.subtract_from_balance(amount)
+        self.record_stake(player, amount)
+
+    def record_stake(self, player: Player, amount: int) -> None:
+        """Record a stake the caller has already taken off the player's balance."""
+        with self._lock:
+            self._add_stake(player, amount)
+
+    def _add_stake(self, player: Player, amount: int) -> None:
+        # Caller holds the lock, or is the only thread changing this ledger
+        entry = self._entries.get(id(player))
+        if entry is None:
+            self._entries[id(player)] = [player, amount, 0]
+        else:
+            entry[1] += amount
+
+    def refund(self, player: Player, amount: int) -> None:
+        """Give back part or all of a stake reserved this round.
+
+        Raises:
+            ValueError: If the amount exceeds what the player has reserved.
+        """
+        with self._lock:
+            entry = self._entries.get(id(player))
+            if entry is None or amount > entry[1]:
+                raise ValueError("Refund exceeds the reserved stake")
+            entry[1] -= amount
+        player.add_to_balance(amount)
+
+    def settle(self, player: Player, winnings: int) -> None:
+        """Record winnings for a player; they are paid on commit."""
+        self.settle_many((player,), (winnings,))
+
+    def settle_many(self, players: Iterable[Player], winnings: Iterable[int]) -> None:
+        """Record winnings for several players at once; they are paid on commit."""
+        with self._lock:
+            # Read under the lock: commit may swap in a fresh round at any time
+            entries = self._entries
+            for player, amount in zip(players, winnings):
+                entry = entries.get(id(player))
+                if entry is None:
+                    entries[id(player)] = [player, 0, amount]
+                else:
+                    entry[2] += amount
+
+    def staked(self, player: Player) -> int:
+        """Amount the player has reserved this round."""
+        with self._lock:
+            entry = self._entries.get(id(player))
+            return entry[1] if entry is not None else 0
+
+    def commit(self) -> List[LedgerEntry]:
+        """Pay all pending winnings, one balance update per player, and start a new round.
+
+        Returns:
+            The committed entries.
+        """
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        committed = [LedgerEntry._make(entry) for entry in entries.values()]
+        for player, _, winnings in committed:
+            if winnings:
+                player.add_to_balance(winnings)
+        return committed
+
+    def settle_and_commit(
+        self, players: Sequence[Player], stakes: Sequence[int], winnings: Sequence[int]
+    ) -> List[LedgerEntry]:
+        """Record a round's stakes and winnings and commit it, taking the lock once.
+
+        Args:
+            players: Players of the round, each listed once
+            stakes: Amount each player staked without reserve or record_stake
+            winnings: Winnings of each player
+
+        Returns:
+            The committed entries.
+        """
+        lock = self._lock
+        lock.acquire()
+        try:
+            pending, self._entries = self._entries, {}
+        finally:
+            lock.release()
+        committed = [_make_entry(entry) for entry in zip(players, stakes, winnings)]
+        if pending:
+            # Merge what was reserved, recorded or settled earlier this round
+            for index, (player, staked, won) in enumerate(committed):
+                entry = pending.pop(id(player), None)
+                if entry is not None:
+                    committed[index] = LedgerEntry(player, staked + entry[1], won + entry[2])
+            committed.extend(LedgerEntry._make(entry) for entry in pending.values())
+        for player, _, won in committed:
+            if won:
+                player.add_to_balance(won)
+        return committed
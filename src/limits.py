@@ -0,0 +1,9 @@
+"""
+Limits on the amounts players enter.
+
+The interactive prompts, the game server and headless betting policies all
+check amounts against these.
+"""
+
+# Largest amount accepted for a single bet or deposit
+MAX_AMOUNT = 1_000_000
@@ -0,0 +1,155 @@
+"""
+Lockstep simulation of many independent sessions of a single-bet strategy.
+
+Instead of one Player/Table per session, balances, stakes and rounds played
+are held in arrays indexed by session. Every step draws one vector of spins
+(one spin per active session) and maps it to payout odds with a single
+bytes.translate over the PAYOUT_MATRIX row of the strategy's bet.
+
+The rules match Bet.payout and Player.subtract_from_balance: a stake larger
+than the balance is rejected, which ends that session, and sessions that
+bust are masked out of later steps.
+"""
+
+from array import array
+from typing import Optional, Union
+
+from .bet import BetType, PAYOUT_MATRIX, bet_slot
+from .rng import SpinSource
+from .wheel import Color, Wheel, WheelLayout
+
+
+FLAT = "flat"
+MARTINGALE = "martingale"
+PROGRESSIONS = (FLAT, MARTINGALE)
+
+
+class LockstepSimulator:
+    """Advance many sessions of the same strategy together, one spin vector per step."""
+
+    def __init__(
+        self,
+        sessions: int,
+        initial_balance: int,
+        bet_type: BetType,
+        bet_value: Union[Color, int],
+        base_stake: int,
+        progression: str = FLAT,
+        seed: Optional[int] = None,
+        rng: Optional[SpinSource] = None,
+    ):
+        slot = bet_slot(bet_type, bet_value)
+        if slot is None:
+            raise ValueError(f"Invalid bet: {bet_type} on {bet_value!r}")
+        if progression not in PROGRESSIONS:
+            raise ValueError(f"Unknown progression: {progression}")
+        if base_stake <= 0:
+            raise ValueError("Stake must be greater than 0")
+
+        kind, target = slot
+        self._odds_table = WheelLayout.translation_table(PAYOUT_MATRIX[kind][target])
+        self._base_stake = base_stake
+        self._martingale = progression == MARTINGALE
+        self._wheel = Wheel(seed, rng)
+
+        self.balances = array("q", [initial_balance]) * sessions
+        self.stakes = array("q", [base_stake]) * sessions
+        # Rounds are recorded when a session ends; active sessions are filled
+        # in from the step counter when rounds_played is read
+        self._rounds_played = array("I", [0]) * sessions
+        self._steps = 0
+        # Totals over all sessions, for aggregate statistics
+        self.total_bet = 0
+        self.total_payout = 0
+        # Sessions still playing; the rest are masked out
+        self._active = array("I", range(sessions)) if base_stake <= initial_balance else array("I")
+
+    @property
+    def active_sessions(self) -> int:
+        return len(self._active)
+
+    @property
+    def rounds_played(self) -> array:
+        """Number of rounds each session has played."""
+        steps = self._steps
+        for session in self._active:
+            self._rounds_played[session] = steps
+        return self._rounds_played
+
+    def step(self) -> int:
+        """Play one round in every active session.
+
+        Returns:
+            Number of sessions still active afterwards.
+        """
+        active = self._active
+        if not active:
+            return 0
+
+        odds = self._wheel.spin_many(len(active)).tobytes().translate(self._odds_table)
+        balances = self.balances
+        stakes = self.stakes
+        rounds_played = self._rounds_played
+        self._steps += 1
+        steps = self._steps
+        still_active = array("I")
+        keep = still_active.append
+
+        if self._martingale:
+            base_stake = self._base_stake
+            total_bet = 0
+            total_payout = 0
+            for session, multiplier in zip(active, odds):
+                stake = stakes[session]
+                total_bet += stake
+                balance = balances[session] - stake
+                if multiplier:
+                    total_payout += stake * multiplier
+                    balance += stake * multiplier
+                    stake = base_stake
+                else:
+                    stake *= 2
+                balances[session] = balance
+                stakes[session] = stake
+                # The next stake is rejected if the balance cannot cover it
+                if stake <= balance:
+                    keep(session)
+                else:
+                    rounds_played[session] = steps
+            self.total_bet += total_bet
+            self.total_payout += total_payout
+        else:
+            stake = self._base_stake
+            self.total_bet += stake * len(active)
+            self.total_payout += stake * sum(odds)
+            # Net change of a flat stake for each possible odds value
+            net_by_odds = [stake * multiplier - stake for multiplier in range(256)]
+            for session, multiplier in zip(active, odds):
+                balance = balances[session] + net_by_odds[multiplier]
+                balances[session] = balance
+                if stake <= balance:
+                    keep(session)
+                else:
+                    rounds_played[session] = steps
+
+        self._active = still_active
+        return len(still_active)
+
+    def run(self, rounds: int) -> "LockstepSimulator":
+        """Play up to a number of rounds, stopping early once every session has ended."""
+        for _ in range(rounds):
+            if not self.step():
+                break
+        return self
+
+    def busted(self) -> int:
+        """Number of sessions whose balance can no longer cover their stake."""
+        return sum(1 for balance, stake in zip(self.balances, self.stakes) if stake > balance)
+
+    def quantile(self, q: float) -> int:
+        """Get a quantile (0-1) of the sessions' current balances."""
+        if not self.balances:
+            raise ValueError("No sessions to take a quantile of")
+        ordered = sorted(self.balances)
+        index = min(len(ordered) - 1, max(0, int(q * len(ordered))))
+        return ordered[index]
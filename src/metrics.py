@@ -0,0 +1,304 @@
+"""
+Metrics registry with Prometheus text exposition.
+
+Counters and histograms are sharded per thread: every thread increments its
+own shard without taking a lock, and a scrape sums the shards. Tables
+update their metrics once per settled round from the ledger entries
+(batched), and players add each balance change to a sharded counter, so
+neither path adds a lock to bet intake.
+
+The registry renders the Prometheus text format. It can write it to a file
+(e.g. for node_exporter's textfile collector) or serve it on a local HTTP
+endpoint.
+
+Usage:
+    registry = MetricsRegistry()
+    table = Table(metrics=TableMetrics(registry))
+    player = Player(1000, metrics=PlayerMetrics(registry))
+    registry.serve(port=9464)      # http://127.0.0.1:9464/metrics
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .ledger import LedgerEntry
+
+
+# Upper bounds of the default histogram buckets
+LATENCY_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1)
+BETS_PER_ROUND_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 1000, 10000)
+
+# (sample name suffix, labels, value)
+Sample = Tuple[str, str, float]
+
+
+class _Sharded(ABC):
+    """Base for metrics keeping one shard per thread."""
+
+    kind = ""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._local = threading.local()
+        self._shards: List[list] = []
+        # Only taken when a thread makes its first update and when scraping
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> list:
+        shard = self._empty_shard()
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    @abstractmethod
+    def _empty_shard(self) -> list:
+        """A new shard with nothing recorded."""
+
+    def _snapshot(self) -> List[list]:
+        with self._lock:
+            return [list(shard) for shard in self._shards]
+
+    @abstractmethod
+    def samples(self) -> Iterable[Sample]:
+        """(suffix, labels, value) samples summed over every shard."""
+
+
+class ShardedCounter(_Sharded):
+    """Monotonic counter whose increments take no lock."""
+
+    kind = "counter"
+
+    def _empty_shard(self) -> list:
+        return [0]
+
+    def inc(self, amount: float = 1) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(shard[0] for shard in self._snapshot())
+
+    def samples(self) -> Iterable[Sample]:
+        return [("", "", self.value)]
+
+
+class ShardedHistogram(_Sharded):
+    """Cumulative-bucket histogram whose observations take no lock."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float]):
+        """Create a histogram.
+
+        Args:
+            name: Metric name
+            description: Help text
+            buckets: Increasing bucket upper bounds; +Inf is implied
+        """
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Histogram buckets must be strictly increasing")
+        self.buckets = tuple(buckets)
+        super().__init__(name, description)
+
+    def _empty_shard(self) -> list:
+        # Per-bucket counts (last one is +Inf), then the sum
+        return [0] * (len(self.buckets) + 1) + [0]
+
+    def observe(self, value: float) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def totals(self) -> Tuple[List[int], float]:
+        """Per-bucket counts (not cumulative, +Inf last) and the sum of all observations."""
+        counts = [0] * (len(self.buckets) + 2)
+        for shard in self._snapshot():
+            for index, value in enumerate(shard):
+                counts[index] += value
+        return counts[:-1], counts[-1]
+
+    def samples(self) -> Iterable[Sample]:
+        counts, total = self.totals()
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else f"{bound:g}"
+            samples.append(("_bucket", f'{{le="{le}"}}', cumulative))
+        samples.append(("_sum", "", total))
+        samples.append(("_count", "", cumulative))
+        return samples
+
+
+class Gauge:
+    """Value computed from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, description: str, function: Callable[[], float]):
+        self.name = name
+        self.description = description
+        self.function = function
+
+    def samples(self) -> Iterable[Sample]:
+        return [("", "", self.function())]
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in Prometheus text format."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self._metrics: Dict[str, object] = {}
+        self._servers: List[ThreadingHTTPServer] = []
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str) -> ShardedCounter:
+        return self._register(ShardedCounter(name, description))
+
+    def histogram(self, name: str, description: str, buckets: Sequence[float]) -> ShardedHistogram:
+        return self._register(ShardedHistogram(name, description, buckets))
+
+    def gauge(self, name: str, description: str, function: Callable[[], float]) -> Gauge:
+        return self._register(Gauge(name, description, function))
+
+    def uptime(self) -> float:
+        """Seconds since the registry was created."""
+        return time.monotonic() - self.started
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write the metrics to a text file, replacing it atomically."""
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as handle:
+            handle.write(self.render())
+        os.replace(temporary, path)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """Serve the metrics over HTTP at /metrics on a background thread.
+
+        Returns:
+            The bound (host, port) address.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        self._servers.append(server)
+        return server.server_address[:2]
+
+    def close(self) -> None:
+        """Stop any HTTP endpoints."""
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers.clear()
+
+
+class TableMetrics:
+    """Round throughput, settlement latency and house P&L shared by a registry's tables."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.rounds = registry.counter("roulette_rounds_total", "Rounds settled.")
+        self.bets = registry.counter("roulette_bets_total", "Bets settled.")
+        self.staked = registry.counter("roulette_staked_total", "Amount staked in settled rounds.")
+        self.paid = registry.counter(
+            "roulette_paid_total", "Amount paid out in settled rounds, returned stakes included."
+        )
+        self.bets_per_round = registry.histogram(
+            "roulette_bets_per_round", "Bets in each settled round.", BETS_PER_ROUND_BUCKETS
+        )
+        self.settlement_seconds = registry.histogram(
+            "roulette_settlement_seconds", "Time to settle a round.", LATENCY_BUCKETS
+        )
+        registry.gauge(
+            "roulette_house_edge", "Realized house edge so far: (staked - paid) / staked.", self.house_edge
+        )
+        registry.gauge(
+            "roulette_rounds_per_second", "Rounds settled per second since start.", self.rounds_per_second
+        )
+
+    def round_settled(self, bets: int, entries: List[LedgerEntry], seconds: float) -> None:
+        """Record one settled round."""
+        staked = 0
+        paid = 0
+        for _, player_staked, winnings in entries:
+            staked += player_staked
+            paid += winnings
+        self.rounds.inc()
+        self.bets.inc(bets)
+        self.staked.inc(staked)
+        self.paid.inc(paid)
+        self.bets_per_round.observe(bets)
+        self.settlement_seconds.observe(seconds)
+
+    def house_edge(self) -> float:
+        staked = self.staked.value
+        return (staked - self.paid.value) / staked if staked else 0.0
+
+    def rounds_per_second(self) -> float:
+        uptime = self.registry.uptime()
+        return self.rounds.value / uptime if uptime > 0 else 0.0
+
+
+class PlayerMetrics:
+    """Money moved through player balances."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.credited = registry.counter(
+            "roulette_player_credited_total", "Amount added to player balances (deposits and payouts)."
+        )
+        self.debited = registry.counter(
+            "roulette_player_debited_total", "Amount taken from player balances (stakes)."
+        )
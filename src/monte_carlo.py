@@ -0,0 +1,452 @@
+"""
+Multi-core Monte Carlo runner for betting strategies.
+
+Sessions are independent headless games. Every session draws its spins from
+its own RNG stream, the child of the master stream at the session index (see
+src.rng), so the aggregated statistics do not depend on how sessions are
+sharded across workers. Workers only send back compact SessionStats.
+
+Workers are processes, or threads on free-threaded (no-GIL) builds of
+Python, where threads run in parallel without the pickling and start-up
+cost of a process pool. Each worker owns its Table, Wheel and RNG streams;
+all of them share the read-only WHEEL_LAYOUT and PAYOUT_MATRIX.
+
+simulate_lockstep runs the single-bet strategies through LockstepSimulator
+instead (see src.lockstep): each shard of up to LOCKSTEP_SHARD_SIZE sessions
+advances together, one spin vector per round, drawing from the shard's own
+child stream, so results again do not depend on the worker count.
+
+With a spin tape (see src.spin_tape) every session instead reads its own
+slice of pre-drawn spins, session i starting at spin i * rounds, through a
+memory map shared by all workers.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from .bet import BetType
+from .game_controller import GameController
+from .lockstep import FLAT, MARTINGALE, LockstepSimulator
+from .rng import RNG_BACKENDS, RNGBackend, make_rng
+from .simulation import BettingPolicy, FlatBetPolicy, MartingalePolicy
+from .spin_tape import SpinTape
+from .wheel import Color, Wheel
+
+
+PolicyFactory = Callable[[], BettingPolicy]
+
+# Sessions advanced together by one lockstep worker task
+LOCKSTEP_SHARD_SIZE = 1 << 16
+
+WORKER_BACKENDS = ("auto", "process", "thread")
+
+
+def gil_enabled() -> bool:
+    """Whether the running interpreter has the GIL (always true before 3.13t)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """Pick the worker backend: threads on free-threaded builds, processes otherwise."""
+    if backend not in WORKER_BACKENDS:
+        raise ValueError(f"Unknown worker backend: {backend}")
+    if backend == "auto":
+        return "process" if gil_enabled() else "thread"
+    return backend
+
+
+def session_rng(rng_kind: str, master_seed: int, session_index: int) -> RNGBackend:
+    """Get the independent RNG stream of one session.
+
+    Args:
+        rng_kind: Name of the RNG backend (see src.rng.RNG_BACKENDS)
+        master_seed: The seed of the whole simulation
+        session_index: Index of the session (0-based)
+
+    Returns:
+        The session's child stream of the master stream.
+    """
+    return make_rng(rng_kind, master_seed).child(session_index)
+
+
+class SessionStats:
+    """Aggregate statistics over a group of simulated sessions."""
+
+    def __init__(self):
+        self.sessions = 0
+        self.rounds = 0
+        self.busted = 0
+        self.total_bet = 0
+        self.total_payout = 0
+        self.final_balance_sum = 0
+        self.final_balance_sq_sum = 0
+        self.min_final_balance: Optional[int] = None
+        self.max_final_balance: Optional[int] = None
+
+    def add_session(self, rounds: int, total_bet: int, total_payout: int, final_balance: int) -> None:
+        """Record the outcome of one session."""
+        self.sessions += 1
+        self.rounds += rounds
+        self.total_bet += total_bet
+        self.total_payout += total_payout
+        if final_balance < 1:
+            self.busted += 1
+        self.final_balance_sum += final_balance
+        self.final_balance_sq_sum += final_balance * final_balance
+        if self.min_final_balance is None or final_balance < self.min_final_balance:
+            self.min_final_balance = final_balance
+        if self.max_final_balance is None or final_balance > self.max_final_balance:
+            self.max_final_balance = final_balance
+
+    def merge(self, other: "SessionStats") -> None:
+        """Fold another group's statistics into this one."""
+        self.sessions += other.sessions
+        self.rounds += other.rounds
+        self.busted += other.busted
+        self.total_bet += other.total_bet
+        self.total_payout += other.total_payout
+        self.final_balance_sum += other.final_balance_sum
+        self.final_balance_sq_sum += other.final_balance_sq_sum
+        for value in (other.min_final_balance, other.max_final_balance):
+            if value is None:
+                continue
+            if self.min_final_balance is None or value < self.min_final_balance:
+                self.min_final_balance = value
+            if self.max_final_balance is None or value > self.max_final_balance:
+                self.max_final_balance = value
+
+    def mean_final_balance(self) -> float:
+        return self.final_balance_sum / self.sessions if self.sessions else 0.0
+
+    def variance_final_balance(self) -> float:
+        if not self.sessions:
+            return 0.0
+        n = self.sessions
+        return (n * self.final_balance_sq_sum - self.final_balance_sum ** 2) / (n * n)
+
+    def to_dict(self) -> dict:
+        return {
+            "sessions": self.sessions,
+            "rounds": self.rounds,
+            "busted": self.busted,
+            "bust_rate": self.busted / self.sessions if self.sessions else 0.0,
+            "total_bet": self.total_bet,
+            "total_payout": self.total_payout,
+            "house_edge": (
+                (self.total_bet - self.total_payout) / self.total_bet if self.total_bet else 0.0
+            ),
+            "mean_final_balance": self.mean_final_balance(),
+            "variance_final_balance": self.variance_final_balance(),
+            "min_final_balance": self.min_final_balance,
+            "max_final_balance": self.max_final_balance,
+        }
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SessionStats) and vars(self) == vars(other)
+
+
+def run_sessions(
+    policy_factory: PolicyFactory,
+    start: int,
+    stop: int,
+    master_seed: int,
+    rounds: int,
+    initial_balance: int,
+    rng_kind: str = "mt19937",
+    tape: Optional[str] = None,
+) -> SessionStats:
+    """Play sessions start..stop-1 and aggregate their outcomes.
+
+    Args:
+        policy_factory: Picklable callable building a fresh policy per session
+        start: Index of the first session
+        stop: Index one past the last session
+        master_seed: Seed the session streams are derived from
+        rounds: Maximum rounds per session
+        initial_balance: Starting balance of every session
+        rng_kind: Name of the RNG backend the session streams use
+        tape: Spin tape to read the sessions' spins from instead of RNG streams
+
+    Returns:
+        SessionStats for the sessions played.
+    """
+    stats = SessionStats()
+    # One table per call: every worker thread or process owns its own
+    controller = GameController()
+    with SpinTape(tape) if tape is not None else nullcontext() as spin_tape:
+        for session_index in range(start, stop):
+            if spin_tape is not None:
+                source = spin_tape.cursor(session_index * rounds)
+            else:
+                source = nullcontext(session_rng(rng_kind, master_seed, session_index))
+            with source as rng:
+                controller.table.wheel = Wheel(rng=rng)
+                played = 0
+                total_bet = 0
+                total_payout = 0
+                for result in controller.run_headless(policy_factory(), rounds, initial_balance):
+                    played += 1
+                    total_bet += result.total_bet
+                    total_payout += result.total_payout
+            stats.add_session(played, total_bet, total_payout, controller.player.get_balance())
+    return stats
+
+
+def _shards(sessions: int, workers: int) -> List[range]:
+    # A few shards per worker keeps cores busy when sessions differ in length
+    shard_count = max(1, min(sessions, workers * 4))
+    size, extra = divmod(sessions, shard_count)
+    shards = []
+    start = 0
+    for index in range(shard_count):
+        stop = start + size + (1 if index < extra else 0)
+        shards.append(range(start, stop))
+        start = stop
+    return shards
+
+
+def simulate(
+    policy_factory: PolicyFactory,
+    sessions: int,
+    rounds: int,
+    initial_balance: int,
+    master_seed: int = 0,
+    workers: Optional[int] = None,
+    rng_kind: str = "mt19937",
+    backend: str = "auto",
+    tape: Optional[str] = None,
+) -> SessionStats:
+    """Run independent sessions of a strategy across a pool of workers.
+
+    Args:
+        policy_factory: Picklable callable building a fresh policy per session
+        sessions: Number of sessions to play
+        rounds: Maximum rounds per session
+        initial_balance: Starting balance of every session
+        master_seed: Seed all session streams are derived from
+        workers: Number of workers (defaults to all cores)
+        rng_kind: Name of the RNG backend the session streams use
+        backend: "process", "thread" or "auto" (threads on free-threaded
+            builds, processes otherwise)
+        tape: Spin tape to read the sessions' spins from instead of RNG
+            streams; needs at least sessions * rounds spins
+
+    Returns:
+        Aggregated SessionStats, identical for any worker count and backend.
+
+    Raises:
+        ValueError: If the tape is too short for the simulation.
+    """
+    backend = resolve_backend(backend)
+    if tape is not None:
+        with SpinTape(tape) as spin_tape:
+            if len(spin_tape) < sessions * rounds:
+                raise ValueError(f"{tape} has fewer than {sessions * rounds} spins")
+    workers = workers or os.cpu_count() or 1
+    stats = SessionStats()
+    if workers == 1 or sessions <= 1:
+        stats.merge(run_sessions(
+            policy_factory, 0, sessions, master_seed, rounds, initial_balance, rng_kind, tape
+        ))
+        return stats
+
+    shards = _shards(sessions, workers)
+    pool = ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+    with pool(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                run_sessions, policy_factory, shard.start, shard.stop,
+                master_seed, rounds, initial_balance, rng_kind, tape,
+            )
+            for shard in shards
+        ]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+def lockstep_bet(strategy: str, number: int = 17) -> Tuple[BetType, Union[Color, int], str]:
+    """Map a CLI strategy name to a lockstep bet and progression."""
+    if strategy in ("red", "black", "green"):
+        return BetType.COLOR, Color(strategy), FLAT
+    if strategy == "number":
+        return BetType.NUMBER, number, FLAT
+    if strategy == "martingale":
+        return BetType.COLOR, Color.RED, MARTINGALE
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+def run_lockstep_shard(
+    strategy: str,
+    stake: int,
+    number: int,
+    shard_index: int,
+    sessions: int,
+    master_seed: int,
+    rounds: int,
+    initial_balance: int,
+    rng_kind: str = "mt19937",
+) -> SessionStats:
+    """Play one shard of sessions in lockstep and aggregate their outcomes.
+
+    Args:
+        strategy: Strategy name (see STRATEGIES)
+        stake: Base stake per round
+        number: Number for the "number" strategy
+        shard_index: Index of the shard; selects its child RNG stream
+        sessions: Number of sessions in the shard
+        master_seed: Seed the shard streams are derived from
+        rounds: Maximum rounds per session
+        initial_balance: Starting balance of every session
+        rng_kind: Name of the RNG backend the shard streams use
+
+    Returns:
+        SessionStats for the shard's sessions.
+    """
+    bet_type, bet_value, progression = lockstep_bet(strategy, number)
+    simulator = LockstepSimulator(
+        sessions, initial_balance, bet_type, bet_value, stake, progression,
+        rng=make_rng(rng_kind, master_seed).child(shard_index),
+    ).run(rounds)
+    stats = SessionStats()
+    for played, balance in zip(simulator.rounds_played, simulator.balances):
+        stats.add_session(played, 0, 0, balance)
+    stats.total_bet = simulator.total_bet
+    stats.total_payout = simulator.total_payout
+    return stats
+
+
+def simulate_lockstep(
+    strategy: str,
+    stake: int,
+    sessions: int,
+    rounds: int,
+    initial_balance: int,
+    master_seed: int = 0,
+    workers: Optional[int] = None,
+    rng_kind: str = "mt19937",
+    backend: str = "auto",
+    number: int = 17,
+    shard_size: int = LOCKSTEP_SHARD_SIZE,
+) -> SessionStats:
+    """Run sessions of a single-bet strategy in lockstep shards across a pool of workers.
+
+    Sessions end once their stake exceeds their balance, so a Martingale
+    session ends where MartingalePolicy would cut its stake down to the
+    balance instead.
+
+    Args:
+        strategy: Strategy name (see STRATEGIES)
+        stake: Base stake per round
+        sessions: Number of sessions to play
+        rounds: Maximum rounds per session
+        initial_balance: Starting balance of every session
+        master_seed: Seed all shard streams are derived from
+        workers: Number of workers (defaults to all cores)
+        rng_kind: Name of the RNG backend the shard streams use
+        backend: "process", "thread" or "auto"
+        number: Number for the "number" strategy
+        shard_size: Sessions per shard; shard k draws from child stream k
+
+    Returns:
+        Aggregated SessionStats, identical for any worker count and backend.
+    """
+    backend = resolve_backend(backend)
+    lockstep_bet(strategy, number)
+    workers = workers or os.cpu_count() or 1
+    shards = [
+        (index, min(shard_size, sessions - start))
+        for index, start in enumerate(range(0, sessions, shard_size))
+    ]
+    common = (master_seed, rounds, initial_balance, rng_kind)
+    stats = SessionStats()
+    if workers == 1 or len(shards) <= 1:
+        for index, size in shards:
+            stats.merge(run_lockstep_shard(strategy, stake, number, index, size, *common))
+        return stats
+
+    pool = ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+    with pool(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_lockstep_shard, strategy, stake, number, index, size, *common)
+            for index, size in shards
+        ]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+STRATEGIES = ("red", "black", "green", "number", "martingale")
+
+
+def build_policy_factory(strategy: str, stake: int, number: int = 17) -> PolicyFactory:
+    """Build a picklable policy factory from a CLI strategy name."""
+    if strategy in ("red", "black", "green"):
+        return partial(FlatBetPolicy, BetType.COLOR, Color(strategy), stake)
+    if strategy == "number":
+        return partial(FlatBetPolicy, BetType.NUMBER, number, stake)
+    if strategy == "martingale":
+        return partial(MartingalePolicy, Color.RED, stake)
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the simulate subcommand's options to a parser."""
+    parser.add_argument("--strategy", choices=STRATEGIES, default="red")
+    parser.add_argument("--stake", type=int, default=10, help="bet amount per round")
+    parser.add_argument("--number", type=int, default=17, help="number for the 'number' strategy")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=100, help="maximum rounds per session")
+    parser.add_argument("--balance", type=int, default=1000, help="starting balance")
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--rng", choices=sorted(RNG_BACKENDS), default="mt19937", help="RNG backend")
+    parser.add_argument("--workers", type=int, default=None, help="workers (default: all cores)")
+    parser.add_argument(
+        "--backend",
+        choices=WORKER_BACKENDS,
+        default="auto",
+        help="worker type (default: threads on free-threaded builds, else processes)",
+    )
+    parser.add_argument("--tape", metavar="PATH", help="read spins from a spin tape instead of --rng")
+    parser.add_argument(
+        "--lockstep",
+        action="store_true",
+        help="advance shards of sessions together with the lockstep simulator "
+        "(sessions end once the stake exceeds the balance)",
+    )
+
+
+def run_from_args(args: argparse.Namespace) -> SessionStats:
+    """Run the simulate subcommand and print a summary."""
+    if args.lockstep:
+        if args.tape:
+            raise ValueError("--tape cannot be combined with --lockstep")
+        stats = simulate_lockstep(
+            args.strategy, args.stake, args.sessions, args.rounds, args.balance, args.seed,
+            args.workers, args.rng, args.backend, args.number,
+        )
+    else:
+        policy_factory = build_policy_factory(args.strategy, args.stake, args.number)
+        stats = simulate(
+            policy_factory, args.sessions, args.rounds, args.balance, args.seed, args.workers,
+            args.rng, args.backend, args.tape,
+        )
+    for key, value in stats.to_dict().items():
+        print(f"{key}: {value}")
+    return stats
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of a roulette strategy")
+    add_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Double-buffered round pipeline.
+
+RoundPipeline settles each round on a worker thread while the table keeps
+taking bets for the next round. no_more_bets is the cut-off: bets placed
+before it belong to the closing round, bets placed after it to the next one.
+A single worker settles rounds strictly in the order they were closed, so
+spins are drawn in the same order as with inline settlement.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, NamedTuple, Optional
+
+from .ledger import LedgerEntry
+from .table import RoundBets, Table
+from .wheel import Color
+
+
+class SettledRound(NamedTuple):
+    """Outcome of one round settled by the pipeline."""
+
+    round_number: int
+    winning_position: int
+    winning_color: Color
+    entries: List[LedgerEntry]
+
+
+class RoundPipeline:
+    """Settle a table's rounds on a worker thread while the next round takes bets."""
+
+    def __init__(self, table: Table):
+        self.table = table
+        self.rounds_closed = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settlement")
+
+    def no_more_bets(self, round_number: Optional[int] = None) -> "Future[SettledRound]":
+        """Close betting on the current round and settle it in the background.
+
+        Args:
+            round_number: Round to produce the outcome of; needs a seekable
+                spin source such as CounterSpinSource
+
+        Returns:
+            A future resolving to the settled round.
+        """
+        closed = self.table.close_betting()
+        number = self.rounds_closed
+        self.rounds_closed += 1
+        return self._executor.submit(self._settle, closed, number, round_number)
+
+    def _settle(self, closed: RoundBets, number: int, round_number: Optional[int]) -> SettledRound:
+        entries = self.table.settle_round(closed, round_number)
+        winning_position, winning_color = self.table.wheel.get_ball_position()
+        return SettledRound(number, winning_position, winning_color, entries)
+
+    def close(self) -> None:
+        """Wait for every closed round to settle and stop the worker."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "RoundPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,15 +1,33 @@
+import threading
+
+
 class Player:
 
-    def __init__(self, balance):
+    # __weakref__ lets per-player bookkeeping (e.g. round log ids) drop
+    # players that are gone
+    __slots__ = ("_balance", "_lock", "metrics", "__weakref__")
+
+    def __init__(self, balance, metrics=None):
         self._balance = balance
+        # Balance checks and updates happen under the lock, so concurrent bets
+        # can never take the balance below zero
+        self._lock = threading.Lock()
+        # Optional src.metrics.PlayerMetrics; its counters take no lock
+        self.metrics = metrics
 
     def subtract_from_balance(self, amount):
-        if amount > self._balance:
-            raise ValueError("Insufficient balance")
-        self._balance = self._balance - amount
+        with self._lock:
+            if amount > self._balance:
+                raise ValueError("Insufficient balance")
+            self._balance = self._balance - amount
+        if self.metrics is not None:
+            self.metrics.debited.inc(amount)
 
     def add_to_balance(self, amount):
-        self._balance = self._balance + amount
+        with self._lock:
+            self._balance = self._balance + amount
+        if self.metrics is not None:
+            self.metrics.credited.inc(amount)
 
     def get_balance(self):
         return self._balance
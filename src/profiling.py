@@ -0,0 +1,272 @@
+"""
+Low-overhead profiling of the phases of a round.
+
+Profiler aggregates named timers into power-of-two latency histograms and
+keeps named counters. Enabling it wraps the phase methods listed in PHASES
+in timing wrappers; disabling it puts the original methods back, so a
+disabled profiler costs nothing on the round's code path. Only one
+profiler can time a phase at a time. Ad-hoc timer()
+and count() calls cost one attribute check when disabled.
+
+Results can be dumped as a JSON summary or as a Chrome trace (open it in
+chrome://tracing or https://ui.perfetto.dev) with one event per timed call.
+
+Usage:
+    PROFILER.enable()
+    ...play rounds...
+    PROFILER.disable()
+    PROFILER.dump("profile.json")
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .game_controller import GameController
+from .table import Table
+from .wheel import Wheel
+
+
+# Phase name -> (class, method) timed while a profiler is enabled
+PHASES = {
+    "bet_intake": (GameController, "handle_multiple_bets"),
+    "place_bet": (GameController, "_place_bet"),
+    "spin": (Wheel, "spin"),
+    "settle": (Table, "_settle"),
+    "render": (GameController, "_display_detailed_bet_results"),
+}
+
+PROFILE_FORMATS = ("json", "chrome")
+
+
+class Histogram:
+    """Latency histogram with power-of-two nanosecond buckets."""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        # buckets[i] counts durations of i bits, i.e. below 2 ** i ns
+        self.buckets = [0] * 64
+
+    def add(self, duration_ns: int) -> None:
+        if not self.count or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        self.buckets[min(duration_ns.bit_length(), 63)] += 1
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound in nanoseconds of the bucket holding a percentile."""
+        rank = max(1, -(-self.count * fraction // 1))
+        seen = 0
+        for bits, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(1 << bits, self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "mean_us": round(self.total_ns / self.count / 1e3, 3),
+            "min_us": round(self.min_ns / 1e3, 3),
+            "p50_us": round(self.percentile(0.50) / 1e3, 3),
+            "p99_us": round(self.percentile(0.99) / 1e3, 3),
+            "max_us": round(self.max_ns / 1e3, 3),
+            "histogram_us": {
+                f"<{(1 << bits) / 1e3:g}": count for bits, count in enumerate(self.buckets) if count
+            },
+        }
+
+
+class _NullTimer:
+    """Timer handed out while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.record(self._name, self._start, time.perf_counter_ns())
+
+
+class Profiler:
+    """Named timers and counters with histogram and trace output."""
+
+    def __init__(self, max_trace_events: int = 1_000_000):
+        """Create a disabled profiler.
+
+        Args:
+            max_trace_events: Timed calls kept for the Chrome trace; later
+                calls still count in the histograms
+        """
+        self.enabled = False
+        self.max_trace_events = max_trace_events
+        self.timers: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.dropped_trace_events = 0
+        self._events: List[Tuple[str, int, int, int]] = []
+        self._originals: Dict[str, Tuple[type, str, object]] = {}
+        self._lock = threading.Lock()
+
+    def enable(self, phases: Optional[Dict[str, Tuple[type, str]]] = None) -> "Profiler":
+        """Start timing the given phases (defaults to PHASES) and accepting records.
+
+        Raises:
+            RuntimeError: If another profiler is timing one of the phases; no
+                phase is wrapped then.
+        """
+        phases = PHASES if phases is None else phases
+        for owner, attribute in phases.values():
+            timed_by = getattr(owner.__dict__[attribute], "_profiler", None)
+            if timed_by is not None and timed_by is not self:
+                raise RuntimeError(f"{owner.__name__}.{attribute} is already timed by another profiler")
+        for name, (owner, attribute) in phases.items():
+            if name in self._originals:
+                continue
+            original = owner.__dict__[attribute]
+            self._originals[name] = (owner, attribute, original)
+            setattr(owner, attribute, self._timed(name, original))
+        self.enabled = True
+        return self
+
+    def disable(self) -> None:
+        """Stop profiling and restore the original phase methods; results are kept.
+
+        A phase whose method was replaced since enable (by anything but this
+        profiler) is left as it is.
+        """
+        self.enabled = False
+        for owner, attribute, original in self._originals.values():
+            if getattr(owner.__dict__.get(attribute), "_profiler", None) is self:
+                setattr(owner, attribute, original)
+        self._originals.clear()
+
+    def reset(self) -> None:
+        """Clear all results."""
+        with self._lock:
+            self.timers.clear()
+            self.counters.clear()
+            self._events.clear()
+            self.dropped_trace_events = 0
+
+    def _timed(self, name: str, function):
+        clock = time.perf_counter_ns
+        record = self.record
+        count = self.count
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            except BaseException:
+                count(f"{name}.errors")
+                raise
+            finally:
+                record(name, start, clock())
+
+        timed.__name__ = function.__name__
+        timed.__qualname__ = function.__qualname__
+        timed.__doc__ = function.__doc__
+        timed.__wrapped__ = function
+        timed._profiler = self
+        return timed
+
+    def timer(self, name: str):
+        """Context manager timing a block under a name."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def record(self, name: str, start_ns: int, end_ns: int) -> None:
+        """Record one timed call from perf_counter_ns readings."""
+        if not self.enabled:
+            return
+        duration = end_ns - start_ns
+        with self._lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = self.timers[name] = Histogram()
+            histogram.add(duration)
+            if len(self._events) < self.max_trace_events:
+                self._events.append((name, start_ns, duration, threading.get_ident()))
+            else:
+                self.dropped_trace_events += 1
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a named counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self) -> dict:
+        """Histograms and counters as a JSON-serializable dict."""
+        with self._lock:
+            return {
+                "timers": {name: histogram.to_dict() for name, histogram in sorted(self.timers.items())},
+                "counters": dict(sorted(self.counters.items())),
+                "dropped_trace_events": self.dropped_trace_events,
+            }
+
+    def chrome_trace(self) -> dict:
+        """Timed calls in Chrome trace event format."""
+        pid = os.getpid()
+        with self._lock:
+            events = [
+                {
+                    "name": name, "cat": "round", "ph": "X", "pid": pid, "tid": tid,
+                    "ts": start / 1e3, "dur": duration / 1e3,
+                }
+                for name, start, duration, tid in self._events
+            ]
+            if self.counters:
+                end = max((start + duration for _, start, duration, _ in self._events), default=0)
+                events.append({
+                    "name": "counters", "ph": "C", "pid": pid, "tid": 0,
+                    "ts": end / 1e3, "args": dict(self.counters),
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+
+    def dump(self, path: str, profile_format: str = "json") -> None:
+        """Write the summary ("json") or the Chrome trace ("chrome") to a file."""
+        if profile_format not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format: {profile_format}")
+        data = self.summary() if profile_format == "json" else self.chrome_trace()
+        with open(path, "w") as handle:
+            json.dump(data, handle, indent=2 if profile_format == "json" else None)
+            handle.write("\n")
+
+
+# Profiler the command line --profile option enables
+PROFILER = Profiler()
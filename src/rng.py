@@ -0,0 +1,331 @@
+"""
+Pluggable, seedable random number backends for the wheel.
+
+Every backend is identified by a root seed and a spawn key (the path of child
+indexes that led to it). child(i) derives an independent stream directly
+from that key, so workers and tables can be given their own streams without
+any coordination, and the same (seed, key) always reproduces the same draws.
+
+Backends:
+- MersenneTwisterRNG: the standard library generator (default for Wheel)
+- PCG64RNG: a 128-bit PCG64 (XSL-RR) generator with O(log n) advance
+- CounterRNG: a counter-based generator (keyed BLAKE2b over a block counter)
+  that can jump to any block instantly
+
+Besides RNG backends, a Wheel accepts any SpinSource, such as
+CounterSpinSource, whose outcome for any (seed, session, round) can be
+computed directly for replay and audits.
+"""
+
+import hashlib
+import secrets
+from abc import ABC, abstractmethod
+from array import array
+from random import Random
+from typing import List, Optional, Tuple
+
+
+# Byte translation tables for batched spins. Random bytes below 222 (6 * 37)
+# map uniformly onto 0-36; the remaining bytes are rejected so batched draws
+# have exactly the same distribution as single draws.
+_BYTE_TO_POSITION = bytes(value % 37 if value < 222 else 0 for value in range(256))
+_REJECTED_BYTES = bytes(range(222, 256))
+
+_MASK64 = (1 << 64) - 1
+_MASK128 = (1 << 128) - 1
+
+
+def _derive(seed: int, spawn_key: Tuple[int, ...], size: int) -> bytes:
+    """Hash a seed and spawn key into size bytes of key material."""
+    material = ":".join(str(part) for part in (seed, *spawn_key)).encode()
+    return hashlib.blake2b(material, digest_size=size, person=b"roulette-rng").digest()
+
+
+class SpinSource(ABC):
+    """Base class for anything a Wheel can draw its outcomes from.
+
+    The wheel uses spin_position for single spins and spin_positions for
+    batched spins.
+    """
+
+    @abstractmethod
+    def spin_position(self) -> int:
+        """Draw one wheel position (0-36)."""
+
+    def spin_positions(self, n: int) -> array:
+        """Draw n wheel positions as array('B')."""
+        if n < 0:
+            raise ValueError("Number of spins cannot be negative")
+        spin_position = self.spin_position
+        return array("B", [spin_position() for _ in range(n)])
+
+    def seek(self, round_number: int) -> None:
+        """Make the next spin the outcome of a given round, if supported."""
+        raise NotImplementedError(f"{type(self).__name__} cannot seek to a round")
+
+
+class RNGBackend(SpinSource):
+    """Base class for wheel RNG backends.
+
+    Subclasses implement randbelow, randbytes and _make_child.
+    """
+
+    def __init__(self, seed: Optional[int] = None, spawn_key: Tuple[int, ...] = ()):
+        self.seed = secrets.randbits(128) if seed is None else seed
+        self.spawn_key = tuple(spawn_key)
+        self._next_child = 0
+
+    @abstractmethod
+    def randbelow(self, n: int) -> int:
+        """Return a uniform integer in [0, n)."""
+
+    @abstractmethod
+    def randbytes(self, n: int) -> bytes:
+        """Return n uniform random bytes."""
+
+    @abstractmethod
+    def _make_child(self, spawn_key: Tuple[int, ...]) -> "RNGBackend":
+        """Create the backend of the stream with a given spawn key."""
+
+    def child(self, index: int) -> "RNGBackend":
+        """Get the independent child stream with a given index."""
+        return self._make_child(self.spawn_key + (index,))
+
+    def spawn(self, n: int) -> List["RNGBackend"]:
+        """Create n new independent child streams."""
+        start = self._next_child
+        self._next_child += n
+        return [self.child(index) for index in range(start, start + n)]
+
+    def spin_position(self) -> int:
+        """Draw one wheel position (0-36)."""
+        return self.randbelow(37)
+
+    def spin_positions(self, n: int) -> array:
+        """Draw n wheel positions as array('B') in one batched draw."""
+        if n < 0:
+            raise ValueError("Number of spins cannot be negative")
+        positions = b""
+        while len(positions) < n:
+            # Over-draw slightly so that rejected bytes rarely need a second pass
+            missing = n - len(positions)
+            raw = self.randbytes(missing + (missing >> 3) + 16)
+            positions += raw.translate(_BYTE_TO_POSITION, _REJECTED_BYTES)
+        return array("B", positions[:n])
+
+
+class MersenneTwisterRNG(RNGBackend):
+    """The standard library Mersenne Twister.
+
+    With an integer seed and no spawn key it draws exactly what
+    random.Random(seed).randint(0, 36) would.
+    """
+
+    def __init__(self, seed: Optional[int] = None, spawn_key: Tuple[int, ...] = ()):
+        super().__init__(seed, spawn_key)
+        if self.spawn_key:
+            self._random = Random(int.from_bytes(_derive(self.seed, self.spawn_key, 32), "little"))
+        else:
+            self._random = Random(self.seed)
+
+    def randbelow(self, n: int) -> int:
+        return self._random.randrange(n)
+
+    def randbytes(self, n: int) -> bytes:
+        return self._random.randbytes(n)
+
+    def _make_child(self, spawn_key: Tuple[int, ...]) -> "MersenneTwisterRNG":
+        return MersenneTwisterRNG(self.seed, spawn_key)
+
+
+class PCG64RNG(RNGBackend):
+    """PCG64: a 128-bit linear congruential generator with XSL-RR output.
+
+    Child streams get their own odd increment, so they are distinct LCG
+    sequences rather than offsets into one sequence.
+    """
+
+    MULTIPLIER = 0x2360ED051FC65DA44385DF649FCCF645
+
+    def __init__(self, seed: Optional[int] = None, spawn_key: Tuple[int, ...] = ()):
+        super().__init__(seed, spawn_key)
+        material = _derive(self.seed, self.spawn_key, 32)
+        self._increment = int.from_bytes(material[16:], "little") | 1
+        self._state = 0
+        self._step()
+        self._state = (self._state + int.from_bytes(material[:16], "little")) & _MASK128
+        self._step()
+
+    def _step(self) -> None:
+        self._state = (self._state * self.MULTIPLIER + self._increment) & _MASK128
+
+    def next_uint64(self) -> int:
+        """Advance the generator and return 64 random bits."""
+        self._step()
+        state = self._state
+        rotation = state >> 122
+        xored = ((state >> 64) ^ state) & _MASK64
+        return ((xored >> rotation) | (xored << (64 - rotation))) & _MASK64
+
+    def advance(self, delta: int) -> None:
+        """Jump ahead delta draws in O(log delta) steps."""
+        multiplier, increment = self.MULTIPLIER, self._increment
+        acc_mult, acc_plus = 1, 0
+        delta &= _MASK128
+        while delta:
+            if delta & 1:
+                acc_mult = (acc_mult * multiplier) & _MASK128
+                acc_plus = (acc_plus * multiplier + increment) & _MASK128
+            increment = ((multiplier + 1) * increment) & _MASK128
+            multiplier = (multiplier * multiplier) & _MASK128
+            delta >>= 1
+        self._state = (acc_mult * self._state + acc_plus) & _MASK128
+
+    def randbelow(self, n: int) -> int:
+        if n <= 0:
+            raise ValueError("n must be positive")
+        shift = 64 - n.bit_length()
+        while True:
+            value = self.next_uint64() >> shift
+            if value < n:
+                return value
+
+    def randbytes(self, n: int) -> bytes:
+        words = array("Q", (self.next_uint64() for _ in range((n + 7) // 8)))
+        return words.tobytes()[:n]
+
+    def _make_child(self, spawn_key: Tuple[int, ...]) -> "PCG64RNG":
+        return PCG64RNG(self.seed, spawn_key)
+
+
+class CounterRNG(RNGBackend):
+    """Counter-based generator: block i is BLAKE2b(i) keyed by the stream key.
+
+    Any block can be computed directly, so jump_to/advance are O(1), and
+    streams with different keys never share blocks.
+    """
+
+    BLOCK_SIZE = 64
+
+    def __init__(self, seed: Optional[int] = None, spawn_key: Tuple[int, ...] = ()):
+        super().__init__(seed, spawn_key)
+        self._key = _derive(self.seed, self.spawn_key, 32)
+        self._counter = 0
+        self._buffer = b""
+        self._offset = 0
+
+    def block(self, counter: int) -> bytes:
+        """Compute the 64 random bytes of a block directly from its counter."""
+        return hashlib.blake2b(
+            counter.to_bytes(16, "little"), digest_size=self.BLOCK_SIZE, key=self._key
+        ).digest()
+
+    def jump_to(self, byte_offset: int) -> None:
+        """Position the stream at an absolute byte offset."""
+        self._counter, self._offset = divmod(byte_offset, self.BLOCK_SIZE)
+        self._buffer = self.block(self._counter)
+        self._counter += 1
+
+    def advance(self, n_bytes: int) -> None:
+        """Skip ahead n_bytes in O(1)."""
+        self.jump_to(self.tell() + n_bytes)
+
+    def tell(self) -> int:
+        """Current absolute byte offset in the stream."""
+        return self._counter * self.BLOCK_SIZE - (len(self._buffer) - self._offset)
+
+    def randbytes(self, n: int) -> bytes:
+        available = len(self._buffer) - self._offset
+        if n <= available:
+            start = self._offset
+            self._offset += n
+            return self._buffer[start:self._offset]
+
+        chunks = [self._buffer[self._offset:]]
+        needed = n - available
+        blocks = (needed + self.BLOCK_SIZE - 1) // self.BLOCK_SIZE
+        block = self.block
+        counter = self._counter
+        chunks.extend(block(counter + index) for index in range(blocks))
+        self._counter = counter + blocks
+        data = b"".join(chunks)
+        self._buffer = data[-self.BLOCK_SIZE:]
+        self._offset = self.BLOCK_SIZE - (len(data) - n)
+        return data[:n]
+
+    def randbelow(self, n: int) -> int:
+        if n <= 0:
+            raise ValueError("n must be positive")
+        shift = 64 - n.bit_length()
+        while True:
+            value = int.from_bytes(self.randbytes(8), "little") >> shift
+            if value < n:
+                return value
+
+    def _make_child(self, spawn_key: Tuple[int, ...]) -> "CounterRNG":
+        return CounterRNG(self.seed, spawn_key)
+
+
+class CounterSpinSource(SpinSource):
+    """Spin outcomes computed directly from (seed, session, round).
+
+    The outcome of a round is the first acceptable byte of a keyed BLAKE2b
+    hash of the round number, so any round of any session can be replayed
+    in O(1) without drawing the rounds before it. Rounds are numbered from 0.
+    """
+
+    def __init__(self, seed: int, session: int = 0, start_round: int = 0):
+        self.seed = seed
+        self.session = session
+        self._key = _derive(seed, ("spin-session", session), 32)
+        self._round = start_round
+
+    def position_at(self, round_number: int) -> int:
+        """Compute the outcome of a round directly."""
+        if round_number < 0:
+            raise ValueError("Round number cannot be negative")
+        salt = 0
+        while True:
+            digest = hashlib.blake2b(
+                round_number.to_bytes(16, "little") + salt.to_bytes(4, "little"),
+                digest_size=64,
+                key=self._key,
+            ).digest()
+            for value in digest:
+                if value < 222:
+                    return value % 37
+            salt += 1  # All 64 bytes rejected: vanishingly rare
+
+    def spin_position(self) -> int:
+        position = self.position_at(self._round)
+        self._round += 1
+        return position
+
+    def seek(self, round_number: int) -> None:
+        if round_number < 0:
+            raise ValueError("Round number cannot be negative")
+        self._round = round_number
+
+    def tell(self) -> int:
+        """Number of the round the next spin will produce."""
+        return self._round
+
+    def for_session(self, session: int) -> "CounterSpinSource":
+        """Get the source of another session under the same seed."""
+        return CounterSpinSource(self.seed, session)
+
+
+RNG_BACKENDS = {
+    "mt19937": MersenneTwisterRNG,
+    "pcg64": PCG64RNG,
+    "counter": CounterRNG,
+}
+
+
+def make_rng(kind: str = "mt19937", seed: Optional[int] = None) -> RNGBackend:
+    """Create an RNG backend by name ('mt19937', 'pcg64' or 'counter')."""
+    try:
+        backend = RNG_BACKENDS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown RNG backend: {kind}") from None
+    return backend(seed)
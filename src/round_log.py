@@ -0,0 +1,176 @@
+"""
+Streaming, append-only binary log of settled rounds.
+
+A log records the rounds of a single table; rounds carry no table id, so
+log each table to its own file. A log file starts with an 8-byte file
+header (magic and version). Every round then appends one fixed-size round
+header followed by one fixed-size entry per player in the round:
+
+    round header (32 bytes, little-endian)
+        round id      u64
+        position      u8   (+3 bytes padding)
+        player count  u32
+        total staked  i64
+        total paid    i64
+    player entry (16 bytes, little-endian), player count times
+        player id     u64  (order of first appearance to the recorder)
+        delta         i64  (winnings - staked)
+
+RoundRecorder is a Table round listener that writes through a large
+buffered file and fsyncs periodically. Only the ids of live players are
+kept in memory; a player's id is never reused once it is dropped.
+read_rounds streams the records back in chunks.
+"""
+
+import os
+import struct
+import time
+import weakref
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple
+
+from .ledger import LedgerEntry
+from .player import Player
+from .table import Table
+from .wheel import Color
+
+
+FILE_HEADER = b"RLOG\x01\x00\x00\x00"
+ROUND_HEADER = struct.Struct("<QBxxxIqq")
+PLAYER_ENTRY = struct.Struct("<Qq")
+
+
+class RoundRecord(NamedTuple):
+    """One round read back from a log."""
+
+    round_id: int
+    position: int
+    total_staked: int
+    total_paid: int
+    deltas: Tuple[Tuple[int, int], ...]  # (player id, winnings - staked)
+
+
+class RoundRecorder:
+    """Append every settled round of one table to a binary log."""
+
+    def __init__(self, path: str, buffer_size: int = 1 << 20, fsync_interval: float = 1.0):
+        """Open a log for appending.
+
+        Args:
+            path: Log file; created with a file header if empty or missing
+            buffer_size: Bytes buffered in memory between writes to the file
+            fsync_interval: Seconds between fsyncs of the file (0 to fsync
+                after every round)
+        """
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self._file: BinaryIO = open(path, "ab", buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(FILE_HEADER)
+        # Weak keys, so players that leave do not pile up for the log's lifetime
+        self._player_ids: "weakref.WeakKeyDictionary[Player, int]" = weakref.WeakKeyDictionary()
+        self._next_player_id = 0
+        self._table: Optional[Table] = None
+        self._last_sync = time.monotonic()
+
+    def player_id(self, player: Player) -> int:
+        """Id of a player in this log, assigned on first appearance."""
+        player_id = self._player_ids.get(player)
+        if player_id is None:
+            player_id = self._player_ids[player] = self._next_player_id
+            self._next_player_id += 1
+        return player_id
+
+    def attach(self, table: Table) -> "RoundRecorder":
+        """Record every round the table settles from now on.
+
+        Raises:
+            ValueError: If the recorder is already attached to another table.
+        """
+        if self._table is not None and self._table is not table:
+            raise ValueError("A round log records a single table")
+        table.add_round_listener(self)
+        self._table = table
+        return self
+
+    def detach(self, table: Table) -> None:
+        table.remove_round_listener(self)
+        if self._table is table:
+            self._table = None
+
+    def __call__(self, round_id: int, position: int, color: Color, entries: List[LedgerEntry]) -> None:
+        self.record(round_id, position, entries)
+
+    def record(self, round_id: int, position: int, entries: List[LedgerEntry]) -> None:
+        """Append one round."""
+        player_id = self.player_id
+        pack_entry = PLAYER_ENTRY.pack
+        total_staked = 0
+        total_paid = 0
+        parts = [b""]
+        for player, staked, winnings in entries:
+            total_staked += staked
+            total_paid += winnings
+            parts.append(pack_entry(player_id(player), winnings - staked))
+        parts[0] = ROUND_HEADER.pack(round_id, position, len(entries), total_staked, total_paid)
+        self._file.write(b"".join(parts))
+
+        now = time.monotonic()
+        if now - self._last_sync >= self.fsync_interval:
+            self.sync()
+            self._last_sync = now
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def sync(self) -> None:
+        """Flush buffered rounds and fsync them to disk."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self) -> "RoundRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_rounds(path: str, chunk_size: int = 1 << 20) -> Iterator[RoundRecord]:
+    """Stream the rounds of a log back, reading it in chunks.
+
+    A round cut short at the end of the file (a write interrupted by a crash)
+    is ignored.
+
+    Raises:
+        ValueError: If the file is not a round log.
+    """
+    header_size = ROUND_HEADER.size
+    entry_size = PLAYER_ENTRY.size
+    unpack_header = ROUND_HEADER.unpack_from
+    iter_entries = PLAYER_ENTRY.iter_unpack
+
+    with open(path, "rb") as handle:
+        if handle.read(len(FILE_HEADER)) != FILE_HEADER:
+            raise ValueError(f"{path} is not a round log")
+
+        buffer = b""
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                return
+            buffer = buffer + chunk if buffer else chunk
+            offset = 0
+            end = len(buffer)
+            while end - offset >= header_size:
+                round_id, position, count, staked, paid = unpack_header(buffer, offset)
+                record_end = offset + header_size + count * entry_size
+                if record_end > end:
+                    break
+                deltas = tuple(iter_entries(buffer[offset + header_size:record_end]))
+                yield RoundRecord(round_id, position, staked, paid, deltas)
+                offset = record_end
+            buffer = buffer[offset:]
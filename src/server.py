@@ -0,0 +1,436 @@
+"""
+Asyncio game server hosting many roulette tables over a line protocol.
+
+Players connect over local TCP or a Unix socket and send one command per
+line; every command gets exactly one reply line:
+
+    JOIN <table>                    OK JOINED <table>
+    DEPOSIT <amount>                OK BALANCE <balance>
+    BET COLOR <red|black|green> <amount>
+    BET NUMBER <0-36> <amount>      OK BET <round> <balance>
+    SPIN                            RESULT <round> <position> <color> <winnings> <balance>
+    BALANCE                         OK BALANCE <balance>
+    STATS                           STATS <spins> HOT <n:count,...> COLD <n:count,...>
+                                        RED <n> BLACK <n> GREEN <n> STREAK <color> <length>
+    QUIT                            OK BYE
+
+Failures reply ERR <message>. Each table runs its own round timer: every
+round_interval seconds it spins if anyone has bet or is waiting. SPIN
+replies with the result of the round holding the player's bets, waiting
+for it if that round has not been spun yet (or for the next round if the
+player has no bets in play). Without a round interval a table spins as
+soon as a player sends SPIN.
+
+Bets go through the same Player, Bet and Table rules as the interactive
+game, and input is checked with GameController's validate_* methods.
+STATS reports the table's hot and cold numbers, color counts and current
+color streak over its last STATS_WINDOW spins (see src.table_stats).
+
+With a metrics registry, every table and player updates the shared round
+and balance metrics (see src.metrics); --metrics-port serves them over HTTP.
+"""
+
+import argparse
+import asyncio
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .bet import Bet, BetType
+from .game_controller import GameController
+from .metrics import MetricsRegistry, PlayerMetrics, TableMetrics
+from .player import Player
+from .rng import MersenneTwisterRNG
+from .table import Table
+from .table_stats import RollingStats
+from .wheel import Color
+
+
+class TableRound(NamedTuple):
+    """Outcome of one round at a server table."""
+
+    round_number: int
+    winning_position: int
+    winning_color: Color
+    winnings: Dict[int, int]  # id(player) -> amount won
+
+
+class ProtocolError(Exception):
+    """A command that is rejected with an ERR reply."""
+
+
+class _LineValidator(GameController):
+    """GameController's input validation, collecting messages instead of printing them."""
+
+    def __init__(self):
+        self.player = None
+        self.table = None
+        self.messages: List[str] = []
+
+    def display_message(self, message: str) -> None:
+        self.messages.append(message)
+
+    def get_user_input(self, prompt: str) -> str:
+        raise RuntimeError("The game server never reads from the terminal")
+
+    def check(self, validate, value: str, *args):
+        """Run a validate_* method, raising ProtocolError with its message on failure."""
+        self.messages.clear()
+        result = validate(value, *args)
+        if result is None:
+            message = self.messages[0] if self.messages else f"Invalid value: {value}"
+            raise ProtocolError(message.removeprefix("Error: "))
+        return result
+
+
+class ServerTable:
+    """A Table hosted by the server, with its own round loop."""
+
+    # Number of past results kept for players who ask after their round was spun
+    RECENT_ROUNDS = 16
+    # Spins covered by the hot/cold statistics
+    STATS_WINDOW = 100
+
+    def __init__(
+        self,
+        table_id: int,
+        round_interval: Optional[float],
+        rng=None,
+        metrics: Optional[TableMetrics] = None,
+    ):
+        self.table_id = table_id
+        self.round_interval = round_interval
+        self.table = Table(rng=rng, metrics=metrics)
+        self.stats = RollingStats(self.STATS_WINDOW).attach(self.table)
+        self.round_number = 0
+        self.recent_results = deque(maxlen=self.RECENT_ROUNDS)
+        self._waiting = 0
+        self._spin_requested = asyncio.Event()
+        self._next_round = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run_rounds())
+
+    def place_bet(self, player: Player, bet_type: BetType, selection, amount: int) -> int:
+        """Take a bet for the current round.
+
+        Returns:
+            The number of the round the bet is in.
+
+        Raises:
+            ProtocolError: If the player's balance is insufficient.
+        """
+        try:
+            self.table.reserve_and_place_bet(Bet(amount, player, bet_type, selection))
+        except ValueError as e:
+            raise ProtocolError(str(e)) from None
+        return self.round_number
+
+    def result_of(self, round_number: int) -> Optional[TableRound]:
+        """Get the result of a recently spun round, if it is still kept."""
+        for result in self.recent_results:
+            if result.round_number == round_number:
+                return result
+        return None
+
+    async def wait_for_round(self) -> TableRound:
+        """Wait for this table's next result, requesting a spin if the table has no timer."""
+        future = self._next_round
+        self._waiting += 1
+        if self.round_interval is None:
+            self._spin_requested.set()
+        try:
+            # Shielded so that one disconnecting waiter cannot cancel the round for everyone
+            return await asyncio.shield(future)
+        finally:
+            self._waiting -= 1
+
+    def spin(self) -> TableRound:
+        """Spin now, settle every bet and wake all waiters."""
+        entries = self.table.spin_wheel_and_payout()
+        winning_position, winning_color = self.table.wheel.get_ball_position()
+        result = TableRound(
+            self.round_number,
+            winning_position,
+            winning_color,
+            {id(entry.player): entry.winnings for entry in entries},
+        )
+        self.round_number += 1
+        self.recent_results.append(result)
+        future = self._next_round
+        self._next_round = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return result
+
+    async def _run_rounds(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._spin_requested.wait(), self.round_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._spin_requested.clear()
+            if self.table.bets or self._waiting:
+                self.spin()
+
+    def close(self) -> None:
+        self._task.cancel()
+
+
+class RouletteServer:
+    """Serve many players at many tables from a single event loop."""
+
+    def __init__(
+        self,
+        round_interval: Optional[float] = 1.0,
+        seed: Optional[int] = None,
+        max_tables: int = 1000,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """Create a server.
+
+        Args:
+            round_interval: Seconds between spins at each table, or None to
+                spin whenever a player sends SPIN
+            seed: Root seed; table n draws from child stream n
+            max_tables: Tables are numbered 0 to max_tables - 1
+            metrics: Registry for table and player metrics
+        """
+        self.round_interval = round_interval
+        self.max_tables = max_tables
+        self.tables: Dict[int, ServerTable] = {}
+        self.metrics = metrics
+        self.table_metrics: Optional[TableMetrics] = None
+        self.player_metrics: Optional[PlayerMetrics] = None
+        if metrics is not None:
+            self.table_metrics = TableMetrics(metrics)
+            self.player_metrics = PlayerMetrics(metrics)
+            metrics.gauge("roulette_tables_open", "Tables opened by the server.", lambda: len(self.tables))
+        self._rng = MersenneTwisterRNG(seed)
+        self._validator = _LineValidator()
+        self._servers: List[asyncio.AbstractServer] = []
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None
+    ) -> Tuple:
+        """Start listening on a TCP port or, if path is given, a Unix socket.
+
+        Returns:
+            The bound socket address.
+        """
+        # A deep backlog so bursts of thousands of connects are not dropped and retried
+        if path is not None:
+            server = await asyncio.start_unix_server(self._handle_connection, path, backlog=4096)
+        else:
+            server = await asyncio.start_server(self._handle_connection, host, port, backlog=4096)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        for table in self.tables.values():
+            table.close()
+
+    def get_table(self, table_id: int) -> ServerTable:
+        """Get a table, opening it on first use."""
+        table = self.tables.get(table_id)
+        if table is None:
+            table = ServerTable(
+                table_id, self.round_interval, self._rng.child(table_id), self.table_metrics
+            )
+            self.tables[table_id] = table
+        return table
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = _PlayerSession(self)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line longer than the stream limit: no command to reply to
+                    break
+                if not line:
+                    break
+                try:
+                    reply = await session.handle(line.decode(errors="replace"))
+                except (ProtocolError, ValueError) as e:
+                    reply = f"ERR {e}"
+                writer.write(reply.encode() + b"\n")
+                await writer.drain()
+                if reply == "OK BYE":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class _PlayerSession:
+    """State and command handling for one connection."""
+
+    def __init__(self, server: RouletteServer):
+        self.server = server
+        self.player = Player(0, metrics=server.player_metrics)
+        self.table: Optional[ServerTable] = None
+        self._last_bet_round: Optional[int] = None
+
+    async def handle(self, line: str) -> str:
+        parts = line.split()
+        if not parts:
+            raise ProtocolError("Empty command")
+        command, args = parts[0].upper(), parts[1:]
+        handler = self._COMMANDS.get(command)
+        if handler is None:
+            raise ProtocolError(f"Unknown command: {parts[0]}")
+        return await handler(self, args)
+
+    async def _join(self, args: List[str]) -> str:
+        if len(args) != 1:
+            raise ProtocolError("Usage: JOIN <table>")
+        try:
+            table_id = int(args[0])
+        except ValueError:
+            raise ProtocolError(f"Table must be a number, not {args[0]}") from None
+        if not 0 <= table_id < self.server.max_tables:
+            raise ProtocolError(f"Table must be between 0 and {self.server.max_tables - 1}")
+        if self._has_bets_in_play():
+            raise ProtocolError("Cannot change tables with bets in play")
+        self.table = self.server.get_table(table_id)
+        return f"OK JOINED {table_id}"
+
+    async def _deposit(self, args: List[str]) -> str:
+        if len(args) != 1:
+            raise ProtocolError("Usage: DEPOSIT <amount>")
+        validator = self.server._validator
+        amount = validator.check(validator.validate_positive_integer, args[0], "Deposit amount")
+        self.player.add_to_balance(amount)
+        return f"OK BALANCE {self.player.get_balance()}"
+
+    async def _bet(self, args: List[str]) -> str:
+        if len(args) != 3:
+            raise ProtocolError("Usage: BET COLOR <color> <amount> | BET NUMBER <number> <amount>")
+        if self.table is None:
+            raise ProtocolError("Join a table first")
+        validator = self.server._validator
+        kind = args[0].upper()
+        if kind == "COLOR":
+            bet_type = BetType.COLOR
+            selection = validator.check(validator.validate_color_choice, args[1])
+        elif kind == "NUMBER":
+            bet_type = BetType.NUMBER
+            selection = validator.check(validator.validate_number_choice, args[1])
+        else:
+            raise ProtocolError(f"Unknown bet type: {args[0]}")
+        amount = validator.check(validator.validate_positive_integer, args[2], "Bet amount")
+        self._last_bet_round = self.table.place_bet(self.player, bet_type, selection, amount)
+        return f"OK BET {self._last_bet_round} {self.player.get_balance()}"
+
+    async def _spin(self, args: List[str]) -> str:
+        if self.table is None:
+            raise ProtocolError("Join a table first")
+        result = None
+        if self._last_bet_round is not None:
+            # The round holding this player's bets may already have been spun
+            result = self.table.result_of(self._last_bet_round)
+        if result is None:
+            result = await self.table.wait_for_round()
+        self._last_bet_round = None
+        winnings = result.winnings.get(id(self.player), 0)
+        return (
+            f"RESULT {result.round_number} {result.winning_position} "
+            f"{result.winning_color.value} {winnings} {self.player.get_balance()}"
+        )
+
+    async def _balance(self, args: List[str]) -> str:
+        return f"OK BALANCE {self.player.get_balance()}"
+
+    async def _stats(self, args: List[str]) -> str:
+        if self.table is None:
+            raise ProtocolError("Join a table first")
+        stats = self.table.stats
+        counts = stats.color_counts()
+        streak = stats.current_streak()
+        hot = ",".join(f"{position}:{count}" for position, count in stats.hot())
+        cold = ",".join(f"{position}:{count}" for position, count in stats.cold())
+        return (
+            f"STATS {stats.spins} HOT {hot} COLD {cold} "
+            f"RED {counts[Color.RED]} BLACK {counts[Color.BLACK]} GREEN {counts[Color.GREEN]} "
+            f"STREAK {streak.color.value if streak.color else '-'} {streak.length}"
+        )
+
+    async def _quit(self, args: List[str]) -> str:
+        return "OK BYE"
+
+    def _has_bets_in_play(self) -> bool:
+        return (
+            self.table is not None
+            and self._last_bet_round is not None
+            and self._last_bet_round >= self.table.round_number
+        )
+
+    _COMMANDS = {
+        "JOIN": _join,
+        "DEPOSIT": _deposit,
+        "BET": _bet,
+        "SPIN": _spin,
+        "BALANCE": _balance,
+        "STATS": _stats,
+        "QUIT": _quit,
+    }
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the game server options to an argument parser."""
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8737, help="TCP port to listen on")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument(
+        "--round-interval",
+        type=float,
+        default=1.0,
+        help="seconds between spins at each table (0 to spin on request)",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="root seed for the tables' wheels")
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="serve Prometheus metrics over HTTP on this port of --host",
+    )
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    metrics = None
+    if args.metrics_port is not None:
+        metrics = MetricsRegistry()
+        metrics_host, metrics_port = metrics.serve(args.host, args.metrics_port)
+        print(f"Metrics at http://{metrics_host}:{metrics_port}/metrics")
+    server = RouletteServer(args.round_interval or None, args.seed, metrics=metrics)
+    address = await server.start(args.host, args.port, args.unix)
+    print(f"Roulette server listening on {address}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+        if metrics is not None:
+            metrics.close()
+
+
+def run_from_args(args: argparse.Namespace) -> None:
+    """Run the game server until interrupted."""
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Multi-table roulette game server")
+    add_arguments(parser)
+    run_from_args(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
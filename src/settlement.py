@@ -0,0 +1,117 @@
+from array import array
+from typing import Iterable, List, Optional
+
+from .bet import Bet, PAYOUT_MATRIX, bet_slot
+from .player import Player
+
+
+class SettlementEngine:
+    """Columnar store of a round's bets that settles them in a single pass.
+
+    Bets are kept as parallel arrays (amount, bet type code, target and player
+    index). Settling a spin walks those arrays once, sums the winnings per
+    player and applies one balance update per winning player.
+    """
+
+    def __init__(self):
+        self.amounts = array("q")
+        self.kinds = array("B")
+        self.targets = array("B")
+        self.player_indexes = array("I")
+        self.players: List[Player] = []
+        self._player_slots = {}
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def add_bet(self, bet: Bet) -> int:
+        """Add a bet to the round.
+
+        Args:
+            bet: The bet to store
+
+        Returns:
+            The row index of the stored bet, or -1 if the bet can never win.
+        """
+        slot = bet_slot(bet.bet_type, bet.bet_value)
+        if slot is None:
+            return -1
+        kind, target = slot
+
+        player_index = self._player_slots.get(id(bet.player))
+        if player_index is None:
+            player_index = len(self.players)
+            self._player_slots[id(bet.player)] = player_index
+            self.players.append(bet.player)
+
+        self.amounts.append(bet.amount)
+        self.kinds.append(kind)
+        self.targets.append(target)
+        self.player_indexes.append(player_index)
+        return len(self.amounts) - 1
+
+    def compute_winnings(
+        self, winning_position: int, rows: Optional[Iterable[int]] = None
+    ) -> List[int]:
+        """Compute the total winnings per player for a winning position.
+
+        Args:
+            winning_position: The position the ball landed on (0-36)
+            rows: Optional row indexes to visit instead of every stored bet
+
+        Returns:
+            List of winnings aligned with self.players.
+        """
+        winnings = [0] * len(self.players)
+        if rows is None:
+            for amount, kind, target, player_index in zip(
+                self.amounts, self.kinds, self.targets, self.player_indexes
+            ):
+                odds = PAYOUT_MATRIX[kind][target][winning_position]
+                if odds:
+                    winnings[player_index] += amount * odds
+        else:
+            amounts, kinds, targets, player_indexes = (
+                self.amounts, self.kinds, self.targets, self.player_indexes
+            )
+            for row in rows:
+                odds = PAYOUT_MATRIX[kinds[row]][targets[row]][winning_position]
+                if odds:
+                    winnings[player_indexes[row]] += amounts[row] * odds
+        return winnings
+
+    def compute_stakes(self) -> List[int]:
+        """Total amount staked per player, aligned with self.players."""
+        if len(self.players) == 1:
+            return [sum(self.amounts)]
+        stakes = [0] * len(self.players)
+        for amount, player_index in zip(self.amounts, self.player_indexes):
+            stakes[player_index] += amount
+        return stakes
+
+    def settle(
+        self, winning_position: int, rows: Optional[Iterable[int]] = None
+    ) -> List[int]:
+        """Pay out bets for a winning position.
+
+        Args:
+            winning_position: The position the ball landed on (0-36)
+            rows: Optional row indexes to visit instead of every stored bet
+
+        Returns:
+            List of winnings aligned with self.players.
+        """
+        winnings = self.compute_winnings(winning_position, rows)
+        for player, amount in zip(self.players, winnings):
+            if amount:
+                player.add_to_balance(amount)
+        return winnings
+
+    def clear(self) -> None:
+        """Remove all bets so the engine can be reused for the next round."""
+        del self.amounts[:]
+        del self.kinds[:]
+        del self.targets[:]
+        del self.player_indexes[:]
+        self.players = []
+        self._player_slots = {}
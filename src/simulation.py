@@ -0,0 +1,119 @@
+"""
+Building blocks for headless simulation: betting policies and round results.
+
+A betting policy replaces the interactive prompts of GameController. Each
+round it is shown the player's balance and the previous round's result and
+returns the bets it wants to place.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+from .bet import BetType
+from .limits import MAX_AMOUNT
+from .wheel import Color
+
+
+class BetRequest(NamedTuple):
+    """A bet a policy wants to place: what it is on and how much."""
+
+    bet_type: BetType
+    bet_value: Union[Color, int]
+    amount: int
+
+
+class RoundResult(NamedTuple):
+    """Outcome of one headless round."""
+
+    round_number: int
+    winning_position: int
+    winning_color: Color
+    bets_placed: int
+    total_bet: int
+    total_payout: int
+    balance: int
+
+
+def is_valid_bet_request(request: BetRequest, available_balance: int) -> bool:
+    """Check a policy's bet against the same rules the interactive prompts enforce.
+
+    Args:
+        request: The bet the policy wants to place
+        available_balance: Balance not yet committed to bets this round
+
+    Returns:
+        True if the bet can be placed, False otherwise.
+    """
+    amount = request.amount
+    if type(amount) is not int or amount <= 0 or amount > MAX_AMOUNT:
+        return False
+    if amount > available_balance:
+        return False
+
+    if request.bet_type == BetType.COLOR:
+        return isinstance(request.bet_value, Color)
+    if request.bet_type == BetType.NUMBER:
+        value = request.bet_value
+        return type(value) is int and 0 <= value <= 36
+    return False
+
+
+class BettingPolicy(ABC):
+    """Base class for betting policies used by headless simulation."""
+
+    @abstractmethod
+    def bets_for_round(
+        self, balance: int, last_result: Optional[RoundResult]
+    ) -> Sequence[BetRequest]:
+        """Choose the bets for the next round.
+
+        Args:
+            balance: The player's balance before betting
+            last_result: The previous round's result, or None for the first round
+
+        Returns:
+            The bets to place. An empty sequence ends the simulation.
+        """
+
+
+class FlatBetPolicy(BettingPolicy):
+    """Place the same bet every round."""
+
+    def __init__(self, bet_type: BetType, bet_value: Union[Color, int], amount: int):
+        self._bets = [BetRequest(bet_type, bet_value, amount)]
+
+    def bets_for_round(
+        self, balance: int, last_result: Optional[RoundResult]
+    ) -> Sequence[BetRequest]:
+        return self._bets
+
+
+class MartingalePolicy(BettingPolicy):
+    """Bet on a color, doubling the stake after each loss and resetting after a win."""
+
+    def __init__(self, color: Color, base_amount: int):
+        self._color = color
+        self._base_amount = base_amount
+        self._amount = base_amount
+
+    def bets_for_round(
+        self, balance: int, last_result: Optional[RoundResult]
+    ) -> Sequence[BetRequest]:
+        if last_result is not None and last_result.bets_placed:
+            if last_result.total_payout > 0:
+                self._amount = self._base_amount
+            else:
+                self._amount *= 2
+        return [BetRequest(BetType.COLOR, self._color, min(self._amount, balance))]
+
+
+class MixedSlipPolicy(BettingPolicy):
+    """Place a fixed slip of several bets every round."""
+
+    def __init__(self, bets: Sequence[BetRequest]):
+        self._bets: List[BetRequest] = list(bets)
+
+    def bets_for_round(
+        self, balance: int, last_result: Optional[RoundResult]
+    ) -> Sequence[BetRequest]:
+        return self._bets
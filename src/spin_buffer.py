@@ -0,0 +1,159 @@
+"""
+Ring buffer of pre-drawn wheel outcomes, refilled from a background thread.
+
+BufferedSpinSource wraps another spin source. Positions are pre-drawn in
+fixed-size blocks by a refill thread whenever no more than the low-water
+mark remain queued, so a spin on the latency-critical path is an index
+bump into the current block; the lock is only taken once per block.
+
+Only the refill thread touches the wrapped source. It draws with single
+spin_position calls (the batched draws of some backends follow a different
+sequence) and blocks are consumed in FIFO order, so outcomes come out in
+exactly the order an unbuffered Wheel.spin would produce them.
+
+A buffered source has one consumer: give every wheel its own.
+"""
+
+import threading
+from array import array
+from collections import deque
+from typing import Optional
+
+from .rng import SpinSource
+
+
+class BufferedSpinSource(SpinSource):
+    """Serve spins from pre-drawn blocks kept topped up by a background thread."""
+
+    def __init__(
+        self,
+        source: SpinSource,
+        capacity: int = 65536,
+        low_water: Optional[int] = None,
+        block_size: int = 1024,
+    ):
+        """Create a buffered source, fill it and start its refill thread.
+
+        Args:
+            source: Spin source to pre-draw outcomes from
+            capacity: Number of positions to keep queued after a refill
+            low_water: Refill once this many positions or fewer are queued
+                (defaults to a quarter of the capacity; 0 refills only when
+                the queue runs empty)
+            block_size: Number of positions drawn and handed over at a time
+        """
+        if capacity <= 0 or block_size <= 0:
+            raise ValueError("Capacity and block size must be greater than 0")
+        if low_water is None:
+            low_water = capacity // 4
+        if not 0 <= low_water < capacity:
+            raise ValueError("Low-water mark must be between 0 and the capacity")
+
+        self._source = source
+        self._capacity = capacity
+        self._low_water = low_water
+        self._block_size = min(block_size, capacity)
+        self._blocks = deque()
+        self._queued = 0
+        self._block = b""
+        self._index = 0
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._condition = threading.Condition()
+
+        while self._queued < capacity:
+            self._blocks.append(self._draw(self._block_size))
+            self._queued += self._block_size
+        self._thread = threading.Thread(target=self._refill_loop, name="spin-refill", daemon=True)
+        self._thread.start()
+
+    @property
+    def source(self) -> SpinSource:
+        return self._source
+
+    @property
+    def buffered(self) -> int:
+        """Number of pre-drawn positions waiting to be spun."""
+        return self._queued + len(self._block) - self._index
+
+    def spin_position(self) -> int:
+        index = self._index
+        try:
+            position = self._block[index]
+        except IndexError:
+            self._block = self._next_block()
+            index = 0
+            position = self._block[0]
+        self._index = index + 1
+        return position
+
+    def spin_positions(self, n: int) -> array:
+        if n < 0:
+            raise ValueError("Number of spins cannot be negative")
+        positions = array("B", self._block[self._index:self._index + n])
+        self._index += len(positions)
+        while len(positions) < n:
+            self._block = self._next_block()
+            take = min(n - len(positions), len(self._block))
+            positions.frombytes(self._block[:take])
+            self._index = take
+        return positions
+
+    def close(self) -> None:
+        """Stop the refill thread. Positions already buffered can still be spun."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def __enter__(self) -> "BufferedSpinSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _draw(self, n: int) -> bytes:
+        spin_position = self._source.spin_position
+        return bytes([spin_position() for _ in range(n)])
+
+    def _next_block(self) -> bytes:
+        """Take the next queued block, waiting for the refill thread if needed."""
+        with self._condition:
+            while not self._blocks:
+                if self._error is not None:
+                    raise RuntimeError("Spin refill thread failed") from self._error
+                if self._closed:
+                    raise RuntimeError("Buffered spin source is closed")
+                # Ran dry: make sure the refill thread is awake
+                self._condition.notify_all()
+                self._condition.wait()
+            block = self._blocks.popleft()
+            self._queued -= len(block)
+            if self._queued <= self._low_water:
+                self._condition.notify_all()
+        return block
+
+    def _refill_loop(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while self._queued > self._low_water and not self._closed:
+                    condition.wait()
+                if self._closed:
+                    return
+
+            while self._queued < self._capacity:
+                # Draw outside the lock so spins can continue meanwhile
+                try:
+                    block = self._draw(self._block_size)
+                except BaseException as error:
+                    with condition:
+                        self._error = error
+                        condition.notify_all()
+                    return
+                with condition:
+                    if self._closed:
+                        return
+                    self._blocks.append(block)
+                    self._queued += len(block)
+                    condition.notify_all()
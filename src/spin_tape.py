@@ -0,0 +1,156 @@
+"""
+Memory-mapped spin tapes: pre-drawn wheel positions shared across runs.
+
+A tape file is a 16-byte header (magic and spin count) followed by one byte
+per spin. write_tape draws the positions in batches from any RNG backend,
+so even billions of spins never sit in memory at once. SpinTape reads a
+tape through a read-only memory map: nothing is loaded up front, and every
+process that opens the same tape shares the same page cache pages, which
+gives common random numbers across strategies, runs and processes without
+regenerating or pickling outcome arrays. Close a tape (or use it as a
+context manager) to release the mapping; its cursors must be closed first.
+
+Usage:
+    python -m src.spin_tape spins.tape --spins 1000000000 --seed 7
+"""
+
+import argparse
+import mmap
+import struct
+from array import array
+from typing import Optional, Sequence
+
+from .rng import RNG_BACKENDS, RNGBackend, SpinSource, make_rng
+
+
+TAPE_MAGIC = b"SPINTAPE"
+TAPE_HEADER = struct.Struct("<8sQ")
+
+
+def write_tape(path: str, spins: int, rng: RNGBackend, batch_size: int = 1 << 20) -> None:
+    """Write a tape of pre-drawn positions.
+
+    The tape is the backend's batched draws, so it depends on batch_size as
+    well as on the backend and its seed.
+
+    Args:
+        path: File to create (overwritten if it exists)
+        spins: Number of spins to draw
+        rng: Backend to draw them from
+        batch_size: Spins drawn and written at a time
+    """
+    if spins < 0:
+        raise ValueError("Number of spins cannot be negative")
+    with open(path, "wb") as handle:
+        handle.write(TAPE_HEADER.pack(TAPE_MAGIC, spins))
+        remaining = spins
+        while remaining:
+            batch = min(batch_size, remaining)
+            rng.spin_positions(batch).tofile(handle)
+            remaining -= batch
+
+
+class SpinTape(SpinSource):
+    """Spin source reading positions from a memory-mapped tape."""
+
+    def __init__(self, path: str, start: int = 0):
+        """Map a tape read-only.
+
+        Args:
+            path: Tape written by write_tape
+            start: Index of the first spin to produce
+        """
+        with open(path, "rb") as handle:
+            magic, spins = TAPE_HEADER.unpack(handle.read(TAPE_HEADER.size).ljust(TAPE_HEADER.size, b"\0"))
+            if magic != TAPE_MAGIC:
+                raise ValueError(f"{path} is not a spin tape")
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) < TAPE_HEADER.size + spins:
+            mapped.close()
+            raise ValueError(f"{path} is truncated")
+        self._init_cursor(path, mapped, spins, start, True)
+
+    def _init_cursor(self, path: str, mapped: mmap.mmap, spins: int, start: int, owns_map: bool) -> None:
+        self.path = path
+        self.spins = spins
+        self._map = mapped
+        # Only the tape that mapped the file closes the mapping
+        self._owns_map = owns_map
+        # Zero-copy view of the spins, past the header
+        self._view = memoryview(mapped)[TAPE_HEADER.size:TAPE_HEADER.size + spins]
+        self.seek(start)
+
+    def cursor(self, start: int = 0) -> "SpinTape":
+        """Get another independent read position on the same mapping."""
+        tape = object.__new__(SpinTape)
+        tape._init_cursor(self.path, self._map, self.spins, start, False)
+        return tape
+
+    def close(self) -> None:
+        """Release the view of the spins, then the mapping if this tape created it.
+
+        Raises:
+            BufferError: If a cursor or a view taken from this tape is still open.
+        """
+        self._view.release()
+        if self._owns_map:
+            self._map.close()
+
+    def __enter__(self) -> "SpinTape":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.spins
+
+    def position_at(self, index: int) -> int:
+        """Position of any spin on the tape."""
+        if not 0 <= index < self.spins:
+            raise IndexError("Spin index out of range")
+        return self._view[index]
+
+    def spin_position(self) -> int:
+        offset = self._offset
+        if offset >= self.spins:
+            raise EOFError("Spin tape exhausted")
+        self._offset = offset + 1
+        return self._view[offset]
+
+    def spin_positions(self, n: int) -> array:
+        return array("B", self.view(n))
+
+    def view(self, n: int) -> memoryview:
+        """Take the next n spins as a zero-copy view of the mapping."""
+        if n < 0:
+            raise ValueError("Number of spins cannot be negative")
+        offset = self._offset
+        if offset + n > self.spins:
+            raise EOFError("Spin tape exhausted")
+        self._offset = offset + n
+        return self._view[offset:offset + n]
+
+    def seek(self, round_number: int) -> None:
+        if not 0 <= round_number <= self.spins:
+            raise ValueError("Spin index out of range")
+        self._offset = round_number
+
+    def tell(self) -> int:
+        """Index of the spin the next draw will produce."""
+        return self._offset
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Write a tape of pre-drawn wheel positions")
+    parser.add_argument("path", help="tape file to write")
+    parser.add_argument("--spins", type=int, required=True, help="number of spins")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rng", choices=sorted(RNG_BACKENDS), default="mt19937", help="RNG backend")
+    args = parser.parse_args(argv)
+    write_tape(args.path, args.spins, make_rng(args.rng, args.seed))
+    print(f"Wrote {args.spins:,} spins to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,236 @@
-from .wheel import Wheel
+import threading
+import time
+from itertools import chain
+from typing import Callable, List, Optional
 
+from .bet import Bet, BetType
+from .ledger import Ledger, LedgerEntry
+from .metrics import TableMetrics
+from .rng import SpinSource
+from .settlement import SettlementEngine
+from .wheel import CODE_COLORS, Color, Wheel
 
-class Table:
+
+class RoundBets:
+    """The bets of one round: settlement columns, winning-bucket indexes and ledger."""
+
+    __slots__ = (
+        "bets", "ledger", "settlement", "position_index", "color_index", "color_buckets", "filled_buckets"
+    )
 
     def __init__(self):
         self.bets = []
-        self.wheel = Wheel()
+        self.ledger = Ledger()
+        self.settlement = SettlementEngine()
+        # Settlement rows indexed by the position or color that makes them win
+        self.position_index = [[] for _ in range(37)]
+        self.color_index = {color: [] for color in Color}
+        # The color buckets again, by color code: intake looks them up by the
+        # code the settlement columns hold, as hashing a Color runs in Python
+        self.color_buckets = [self.color_index[color] for color in CODE_COLORS]
+        # Buckets holding rows this round, so clearing skips the empty ones
+        self.filled_buckets = []
 
-    def spin_wheel_and_payout(self):
-        self.wheel.spin()
-        self._payout_bets()
+    def add(self, bet: Bet) -> None:
+        row = self.settlement.add_bet(bet)
+        self.bets.append(bet)
+        if row < 0:
+            # Not in the settlement columns, so its stake is recorded here;
+            # callers hold the table lock
+            self.ledger._add_stake(bet.player, bet.amount)
+            return
+        target = self.settlement.targets[row]
+        if bet.bet_type is BetType.COLOR:
+            bucket = self.color_buckets[target]
+        else:
+            bucket = self.position_index[target]
+        if not bucket:
+            self.filled_buckets.append(bucket)
+        bucket.append(row)
 
-    def _payout_bets(self):
-        winning_position, winning_color = self.wheel.get_ball_position()
-        for bet in self.bets:
-            bet.payout(winning_color, winning_position)
+    def settle(self, winning_position: int, winning_color: Color) -> List[LedgerEntry]:
+        """Pay out the round and clear it for reuse.
+
+        Returns:
+            The ledger entry (player, staked, winnings) of every player in the round.
+        """
+        # Only the winning buckets are visited; every other bet simply loses
+        winning_rows = chain(
+            self.position_index[winning_position], self.color_index[winning_color]
+        )
+        settlement = self.settlement
+        winnings = settlement.compute_winnings(winning_position, winning_rows)
+        # Stakes are summed per player here, once per round, rather than per bet
+        stakes = settlement.compute_stakes()
+        players = settlement.players
+        self.clear()
+        # Winnings are paid in one batch, one balance update per player
+        return self.ledger.settle_and_commit(players, stakes, winnings)
+
+    def clear(self) -> None:
+        self.settlement.clear()
+        for bucket in self.filled_buckets:
+            bucket.clear()
+        self.filled_buckets.clear()
         self.bets = []
 
+
+# Called after every settled round with (round id, position, color, ledger entries)
+RoundListener = Callable[[int, int, Color, List[LedgerEntry]], None]
+
+
+class Table:
+    """A roulette table whose bets are double buffered.
+
+    Bets go into the open round. close_betting is the "no more bets" cut-off:
+    it swaps in a fresh round, so bets for the next round can be taken while
+    the closed one is spun and settled with settle_round, possibly on another
+    thread (see src.pipeline). spin_wheel_and_payout does both inline.
+
+    Round listeners (recorders, statistics) are called after each round is
+    settled; round ids count settled rounds from 0. Metrics, if given, are
+    updated once per settled round.
+    """
+
+    __slots__ = ("wheel", "rounds_settled", "metrics", "_open", "_spare", "_lock", "_round_listeners")
+
+    def __init__(self, rng: Optional[SpinSource] = None, metrics: Optional[TableMetrics] = None):
+        self.wheel = Wheel(rng=rng)
+        self.rounds_settled = 0
+        self.metrics = metrics
+        self._open = RoundBets()
+        # A settled round kept for reuse as the next open round
+        self._spare: Optional[RoundBets] = None
+        # Guards bet intake and the cut-off against each other. The per-bet and
+        # per-round paths call acquire/release directly: it costs well under
+        # half of a with block on CPython 3.13
+        self._lock = threading.Lock()
+        self._round_listeners: List[RoundListener] = []
+
+    def add_round_listener(self, listener: RoundListener) -> None:
+        """Call listener(round_id, position, color, entries) after every settled round."""
+        self._round_listeners.append(listener)
+
+    def remove_round_listener(self, listener: RoundListener) -> None:
+        self._round_listeners.remove(listener)
+
+    @property
+    def bets(self) -> list:
+        """Bets of the round currently taking bets."""
+        return self._open.bets
+
+    @property
+    def ledger(self) -> Ledger:
+        """Ledger of the round currently taking bets; its bets' stakes are added when it is settled."""
+        return self._open.ledger
+
+    @property
+    def _position_index(self) -> list:
+        return self._open.position_index
+
+    @property
+    def _color_index(self) -> dict:
+        return self._open.color_index
+
+    def spin_wheel_and_payout(self, round_number: Optional[int] = None) -> List[LedgerEntry]:
+        """Spin the wheel and pay out the round's bets.
+
+        Args:
+            round_number: Round to produce the outcome of; needs a seekable
+                spin source such as CounterSpinSource
+
+        Returns:
+            The ledger entry (player, staked, winnings) of every player in the round.
+        """
+        return self.settle_round(self.close_betting(), round_number)
+
+    def close_betting(self) -> RoundBets:
+        """No more bets: close the open round and start taking bets for the next one.
+
+        Returns:
+            The closed round, to be passed to settle_round.
+        """
+        lock = self._lock
+        lock.acquire()
+        try:
+            closed = self._open
+            self._open = self._spare if self._spare is not None else RoundBets()
+            self._spare = None
+        finally:
+            lock.release()
+        return closed
+
+    def settle_round(self, closed: RoundBets, round_number: Optional[int] = None) -> List[LedgerEntry]:
+        """Spin the wheel for a closed round and pay out its bets.
+
+        Rounds must be settled one at a time, in the order they were closed.
+
+        Args:
+            closed: A round returned by close_betting
+            round_number: Round to produce the outcome of; needs a seekable
+                spin source such as CounterSpinSource
+
+        Returns:
+            The ledger entry (player, staked, winnings) of every player in the round.
+        """
+        self.wheel.spin(round_number)
+        return self._settle(closed)
+
+    def _payout_bets(self) -> List[LedgerEntry]:
+        return self._settle(self.close_betting())
+
+    def _settle(self, closed: RoundBets) -> List[LedgerEntry]:
+        winning_position, winning_color = self.wheel.get_ball_position()
+        metrics = self.metrics
+        if metrics is None:
+            entries = closed.settle(winning_position, winning_color)
+        else:
+            bets = len(closed.bets)
+            start = time.perf_counter()
+            entries = closed.settle(winning_position, winning_color)
+            metrics.round_settled(bets, entries, time.perf_counter() - start)
+        lock = self._lock
+        lock.acquire()
+        try:
+            self._spare = closed
+            round_id = self.rounds_settled
+            self.rounds_settled += 1
+        finally:
+            lock.release()
+        for listener in self._round_listeners:
+            listener(round_id, winning_position, winning_color, entries)
+        return entries
+
     def place_bet(self, bet):
-        self.bets.append(bet)
+        """Place a bet whose stake the caller has already taken from the player.
+
+        The stake still shows in the round's ledger entries (and the round log
+        and metrics built on them): settlement adds it from the bet columns.
+        """
+        lock = self._lock
+        lock.acquire()
+        try:
+            self._open.add(bet)
+        finally:
+            lock.release()
+
+    def reserve_and_place_bet(self, bet: Bet) -> None:
+        """Take the stake from the bet's player, then place the bet.
+
+        The stake is given back if the bet cannot be placed.
+
+        Raises:
+            ValueError: If the player's balance is insufficient.
+        """
+        player = bet.player
+        amount = bet.amount
+        if amount <= 0:
+            raise ValueError("Stake must be greater than 0")
+        with self._lock:
+            # Stake and bet land in the same round, whatever the cut-off does
+            player.subtract_from_balance(amount)
+            try:
+                self._open.add(bet)
+            except BaseException:
+                player.add_to_balance(amount)
+                raise
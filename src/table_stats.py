@@ -0,0 +1,200 @@
+"""
+Rolling "last N spins" statistics for a table.
+
+RollingStats keeps the last N winning positions in a ring buffer and
+updates every statistic in constant time per spin: adding the new spin and
+evicting the oldest each change a handful of counters, and nothing ever
+rescans the window.
+
+- Position and color counts are plain counters.
+- Hot and cold numbers come from the 37 positions kept sorted by count.
+  A count only moves by one, so a position only swaps with the first (or
+  last) position of its equal-count group; _above[c] is the number of
+  positions with a count above c, which is where that group starts.
+- Color streaks are the runs of one color in the window, oldest first, with
+  a histogram of run lengths per color. A run only grows or shrinks by one,
+  so the longest run of a color moves by at most one per spin.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .ledger import LedgerEntry
+from .table import Table
+from .wheel import CODE_COLORS, COLOR_CODES, WHEEL_LAYOUT, Color
+
+
+class Streak(NamedTuple):
+    """A run of consecutive spins of one color."""
+
+    color: Optional[Color]
+    length: int
+
+
+class RollingStats:
+    """Hot/cold number, color and streak statistics over a table's last spins."""
+
+    def __init__(self, window: int = 100):
+        """Create an empty tracker.
+
+        Args:
+            window: Number of most recent spins the statistics cover
+        """
+        if window < 1:
+            raise ValueError("Window must be at least one spin")
+        self.window = window
+        self.total_spins = 0
+        self._ring = bytearray(window)
+        self._spins = 0
+        self._head = 0
+        self._position_counts = [0] * 37
+        self._color_counts = [0] * len(CODE_COLORS)
+        # Positions sorted by count, most frequent first, and their ranks
+        self._order = list(range(37))
+        self._rank = list(range(37))
+        self._above = [0] * (window + 1)
+        # Color runs in the window, oldest first, as [color code, length]
+        self._runs: deque = deque()
+        self._run_lengths = [[0] * (window + 2) for _ in CODE_COLORS]
+        self._longest = [0] * len(CODE_COLORS)
+        self._last_seen = [-1] * 37
+        self._lock = threading.Lock()
+
+    def attach(self, table: Table) -> "RollingStats":
+        """Track every round the table settles from now on."""
+        table.add_round_listener(self)
+        return self
+
+    def detach(self, table: Table) -> None:
+        table.remove_round_listener(self)
+
+    def __call__(self, round_id: int, position: int, color: Color, entries: List[LedgerEntry]) -> None:
+        self.record(position)
+
+    def record(self, position: int) -> None:
+        """Add one spin, evicting the oldest once the window is full."""
+        code = WHEEL_LAYOUT.color_codes[position]
+        with self._lock:
+            if self._spins == self.window:
+                self._evict(self._ring[self._head])
+            else:
+                self._spins += 1
+            self._ring[self._head] = position
+            self._head = (self._head + 1) % self.window
+
+            self._increment(position)
+            self._color_counts[code] += 1
+            runs = self._runs
+            lengths = self._run_lengths[code]
+            if runs and runs[-1][0] == code:
+                run = runs[-1]
+                lengths[run[1]] -= 1
+                run[1] += 1
+            else:
+                run = [code, 1]
+                runs.append(run)
+            lengths[run[1]] += 1
+            if run[1] > self._longest[code]:
+                self._longest[code] = run[1]
+
+            self._last_seen[position] = self.total_spins
+            self.total_spins += 1
+
+    def _evict(self, position: int) -> None:
+        code = WHEEL_LAYOUT.color_codes[position]
+        self._decrement(position)
+        self._color_counts[code] -= 1
+        # The oldest spin is always the start of the oldest run
+        run = self._runs[0]
+        lengths = self._run_lengths[code]
+        length = run[1]
+        lengths[length] -= 1
+        if length > 1:
+            run[1] = length - 1
+            lengths[length - 1] += 1
+        else:
+            self._runs.popleft()
+        if length == self._longest[code] and not lengths[length]:
+            self._longest[code] = length - 1
+
+    def _increment(self, position: int) -> None:
+        counts = self._position_counts
+        order = self._order
+        rank = self._rank
+        count = counts[position]
+        # Swap to the front of its group, which then joins the group above
+        front = self._above[count]
+        other = order[front]
+        here = rank[position]
+        order[here] = other
+        rank[other] = here
+        order[front] = position
+        rank[position] = front
+        self._above[count] = front + 1
+        counts[position] = count + 1
+
+    def _decrement(self, position: int) -> None:
+        counts = self._position_counts
+        order = self._order
+        rank = self._rank
+        count = counts[position]
+        # Swap to the back of its group, which then joins the group below
+        back = self._above[count - 1] - 1
+        other = order[back]
+        here = rank[position]
+        order[here] = other
+        rank[other] = here
+        order[back] = position
+        rank[position] = back
+        self._above[count - 1] = back
+        counts[position] = count - 1
+
+    @property
+    def spins(self) -> int:
+        """Number of spins currently in the window."""
+        return self._spins
+
+    def count(self, position: int) -> int:
+        """Number of times a position won in the window."""
+        return self._position_counts[position]
+
+    def frequencies(self) -> List[int]:
+        """Win counts in the window, indexed by position."""
+        with self._lock:
+            return list(self._position_counts)
+
+    def color_counts(self) -> Dict[Color, int]:
+        """Win counts in the window by color."""
+        with self._lock:
+            return {color: self._color_counts[COLOR_CODES[color]] for color in Color}
+
+    def hot(self, k: int = 5) -> List[Tuple[int, int]]:
+        """The k most frequent positions in the window, as (position, count)."""
+        with self._lock:
+            counts = self._position_counts
+            return [(position, counts[position]) for position in self._order[:k]]
+
+    def cold(self, k: int = 5) -> List[Tuple[int, int]]:
+        """The k least frequent positions in the window, as (position, count)."""
+        with self._lock:
+            counts = self._position_counts
+            return [(position, counts[position]) for position in reversed(self._order[max(0, 37 - k):])]
+
+    def current_streak(self) -> Streak:
+        """The color run the latest spin belongs to."""
+        with self._lock:
+            if not self._runs:
+                return Streak(None, 0)
+            code, length = self._runs[-1]
+            return Streak(CODE_COLORS[code], length)
+
+    def longest_streak(self, color: Color) -> int:
+        """Length of the longest run of a color in the window."""
+        return self._longest[COLOR_CODES[color]]
+
+    def spins_since(self, position: int) -> Optional[int]:
+        """Spins since a position last won, or None if it never has."""
+        with self._lock:
+            last_seen = self._last_seen[position]
+            return None if last_seen < 0 else self.total_spins - 1 - last_seen
@@ -1,6 +1,9 @@
+from array import array
 from enum import Enum
-from random import randint
-from typing import Tuple
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Tuple
+
+from .rng import MersenneTwisterRNG, SpinSource
 
 
 class Color(Enum):
@@ -9,55 +12,122 @@ class Color(Enum):
     GREEN = "green"
 
 
-WHEEL_POSITIONS = {
-    0: Color.GREEN,
-    1: Color.RED,
-    2: Color.BLACK,
-    3: Color.RED,
-    4: Color.BLACK,
-    5: Color.RED,
-    6: Color.BLACK,
-    7: Color.RED,
-    8: Color.BLACK,
-    9: Color.RED,
-    10: Color.BLACK,
-    11: Color.BLACK,
-    12: Color.RED,
-    13: Color.BLACK,
-    14: Color.RED,
-    15: Color.BLACK,
-    16: Color.RED,
-    17: Color.BLACK,
-    18: Color.RED,
-    19: Color.RED,
-    20: Color.BLACK,
-    21: Color.RED,
-    22: Color.BLACK,
-    23: Color.RED,
-    24: Color.BLACK,
-    25: Color.RED,
-    26: Color.BLACK,
-    27: Color.RED,
-    28: Color.BLACK,
-    29: Color.BLACK,
-    30: Color.RED,
-    31: Color.BLACK,
-    32: Color.RED,
-    33: Color.BLACK,
-    34: Color.RED,
-    35: Color.BLACK,
-    36: Color.RED,
-}
+# Compact color codes shared by the wheel layout and the batched APIs
+COLOR_CODES = {Color.GREEN: 0, Color.RED: 1, Color.BLACK: 2}
+CODE_COLORS = (Color.GREEN, Color.RED, Color.BLACK)
+
+RED_NUMBERS = frozenset(
+    {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
+)
+
+
+class WheelLayout(NamedTuple):
+    """Immutable flat lookup tables for the 37 wheel positions.
+
+    Every table is a bytes object of length 37 indexed by position, so single
+    lookups are allocation free and whole arrays of positions can be mapped
+    at once with bytes.translate (see translation_table).
+    """
+
+    color_codes: bytes
+    red: bytes
+    black: bytes
+    even: bytes
+    odd: bytes
+    dozen: bytes   # 0 for the zero, otherwise 1-3
+    column: bytes  # 0 for the zero, otherwise 1-3
+
+    def color(self, position: int) -> Color:
+        """Get the Color of a wheel position."""
+        return CODE_COLORS[self.color_codes[position]]
+
+    @staticmethod
+    def translation_table(table: bytes) -> bytes:
+        """Pad a per-position table to 256 entries for use with bytes.translate."""
+        return table.ljust(256, b"\0")
+
+
+def _build_wheel_layout() -> WheelLayout:
+    positions = range(37)
+    color_codes = bytes(
+        0 if p == 0 else COLOR_CODES[Color.RED] if p in RED_NUMBERS else COLOR_CODES[Color.BLACK]
+        for p in positions
+    )
+    return WheelLayout(
+        color_codes=color_codes,
+        red=bytes(code == COLOR_CODES[Color.RED] for code in color_codes),
+        black=bytes(code == COLOR_CODES[Color.BLACK] for code in color_codes),
+        even=bytes(p != 0 and p % 2 == 0 for p in positions),
+        odd=bytes(p % 2 == 1 for p in positions),
+        dozen=bytes(0 if p == 0 else (p - 1) // 12 + 1 for p in positions),
+        column=bytes(0 if p == 0 else (p - 1) % 3 + 1 for p in positions),
+    )
+
+
+WHEEL_LAYOUT = _build_wheel_layout()
+
+# Read-only position -> Color view kept for backward compatibility
+WHEEL_POSITIONS = MappingProxyType(
+    {position: WHEEL_LAYOUT.color(position) for position in range(37)}
+)
+
+_POSITION_TO_COLOR_CODE = WheelLayout.translation_table(WHEEL_LAYOUT.color_codes)
 
 
 class Wheel:
     """A class to represent a wheel in a roulette game."""
 
-    def __init__(self):
+    __slots__ = ("_ball_position", "_ball_positions", "_rng")
+
+    def __init__(self, seed: Optional[int] = None, rng: Optional[SpinSource] = None):
+        """Create a wheel.
+
+        Args:
+            seed: Seed for the default Mersenne Twister backend
+            rng: RNG backend or other spin source to draw outcomes from
+                (see src.rng); overrides seed
+        """
         self._ball_position = None
+        self._ball_positions = array("B")
+        self._rng = rng if rng is not None else MersenneTwisterRNG(seed)
+
+    @property
+    def rng(self) -> SpinSource:
+        return self._rng
+
+    def spin(self, round_number: Optional[int] = None):
+        """Spin the wheel.
 
-    def spin(self):
-        self._ball_position = randint(0, 36)
+        Args:
+            round_number: Round to produce the outcome of; needs a seekable
+                spin source such as CounterSpinSource
+        """
+        if round_number is not None:
+            self._rng.seek(round_number)
+        self._ball_position = self._rng.spin_position()
+
+    def spin_many(self, n: int) -> array:
+        """Spin the wheel n times in a single batched draw.
+
+        Args:
+            n: Number of spins to draw
+
+        Returns:
+            array('B') of n positions between 0-36.
+        """
+        self._ball_positions = self._rng.spin_positions(n)
+        if n:
+            self._ball_position = self._ball_positions[-1]
+        return self._ball_positions
 
     def get_ball_position(self) -> Tuple[int, Color]:
-        return (self._ball_position, WHEEL_POSITIONS[self._ball_position])
+        return (self._ball_position, WHEEL_LAYOUT.color(self._ball_position))
+
+    def get_ball_positions(self) -> Tuple[array, array]:
+        """Get the positions and color codes of the last batched spin.
+
+        Returns:
+            Tuple of array('B') positions and array('B') color codes (see COLOR_CODES).
+        """
+        colors = array("B", self._ball_positions.tobytes().translate(_POSITION_TO_COLOR_CODE))
+        return (self._ball_positions, colors)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for exact bet slip analytics.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+from fractions import Fraction
+
+from src.analytics import analyze_bets, net_by_position, risk_of_ruin
+from src.bet import Bet, BetType
+from src.player import Player
+from src.table import Table
+from src.wheel import Color
+
+
+class TestSlipAnalytics:
+    """Test class for the exact slip analytics."""
+
+    def setup_method(self):
+        """Setup method to provide a fresh player."""
+        self.player = Player(1000)
+
+    def test_single_red_bet(self):
+        """Test the exact distribution of a $10 red bet."""
+        analysis = analyze_bets([Bet(10, self.player, BetType.COLOR, Color.RED)])
+
+        assert analysis.total_bet == 10
+        assert analysis.distribution == {-10: Fraction(19, 37), 10: Fraction(18, 37)}
+        assert analysis.expected_value == Fraction(-10, 37)
+        assert analysis.variance == 100 - Fraction(10, 37) ** 2
+        assert analysis.risk_of_ruin is None
+
+    def test_single_number_bet(self):
+        """Test the exact distribution of a $1 number bet."""
+        analysis = analyze_bets([Bet(1, self.player, BetType.NUMBER, 17)])
+
+        assert analysis.distribution == {-1: Fraction(36, 37), 34: Fraction(1, 37)}
+        assert analysis.expected_value == Fraction(-2, 37)
+
+    def test_nets_match_table_settlement(self):
+        """Test that per-position nets equal what the table actually pays."""
+        slip = [
+            (5, BetType.COLOR, Color.BLACK),
+            (3, BetType.NUMBER, 0),
+            (2, BetType.NUMBER, 17),
+            (4, BetType.COLOR, Color.GREEN),
+            (1, BetType.NUMBER, 17),
+        ]
+        nets = net_by_position(Bet(a, self.player, t, v) for a, t, v in slip)
+
+        for position in range(37):
+            player = Player(0)
+            table = Table()
+            for amount, bet_type, bet_value in slip:
+                table.place_bet(Bet(amount, player, bet_type, bet_value))
+            table.wheel._ball_position = position
+            table._payout_bets()
+            assert nets[position] == player.get_balance() - 15
+
+    def test_risk_of_ruin_single_round(self):
+        """Test ruin when the whole bankroll is staked once."""
+        analysis = analyze_bets(
+            [Bet(10, self.player, BetType.COLOR, Color.RED)], balance=10
+        )
+        assert analysis.risk_of_ruin == Fraction(19, 37)
+
+    def test_risk_of_ruin_multiple_rounds(self):
+        """Test ruin over two rounds of a flat red bet against enumeration."""
+        nets = net_by_position([Bet(10, self.player, BetType.COLOR, Color.RED)])
+
+        ruined = 0
+        for first in range(37):
+            balance = 20 + nets[first]
+            if balance < 10:
+                ruined += 37
+                continue
+            for second in range(37):
+                if balance + nets[second] < 10:
+                    ruined += 1
+
+        assert risk_of_ruin(nets, 10, 20, rounds=2) == Fraction(ruined, 37 * 37)
+        assert risk_of_ruin(nets, 10, 5, rounds=3) == 1
+
+    def test_empty_slip(self):
+        """Test that an empty slip has a certain zero outcome."""
+        analysis = analyze_bets([])
+
+        assert analysis.distribution == {0: 1}
+        assert analysis.expected_value == 0
+        assert analysis.variance == 0
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestSlipAnalytics()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            test_instance.setup_method()
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
@@ -10,8 +10,8 @@ try:
 except ImportError:
     PYTEST_AVAILABLE = False
 
-from src.bet import Bet, BetType
-from src.wheel import Color
+from src.bet import Bet, BetType, PAYOUT_MATRIX, WINNING_ODDS, bet_slot, payout_odds, winning_odds
+from src.wheel import Color, WHEEL_POSITIONS
 from src.player import Player
 
 
@@ -67,6 +67,16 @@ class TestBetClass:
         assert bet.bet_value == Color.BLACK
         assert bet.color == Color.BLACK
 
+    def test_bet_uses_compact_slots(self):
+        """Test that bets carry no per-instance __dict__ but keep their public attributes."""
+        color_bet = Bet(10, self.player, BetType.COLOR, Color.RED)
+        number_bet = Bet(10, self.player, BetType.NUMBER, 5)
+
+        assert not hasattr(color_bet, "__dict__")
+        assert not hasattr(self.player, "__dict__")
+        assert color_bet.color == Color.RED
+        assert number_bet.color is None
+
     def test_bet_creation_edge_cases(self):
         """Test bet creation with edge case numbers."""
         # Test betting on 0
@@ -239,6 +249,44 @@ class TestBetClass:
             )
 
 
+class TestPayoutMatrix:
+    """Test class for the precomputed payout matrix."""
+
+    def test_matrix_matches_roulette_rules(self):
+        """Test every (bet, winning position) entry against the stated odds."""
+        for position in range(37):
+            winning_color = WHEEL_POSITIONS[position]
+            for color in Color:
+                expected = 0
+                if color == winning_color:
+                    expected = 35 if color == Color.GREEN else 2
+                assert payout_odds(BetType.COLOR, color, position) == expected
+            for number in range(37):
+                expected = 35 if number == position else 0
+                assert payout_odds(BetType.NUMBER, number, position) == expected
+
+    def test_winning_odds(self):
+        """Test the odds shown when confirming a bet."""
+        assert winning_odds(BetType.COLOR, Color.RED) == 2
+        assert winning_odds(BetType.COLOR, Color.BLACK) == 2
+        assert winning_odds(BetType.COLOR, Color.GREEN) == 35
+        assert winning_odds(BetType.NUMBER, 17) == 35
+        assert winning_odds(BetType.NUMBER, 37) == 0
+
+    def test_bet_slot_shapes(self):
+        """Test that every slot indexes a row of 37 winning positions."""
+        for bet_type, values in ((BetType.COLOR, list(Color)), (BetType.NUMBER, range(37))):
+            for value in values:
+                kind, target = bet_slot(bet_type, value)
+                assert len(PAYOUT_MATRIX[kind][target]) == 37
+                assert WINNING_ODDS[kind][target] == max(PAYOUT_MATRIX[kind][target])
+        assert bet_slot(None, 5) is None
+        assert bet_slot(BetType.NUMBER, -1) is None
+        assert bet_slot(BetType.COLOR, "red") is None
+        assert bet_slot(BetType.COLOR, 0) is None
+        assert bet_slot(BetType.NUMBER, Color.RED) is None
+
+
 def run_standalone_tests():
     """Run tests without pytest for environments where it's not available."""
     print("Running Bet class tests...")
@@ -250,12 +298,21 @@ def run_standalone_tests():
         "test_bet_type_enum_comparison",
     ]
 
+    # Test payout matrix
+    payout_matrix_test = TestPayoutMatrix()
+    payout_matrix_methods = [
+        "test_matrix_matches_roulette_rules",
+        "test_winning_odds",
+        "test_bet_slot_shapes",
+    ]
+
     # Test Bet class
     bet_class_test = TestBetClass()
     bet_class_methods = [
         "test_bet_creation_color_new_format",
         "test_bet_creation_number_new_format", 
         "test_bet_creation_backward_compatibility",
+        "test_bet_uses_compact_slots",
         "test_bet_creation_edge_cases",
         "test_color_bet_payout_winning_red",
         "test_color_bet_payout_winning_black",
@@ -285,6 +342,17 @@ def run_standalone_tests():
             print(f"✗ {method_name}: {e}")
             failed += 1
 
+    # Run payout matrix tests
+    for method_name in payout_matrix_methods:
+        try:
+            method = getattr(payout_matrix_test, method_name)
+            method()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
     # Run Bet class tests
     for method_name in bet_class_methods:
         try:
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Tests for the bit-packed round history.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+from random import Random
+
+from src import history as history_module
+from src.bet import Bet, BetType
+from src.history import HISTORY_HEADER, HISTORY_MAGIC, RoundHistory
+from src.player import Player
+from src.rng import MersenneTwisterRNG
+from src.table import Table
+from src.wheel import Color
+
+
+def _positions(count, seed=5):
+    rng = Random(seed)
+    return [rng.randrange(37) for _ in range(count)]
+
+
+class TestRoundHistory:
+    """Test class for packing, reading and serializing round histories."""
+
+    def test_append_and_extend_agree(self):
+        """Test that appending one at a time packs exactly like extending in bulk."""
+        for count in range(0, 20):
+            positions = _positions(count)
+            appended = RoundHistory()
+            for position in positions:
+                appended.append(position)
+            extended = RoundHistory(positions[:count // 3])
+            extended.extend(positions[count // 3:])
+
+            assert appended == extended
+            assert len(appended) == count
+            assert list(appended) == positions
+            assert appended.tolist() == positions
+
+    def test_random_access(self):
+        """Test that every position, including the unfilled tail, reads back."""
+        positions = _positions(103)
+        history = RoundHistory(positions)
+        assert [history[index] for index in range(103)] == positions
+        assert history[-1] == positions[-1]
+        assert history[-103] == positions[0]
+        if PYTEST_AVAILABLE:
+            with pytest.raises(IndexError):
+                history[103]
+            with pytest.raises(IndexError):
+                history[-104]
+
+    def test_slices_match_list_slices(self):
+        """Test that slices of any start, stop and step are packed histories."""
+        for count in (0, 3, 23, 24):
+            positions = _positions(count)
+            history = RoundHistory(positions)
+            for start in (None, 0, 1, 4, 7, -5, 30):
+                for stop in (None, 3, 8, 22, -1, -30):
+                    for step in (None, 1, 3, -1, -3):
+                        sliced = history[start:stop:step]
+                        assert isinstance(sliced, RoundHistory)
+                        assert sliced.tolist() == positions[start:stop:step]
+
+    def test_slices_unpack_only_covered_groups(self):
+        """Test that a slice unpacks the groups it covers rather than the whole history."""
+        positions = _positions(4002)
+        history = RoundHistory(positions)
+        unpacked = []
+        original = history_module._unpack
+
+        def counting_unpack(packed):
+            unpacked.append(len(packed))
+            return original(packed)
+
+        history_module._unpack = counting_unpack
+        try:
+            middle = history[2001:2010]
+            end = history[-3:]
+        finally:
+            history_module._unpack = original
+        assert middle.tolist() == positions[2001:2010]
+        assert end.tolist() == positions[-3:]
+        # Positions 2000-2011 and 3996-3999 (plus the two tail positions)
+        assert unpacked == [9, 3]
+
+    def test_packs_four_positions_in_three_bytes(self):
+        """Test the memory cost and the bit layout of a group."""
+        history = RoundHistory([1, 2, 3, 36] * 1000)
+        assert history.nbytes == 3000
+        word = 1 | 2 << 6 | 3 << 12 | 36 << 18
+        assert history.to_bytes()[HISTORY_HEADER.size:HISTORY_HEADER.size + 3] == word.to_bytes(3, "little")
+        assert RoundHistory([5]).nbytes == 3
+
+    def test_bytes_round_trip(self):
+        """Test that to_bytes and from_bytes round-trip partial and whole groups."""
+        for count in (0, 1, 3, 4, 5, 1000, 1001):
+            history = RoundHistory(_positions(count))
+            data = history.to_bytes()
+            assert len(data) == HISTORY_HEADER.size + 3 * ((count + 3) // 4)
+            restored = RoundHistory.from_bytes(data)
+            assert restored == history
+            restored.append(7)
+            assert restored.tolist() == history.tolist() + [7]
+
+    def test_rejects_invalid_input(self):
+        """Test that off-wheel positions and malformed data are refused."""
+        if not PYTEST_AVAILABLE:
+            return
+        history = RoundHistory([1, 2])
+        with pytest.raises(ValueError):
+            history.append(37)
+        with pytest.raises(ValueError):
+            history.append(-1)
+        with pytest.raises(ValueError):
+            history.extend([3, 4, 300])
+        with pytest.raises(ValueError):
+            history.extend([3, 37])
+        with pytest.raises(ValueError):
+            history.extend(3)
+        assert history.tolist() == [1, 2]
+        with pytest.raises(ValueError):
+            RoundHistory(3)
+
+        with pytest.raises(ValueError):
+            RoundHistory.from_bytes(b"NOPE" + bytes(8))
+        with pytest.raises(ValueError):
+            RoundHistory.from_bytes(RoundHistory([1, 2, 3, 4, 5]).to_bytes()[:-1])
+        with pytest.raises(ValueError):
+            RoundHistory.from_bytes(HISTORY_HEADER.pack(HISTORY_MAGIC, 4) + b"\xff\xff\xff")
+        with pytest.raises(ValueError):
+            # Position 37 in the tail
+            RoundHistory.from_bytes(HISTORY_HEADER.pack(HISTORY_MAGIC, 5) + bytes(3) + b"\x25\x00\x00")
+
+    def test_records_table_outcomes(self):
+        """Test that an attached history keeps every winning position of a table."""
+        table = Table(rng=MersenneTwisterRNG(11))
+        history = RoundHistory().attach(table)
+        player = Player(10_000)
+        positions = []
+        for _ in range(30):
+            table.reserve_and_place_bet(Bet(1, player, BetType.COLOR, Color.BLACK))
+            table.spin_wheel_and_payout()
+            positions.append(table.wheel.get_ball_position()[0])
+        history.detach(table)
+        table.spin_wheel_and_payout()
+
+        assert history.tolist() == positions
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestRoundHistory()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
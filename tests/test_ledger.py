@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Tests for the thread-safe round ledger.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import threading
+
+from src.bet import Bet, BetType
+from src.game_controller import GameController
+from src.ledger import Ledger
+from src.player import Player
+from src.table import Table
+from src.wheel import Color
+
+
+class _CountingPlayer(Player):
+    """Player that counts balance credits."""
+
+    __slots__ = ("credits",)
+
+    def __init__(self, balance):
+        super().__init__(balance)
+        self.credits = 0
+
+    def add_to_balance(self, amount):
+        self.credits += 1
+        super().add_to_balance(amount)
+
+
+class TestLedger:
+    """Test class for atomic reserve, refund and batched settlement."""
+
+    def test_concurrent_reservations_never_overdraw(self):
+        """Test that many threads staking for one player cannot overdraw it."""
+        player = Player(1000)
+        ledger = Ledger()
+        accepted = []
+
+        def stake():
+            for _ in range(100):
+                try:
+                    ledger.reserve(player, 3)
+                    accepted.append(3)
+                except ValueError:
+                    pass
+
+        threads = [threading.Thread(target=stake) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(accepted) == 999
+        assert player.get_balance() == 1
+        assert ledger.staked(player) == 999
+
+    def test_concurrent_settle_and_commit_lose_no_winnings(self):
+        """Test that winnings recorded while another thread commits are paid exactly once."""
+        ledger = Ledger()
+        player = Player(0)
+        settles = 20_000
+
+        def settle():
+            for _ in range(settles):
+                ledger.settle(player, 1)
+
+        def commit():
+            while settler.is_alive():
+                ledger.commit()
+
+        settler = threading.Thread(target=settle)
+        committer = threading.Thread(target=commit)
+        settler.start()
+        committer.start()
+        settler.join()
+        committer.join()
+        ledger.commit()
+
+        assert player.get_balance() == settles
+
+    def test_refund_is_limited_to_reserved_stake(self):
+        """Test that refunds give back reserved stakes and nothing more."""
+        player = Player(100)
+        ledger = Ledger()
+        ledger.reserve(player, 40)
+        ledger.refund(player, 15)
+
+        assert player.get_balance() == 75
+        assert ledger.staked(player) == 25
+        if PYTEST_AVAILABLE:
+            with pytest.raises(ValueError):
+                ledger.refund(player, 26)
+            with pytest.raises(ValueError):
+                ledger.refund(Player(0), 1)
+            with pytest.raises(ValueError):
+                ledger.reserve(player, 0)
+
+    def test_commit_applies_one_update_per_player(self):
+        """Test that a round's winnings are paid in one credit per player."""
+        alice, bob = _CountingPlayer(100), _CountingPlayer(100)
+        ledger = Ledger()
+        for _ in range(5):
+            ledger.reserve(alice, 10)
+            ledger.settle(alice, 20)
+        ledger.reserve(bob, 10)
+        ledger.settle(bob, 0)
+
+        entries = {entry.player: entry for entry in ledger.commit()}
+
+        assert alice.credits == 1 and alice.get_balance() == 150
+        assert bob.credits == 0 and bob.get_balance() == 90
+        assert (entries[alice].staked, entries[alice].winnings) == (50, 100)
+        assert ledger.staked(alice) == 0
+
+    def test_table_settles_through_the_ledger(self):
+        """Test that a table pays each player once and reports the round's entries."""
+        player = _CountingPlayer(100)
+        table = Table()
+        table.reserve_and_place_bet(Bet(10, player, BetType.COLOR, Color.RED))
+        table.reserve_and_place_bet(Bet(5, player, BetType.NUMBER, 1))
+        table.wheel._ball_position = 1  # Red 1: both bets win
+
+        entries = table._payout_bets()
+
+        assert player.credits == 1
+        assert player.get_balance() == 85 + 20 + 175
+        assert [(entry.staked, entry.winnings) for entry in entries] == [(15, 195)]
+
+    def test_failed_placement_is_refunded(self):
+        """Test that a bet the table rejects leaves the balance untouched."""
+        player = Player(2 ** 64)
+        table = Table()
+        # Too large for the table's 64-bit amount column
+        try:
+            table.reserve_and_place_bet(Bet(2 ** 63, player, BetType.COLOR, Color.RED))
+        except OverflowError:
+            pass
+
+        assert player.get_balance() == 2 ** 64
+        assert table.ledger.staked(player) == 0
+        assert table.bets == []
+
+    def test_bet_intake_does_not_take_the_ledger_lock(self):
+        """Test that table intake only takes the table and player locks."""
+        player = Player(100)
+        table = Table()
+        placed = threading.Event()
+
+        def place():
+            table.reserve_and_place_bet(Bet(10, player, BetType.COLOR, Color.RED))
+            table.place_bet(Bet(5, player, BetType.NUMBER, 17))
+            placed.set()
+
+        with table.ledger._lock:
+            thread = threading.Thread(target=place, daemon=True)
+            thread.start()
+            assert placed.wait(10)
+        entries = table.spin_wheel_and_payout()
+        assert [(entry.player, entry.staked) for entry in entries] == [(player, 15)]
+
+    def test_stakes_are_summed_per_player_at_settlement(self):
+        """Test that every placed stake is reported, including bets that can never win."""
+        alice = Player(0)
+        bob = Player(0)
+        table = Table()
+        table.place_bet(Bet(10, alice, BetType.COLOR, Color.RED))
+        table.place_bet(Bet(4, bob, BetType.NUMBER, 3))
+        table.place_bet(Bet(6, alice, BetType.NUMBER, 3))
+        table.place_bet(Bet(2, bob, BetType.NUMBER, 37))
+
+        entries = {entry.player: entry.staked for entry in table.spin_wheel_and_payout()}
+        assert entries == {alice: 16, bob: 6}
+
+    def test_controller_rejects_unaffordable_bet_without_manual_refund(self):
+        """Test that the betting flow leaves the balance intact when a stake fails."""
+        controller = GameController()
+        controller.player = Player(10)
+        controller.display_message = lambda message: None
+        controller.get_user_input = lambda prompt: "red"
+
+        assert controller._handle_color_betting(25) is False
+        assert controller.player.get_balance() == 10
+        assert controller._handle_color_betting(10) is True
+        assert controller.player.get_balance() == 0
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestLedger()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
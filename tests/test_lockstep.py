@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the lockstep many-session simulator.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+from src.bet import Bet, BetType
+from src.lockstep import FLAT, MARTINGALE, LockstepSimulator
+from src.player import Player
+from src.wheel import Color, Wheel, WHEEL_POSITIONS
+
+
+def _replay_single_session(seed, balance, bet_type, bet_value, base_stake, martingale, rounds):
+    """Play one session with Player and Bet, drawing spins like the simulator does."""
+    wheel = Wheel(seed)
+    player = Player(balance)
+    stake = base_stake
+    played = 0
+    for _ in range(rounds):
+        try:
+            player.subtract_from_balance(stake)
+        except ValueError:
+            break
+        position = wheel.spin_many(1)[0]
+        before = player.get_balance()
+        Bet(stake, player, bet_type, bet_value).payout(WHEEL_POSITIONS[position], position)
+        won = player.get_balance() > before
+        played += 1
+        if martingale:
+            stake = base_stake if won else stake * 2
+    return player.get_balance(), played
+
+
+class TestLockstepSimulator:
+    """Test class for lockstep simulation."""
+
+    def test_single_session_matches_player_and_bet(self):
+        """Test that the array rules reproduce Player and Bet exactly."""
+        cases = [
+            (BetType.COLOR, Color.RED, 10, False),
+            (BetType.COLOR, Color.BLACK, 1, True),
+            (BetType.NUMBER, 17, 5, False),
+        ]
+        for seed, (bet_type, bet_value, stake, martingale) in enumerate(cases):
+            progression = MARTINGALE if martingale else FLAT
+            simulator = LockstepSimulator(
+                1, 200, bet_type, bet_value, stake, progression, seed=seed
+            ).run(300)
+            balance, played = _replay_single_session(
+                seed, 200, bet_type, bet_value, stake, martingale, 300
+            )
+
+            assert simulator.balances[0] == balance
+            assert simulator.rounds_played[0] == played
+
+    def test_sessions_end_when_stake_is_rejected(self):
+        """Test that busted or under-funded sessions are masked out."""
+        simulator = LockstepSimulator(500, 20, BetType.NUMBER, 0, 10, seed=1)
+        simulator.run(200)
+
+        assert 0 < simulator.busted() < 500
+        assert simulator.active_sessions + simulator.busted() == 500
+        for balance, played in zip(simulator.balances, simulator.rounds_played):
+            if balance < 10:
+                assert played < 200
+            else:
+                assert played == 200
+
+    def test_no_sessions_start_if_stake_exceeds_balance(self):
+        """Test that an unaffordable opening stake is rejected."""
+        simulator = LockstepSimulator(10, 5, BetType.COLOR, Color.RED, 10, seed=2)
+
+        assert simulator.active_sessions == 0
+        assert simulator.step() == 0
+        assert list(simulator.rounds_played) == [0] * 10
+
+    def test_results_are_reproducible(self):
+        """Test that a seed fixes every session's path."""
+        first = LockstepSimulator(1000, 100, BetType.COLOR, Color.RED, 5, MARTINGALE, seed=9).run(50)
+        second = LockstepSimulator(1000, 100, BetType.COLOR, Color.RED, 5, MARTINGALE, seed=9).run(50)
+
+        assert first.balances == second.balances
+        assert first.quantile(0.01) <= first.quantile(0.5) <= first.quantile(0.99)
+
+    def test_invalid_configuration(self):
+        """Test that bets the table would reject are refused."""
+        if not PYTEST_AVAILABLE:
+            return
+        with pytest.raises(ValueError):
+            LockstepSimulator(1, 100, BetType.NUMBER, 37, 5)
+        with pytest.raises(ValueError):
+            LockstepSimulator(1, 100, BetType.COLOR, Color.RED, 0)
+        with pytest.raises(ValueError):
+            LockstepSimulator(1, 100, BetType.COLOR, Color.RED, 5, progression="paroli")
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestLockstepSimulator()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the metrics registry and its table and player metrics.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import os
+import tempfile
+import threading
+import urllib.request
+
+from src.bet import Bet, BetType
+from src.metrics import MetricsRegistry, PlayerMetrics, TableMetrics
+from src.player import Player
+from src.rng import MersenneTwisterRNG
+from src.table import Table
+from src.wheel import Color
+
+
+def _parse(text):
+    """Map sample name (with labels) to value, skipping comments."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+class TestMetrics:
+    """Test class for sharded metrics and their exposition."""
+
+    def test_sharded_counter_sums_every_thread(self):
+        """Test that lock-free per-thread increments add up exactly."""
+        counter = MetricsRegistry().counter("hits_total", "Hits.")
+
+        def work():
+            for _ in range(10_000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(5)
+        assert counter.value == 80_005
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Test the Prometheus text of a histogram, a counter and a gauge."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", (0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+        registry.counter("events_total", "Events.").inc(2)
+        registry.gauge("ratio", "Ratio.", lambda: 0.25)
+
+        text = registry.render()
+        assert "# TYPE latency_seconds histogram" in text
+        assert "# HELP events_total Events." in text
+        samples = _parse(text)
+        assert samples['latency_seconds_bucket{le="0.1"}'] == 2
+        assert samples['latency_seconds_bucket{le="1"}'] == 3
+        assert samples['latency_seconds_bucket{le="+Inf"}'] == 4
+        assert samples["latency_seconds_count"] == 4
+        assert samples["latency_seconds_sum"] == 3.65
+        assert samples["events_total"] == 2
+        assert samples["ratio"] == 0.25
+        if PYTEST_AVAILABLE:
+            with pytest.raises(ValueError):
+                registry.counter("events_total", "Again.")
+            with pytest.raises(ValueError):
+                registry.histogram("bad", "Bad.", (1, 0.5))
+
+    def test_table_and_player_metrics_track_rounds(self):
+        """Test rounds, bets, stakes, payouts and house edge against the ledger."""
+        registry = MetricsRegistry()
+        table_metrics = TableMetrics(registry)
+        player_metrics = PlayerMetrics(registry)
+        table = Table(rng=MersenneTwisterRNG(6), metrics=table_metrics)
+        player = Player(0, metrics=player_metrics)
+        player.add_to_balance(10_000)
+
+        staked = paid = 0
+        for _ in range(40):
+            table.reserve_and_place_bet(Bet(10, player, BetType.COLOR, Color.RED))
+            table.reserve_and_place_bet(Bet(2, player, BetType.NUMBER, 17))
+            for _, player_staked, winnings in table.spin_wheel_and_payout():
+                staked += player_staked
+                paid += winnings
+
+        samples = _parse(registry.render())
+        assert samples["roulette_rounds_total"] == 40
+        assert samples["roulette_bets_total"] == 80
+        assert samples["roulette_staked_total"] == staked == 480
+        assert samples["roulette_paid_total"] == paid
+        assert samples['roulette_bets_per_round_bucket{le="2"}'] == 40
+        assert samples["roulette_settlement_seconds_count"] == 40
+        assert abs(samples["roulette_house_edge"] - (staked - paid) / staked) < 1e-9
+        assert samples["roulette_rounds_per_second"] > 0
+        assert samples["roulette_player_debited_total"] == staked
+        assert samples["roulette_player_credited_total"] == 10_000 + paid
+        assert player.get_balance() == 10_000 - staked + paid
+
+    def test_place_bet_stakes_count_towards_house_edge(self):
+        """Test that bets placed without a ledger reservation are counted as staked."""
+        registry = MetricsRegistry()
+        table = Table(rng=MersenneTwisterRNG(6), metrics=TableMetrics(registry))
+        player = Player(1000)
+        player.subtract_from_balance(10)
+        table.place_bet(Bet(10, player, BetType.COLOR, Color.RED))
+        table.spin_wheel_and_payout()
+
+        samples = _parse(registry.render())
+        paid = player.get_balance() - 990
+        assert samples["roulette_staked_total"] == 10
+        assert samples["roulette_paid_total"] == paid
+        assert samples["roulette_house_edge"] == (10 - paid) / 10
+
+    def test_metrics_are_optional(self):
+        """Test that tables and players without metrics play as before."""
+        table = Table(rng=MersenneTwisterRNG(6))
+        player = Player(100)
+        table.reserve_and_place_bet(Bet(10, player, BetType.COLOR, Color.BLACK))
+        table.spin_wheel_and_payout()
+        assert table.metrics is None and player.metrics is None
+
+    def test_text_file_and_http_endpoint(self):
+        """Test that the metrics can be written to a file and scraped over HTTP."""
+        registry = MetricsRegistry()
+        registry.counter("scrapes_total", "Scrapes.").inc(3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "roulette.prom")
+            registry.write(path)
+            with open(path) as handle:
+                assert _parse(handle.read()) == {"scrapes_total": 3}
+            assert os.listdir(directory) == ["roulette.prom"]
+
+        host, port = registry.serve()
+        try:
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert _parse(response.read().decode()) == {"scrapes_total": 3}
+        finally:
+            registry.close()
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestMetrics()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
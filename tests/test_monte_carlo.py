@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the multi-core Monte Carlo runner.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import argparse
+
+from src.monte_carlo import (
+    SessionStats,
+    add_arguments,
+    build_policy_factory,
+    gil_enabled,
+    resolve_backend,
+    run_from_args,
+    run_sessions,
+    session_rng,
+    simulate,
+    simulate_lockstep,
+)
+
+
+class TestMonteCarlo:
+    """Test class for sharded Monte Carlo simulation."""
+
+    def test_session_streams_are_distinct_and_stable(self):
+        """Test that each session gets its own reproducible stream."""
+        draws = [session_rng("mt19937", 7, index).randbytes(16) for index in range(100)]
+
+        assert len(set(draws)) == 100
+        assert draws == [session_rng("mt19937", 7, index).randbytes(16) for index in range(100)]
+        assert session_rng("mt19937", 8, 0).randbytes(16) != draws[0]
+
+    def test_results_independent_of_worker_count(self):
+        """Test that sharding across processes does not change the statistics."""
+        factory = build_policy_factory("red", 10)
+        single = simulate(factory, 12, 30, 100, master_seed=5, workers=1)
+        pooled = simulate(factory, 12, 30, 100, master_seed=5, workers=3)
+
+        assert single == pooled
+        assert single.sessions == 12
+
+    def test_every_rng_backend_is_reproducible_across_workers(self):
+        """Test worker-count independence for each RNG backend."""
+        factory = build_policy_factory("green", 2)
+        for rng_kind in ("mt19937", "pcg64", "counter"):
+            single = simulate(factory, 6, 20, 50, master_seed=2, workers=1, rng_kind=rng_kind)
+            pooled = simulate(factory, 6, 20, 50, master_seed=2, workers=2, rng_kind=rng_kind)
+            assert single == pooled
+
+    def test_thread_backend_matches_process_backend(self):
+        """Test that thread workers produce the same statistics as processes."""
+        factory = build_policy_factory("martingale", 2)
+        threaded = simulate(factory, 10, 25, 80, master_seed=4, workers=3, backend="thread")
+        pooled = simulate(factory, 10, 25, 80, master_seed=4, workers=2, backend="process")
+
+        assert threaded == pooled
+
+    def test_auto_backend_follows_the_gil(self):
+        """Test that threads are only chosen on free-threaded builds."""
+        assert resolve_backend("auto") == ("process" if gil_enabled() else "thread")
+        assert resolve_backend("thread") == "thread"
+        if PYTEST_AVAILABLE:
+            with pytest.raises(ValueError):
+                resolve_backend("fibers")
+
+    def test_shards_merge_to_full_run(self):
+        """Test that merging shard statistics equals one run over all sessions."""
+        factory = build_policy_factory("martingale", 1)
+        full = run_sessions(factory, 0, 10, 3, 50, 100)
+        merged = SessionStats()
+        merged.merge(run_sessions(factory, 0, 4, 3, 50, 100))
+        merged.merge(run_sessions(factory, 4, 10, 3, 50, 100))
+
+        assert merged == full
+
+    def test_stats_are_consistent(self):
+        """Test the bookkeeping of the aggregated statistics."""
+        stats = simulate(build_policy_factory("number", 5), 20, 40, 50, master_seed=1, workers=1)
+        summary = stats.to_dict()
+
+        assert summary["sessions"] == 20
+        assert stats.final_balance_sum == 20 * 50 - stats.total_bet + stats.total_payout
+        assert summary["min_final_balance"] <= summary["mean_final_balance"] <= summary["max_final_balance"]
+        assert 0 <= summary["bust_rate"] <= 1
+
+    def test_lockstep_results_independent_of_workers_and_backend(self):
+        """Test that lockstep shards merge to the same statistics however they are spread."""
+        for strategy in ("red", "number", "martingale"):
+            single = simulate_lockstep(strategy, 2, 50, 40, 60, master_seed=3, workers=1, shard_size=16)
+            threaded = simulate_lockstep(
+                strategy, 2, 50, 40, 60, master_seed=3, workers=3, backend="thread", shard_size=16
+            )
+            pooled = simulate_lockstep(
+                strategy, 2, 50, 40, 60, master_seed=3, workers=2, backend="process", shard_size=16
+            )
+            assert single == threaded == pooled
+            assert single.sessions == 50
+
+    def test_lockstep_stats_are_consistent(self):
+        """Test that lockstep stakes and payouts account for the final balances."""
+        stats = simulate_lockstep("black", 5, 40, 30, 100, master_seed=9, shard_size=7)
+
+        assert stats.final_balance_sum == 40 * 100 - stats.total_bet + stats.total_payout
+        assert 0 < stats.rounds <= 40 * 30
+        assert stats.total_bet == 5 * stats.rounds
+
+    def test_lockstep_command_line_flag(self):
+        """Test that --lockstep runs the lockstep mode and rejects a spin tape."""
+        parser = argparse.ArgumentParser()
+        add_arguments(parser)
+        args = parser.parse_args(
+            ["--lockstep", "--sessions", "8", "--rounds", "10", "--seed", "2", "--workers", "1"]
+        )
+        assert args.lockstep
+        assert run_from_args(args) == simulate_lockstep("red", 10, 8, 10, 1000, master_seed=2, workers=1)
+        assert not parser.parse_args([]).lockstep
+        if PYTEST_AVAILABLE:
+            with pytest.raises(ValueError):
+                run_from_args(parser.parse_args(["--lockstep", "--tape", "spins.tape"]))
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestMonteCarlo()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
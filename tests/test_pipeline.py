@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the double-buffered round pipeline.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import threading
+
+from src.bet import Bet, BetType
+from src.pipeline import RoundPipeline
+from src.player import Player
+from src.rng import MersenneTwisterRNG, SpinSource
+from src.table import Table
+from src.wheel import Color
+
+
+class _GatedSource(SpinSource):
+    """Spin source that holds every spin until released."""
+
+    def __init__(self, seed):
+        self._rng = MersenneTwisterRNG(seed)
+        self.spinning = threading.Event()
+        self.release = threading.Event()
+
+    def spin_position(self):
+        self.spinning.set()
+        self.release.wait(5)
+        return self._rng.spin_position()
+
+
+def _place_slip(table, player, round_index):
+    table.reserve_and_place_bet(Bet(10, player, BetType.COLOR, Color.RED))
+    table.reserve_and_place_bet(Bet(1, player, BetType.NUMBER, round_index % 37))
+
+
+class TestRoundPipeline:
+    """Test class for settling rounds while the next round takes bets."""
+
+    def test_pipeline_matches_inline_settlement(self):
+        """Test that pipelined rounds settle exactly like inline rounds."""
+        inline_player, piped_player = Player(1000), Player(1000)
+        inline_table = Table(rng=MersenneTwisterRNG(12))
+        piped_table = Table(rng=MersenneTwisterRNG(12))
+
+        inline_positions = []
+        for round_index in range(40):
+            _place_slip(inline_table, inline_player, round_index)
+            inline_table.spin_wheel_and_payout()
+            inline_positions.append(inline_table.wheel.get_ball_position()[0])
+
+        with RoundPipeline(piped_table) as pipeline:
+            futures = []
+            for round_index in range(40):
+                _place_slip(piped_table, piped_player, round_index)
+                futures.append(pipeline.no_more_bets())
+            settled = [future.result() for future in futures]
+
+        assert [round_.winning_position for round_ in settled] == inline_positions
+        assert [round_.round_number for round_ in settled] == list(range(40))
+        assert piped_player.get_balance() == inline_player.get_balance()
+
+    def test_bets_accepted_while_previous_round_settles(self):
+        """Test that the cut-off sends later bets to the next round."""
+        source = _GatedSource(3)
+        table = Table(rng=source)
+        player = Player(100)
+
+        with RoundPipeline(table) as pipeline:
+            table.reserve_and_place_bet(Bet(10, player, BetType.COLOR, Color.BLACK))
+            first = pipeline.no_more_bets()
+            assert source.spinning.wait(5)
+
+            # Round 0 is mid-spin; this bet goes to round 1
+            table.reserve_and_place_bet(Bet(20, player, BetType.COLOR, Color.RED))
+            assert [bet.amount for bet in table.bets] == [20]
+            assert not first.done()
+
+            source.release.set()
+            round_0 = first.result(5)
+            round_1 = pipeline.no_more_bets().result(5)
+
+        assert [entry.staked for entry in round_0.entries] == [10]
+        assert [entry.staked for entry in round_1.entries] == [20]
+        expected = 70
+        expected += 20 if round_0.winning_color == Color.BLACK else 0
+        expected += 40 if round_1.winning_color == Color.RED else 0
+        assert player.get_balance() == expected
+
+    def test_round_buffers_are_reused(self):
+        """Test that the table alternates between two round buffers."""
+        table = Table(rng=MersenneTwisterRNG(1))
+        first = table.close_betting()
+        table.settle_round(first)
+        second = table.close_betting()
+        table.settle_round(second)
+
+        assert table.close_betting() is first
+        assert first.bets == [] and len(first.settlement) == 0
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestRoundPipeline()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
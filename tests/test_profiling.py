@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Tests for the round phase profiler.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import json
+import os
+import tempfile
+
+from main import parse_args
+from src.bet import BetType
+from src.game_controller import GameController
+from src.profiling import PHASES, Histogram, Profiler
+from src.rng import MersenneTwisterRNG
+from src.simulation import FlatBetPolicy
+from src.wheel import Color, Wheel
+
+
+def _play(rounds=20):
+    controller = GameController()
+    controller.table.wheel = Wheel(rng=MersenneTwisterRNG(2))
+    return controller.run_headless(FlatBetPolicy(BetType.COLOR, Color.RED, 1), rounds, 1000)
+
+
+class _Flaky:
+    def run(self, fail):
+        if fail:
+            raise RuntimeError("boom")
+        return "ran"
+
+
+class TestProfiler:
+    """Test class for phase timers, counters and their dumps."""
+
+    def test_disabled_profiler_leaves_phases_untouched(self):
+        """Test that a disabled profiler neither wraps methods nor records anything."""
+        originals = {name: owner.__dict__[attribute] for name, (owner, attribute) in PHASES.items()}
+        profiler = Profiler()
+        with profiler.timer("block"):
+            pass
+        profiler.count("events")
+        _play(3)
+
+        assert profiler.summary()["timers"] == {}
+        assert profiler.summary()["counters"] == {}
+        for name, (owner, attribute) in PHASES.items():
+            assert owner.__dict__[attribute] is originals[name]
+
+    def test_enabled_profiler_times_every_phase_call(self):
+        """Test that headless rounds are timed per phase and methods are restored."""
+        spin = Wheel.__dict__["spin"]
+        profiler = Profiler().enable()
+        try:
+            assert Wheel.__dict__["spin"] is not spin
+            results = _play(20)
+            with profiler.timer("block"):
+                profiler.count("custom", 3)
+        finally:
+            profiler.disable()
+        assert Wheel.__dict__["spin"] is spin
+
+        timers = profiler.summary()["timers"]
+        assert timers["spin"]["count"] == len(results)
+        assert timers["settle"]["count"] == len(results)
+        assert timers["place_bet"]["count"] == len(results)
+        assert timers["block"]["count"] == 1
+        assert profiler.summary()["counters"] == {"custom": 3}
+
+        _play(5)
+        assert profiler.summary()["timers"]["spin"]["count"] == len(results)
+
+    def test_errors_are_counted_and_reraised(self):
+        """Test that a failing phase is timed, counted as an error and still raises."""
+        profiler = Profiler().enable({"flaky": (_Flaky, "run")})
+        try:
+            assert _Flaky().run(False) == "ran"
+            if PYTEST_AVAILABLE:
+                with pytest.raises(RuntimeError):
+                    _Flaky().run(True)
+        finally:
+            profiler.disable()
+        summary = profiler.summary()
+        if PYTEST_AVAILABLE:
+            assert summary["timers"]["flaky"]["count"] == 2
+            assert summary["counters"] == {"flaky.errors": 1}
+        assert _Flaky.__dict__["run"].__name__ == "run"
+        assert not hasattr(_Flaky.__dict__["run"], "__wrapped__")
+
+    def test_second_profiler_cannot_wrap_timed_phases(self):
+        """Test that overlapping profilers never leave a wrapper installed."""
+        spin = Wheel.__dict__["spin"]
+        first = Profiler().enable()
+        second = Profiler()
+        try:
+            if PYTEST_AVAILABLE:
+                with pytest.raises(RuntimeError):
+                    second.enable()
+            assert not second.enabled
+        finally:
+            first.disable()
+            second.disable()
+        assert Wheel.__dict__["spin"] is spin
+
+        second.enable()
+        second.disable()
+        assert Wheel.__dict__["spin"] is spin
+        _play(3)
+        first.record("spin", 0, 10)
+        assert first.summary()["timers"] == {}
+        assert second.summary()["timers"] == {}
+
+    def test_histogram_buckets_and_percentiles(self):
+        """Test power-of-two buckets, bounds and nearest-rank percentiles."""
+        histogram = Histogram()
+        for duration in [100] * 98 + [5000, 70000]:
+            histogram.add(duration)
+        assert histogram.count == 100
+        assert histogram.min_ns == 100 and histogram.max_ns == 70000
+        assert histogram.percentile(0.5) == 128
+        assert histogram.percentile(0.99) == 8192
+        assert histogram.percentile(1.0) == 70000
+        assert sum(histogram.to_dict()["histogram_us"].values()) == 100
+
+    def test_trace_events_are_capped(self):
+        """Test that calls beyond the trace cap still reach the histograms."""
+        profiler = Profiler(max_trace_events=5).enable({})
+        try:
+            for _ in range(8):
+                with profiler.timer("tick"):
+                    pass
+        finally:
+            profiler.disable()
+        assert profiler.summary()["timers"]["tick"]["count"] == 8
+        assert profiler.dropped_trace_events == 3
+        assert len(profiler.chrome_trace()["traceEvents"]) == 5
+
+    def test_dumps_json_and_chrome_trace(self):
+        """Test that both output formats are valid JSON with the recorded calls."""
+        profiler = Profiler().enable()
+        try:
+            results = _play(4)
+            profiler.count("rounds", len(results))
+        finally:
+            profiler.disable()
+        with tempfile.TemporaryDirectory() as directory:
+            summary_path = os.path.join(directory, "profile.json")
+            trace_path = os.path.join(directory, "profile.trace.json")
+            profiler.dump(summary_path)
+            profiler.dump(trace_path, "chrome")
+            with open(summary_path) as handle:
+                summary = json.load(handle)
+            with open(trace_path) as handle:
+                trace = json.load(handle)
+
+        assert summary["timers"]["spin"]["count"] == len(results)
+        spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        assert sum(1 for event in spans if event["name"] == "settle") == len(results)
+        assert trace["traceEvents"][-1]["args"] == {"rounds": len(results)}
+        if PYTEST_AVAILABLE:
+            with pytest.raises(ValueError):
+                profiler.dump(summary_path, "xml")
+
+    def test_command_line_option(self):
+        """Test that main.py accepts --profile for the game and subcommands."""
+        args = parse_args(["--profile", "out.json", "--profile-format", "chrome", "simulate"])
+        assert args.profile == "out.json"
+        assert args.profile_format == "chrome"
+        assert parse_args([]).profile is None
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestProfiler()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
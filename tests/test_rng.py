@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable RNG backends.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+from random import Random
+
+from src.rng import (
+    CounterRNG,
+    CounterSpinSource,
+    MersenneTwisterRNG,
+    PCG64RNG,
+    RNG_BACKENDS,
+    RNGBackend,
+    SpinSource,
+    make_rng,
+)
+from src.table import Table
+from src.wheel import Wheel
+
+
+class TestRNGBackends:
+    """Test class for RNG backends and their child streams."""
+
+    def test_mersenne_twister_matches_stdlib(self):
+        """Test that the default backend reproduces random.randint(0, 36)."""
+        rng = MersenneTwisterRNG(123)
+        reference = Random(123)
+
+        assert [rng.spin_position() for _ in range(200)] == [
+            reference.randint(0, 36) for _ in range(200)
+        ]
+
+    def test_backends_are_seedable(self):
+        """Test that each backend replays its draws under a fixed seed."""
+        for kind in RNG_BACKENDS:
+            first = make_rng(kind, 42)
+            second = make_rng(kind, 42)
+            assert first.spin_positions(500) == second.spin_positions(500)
+            assert [first.spin_position() for _ in range(50)] == [
+                second.spin_position() for _ in range(50)
+            ]
+            assert make_rng(kind, 43).randbytes(32) != make_rng(kind, 42).randbytes(32)
+
+    def test_backends_cover_all_positions(self):
+        """Test that every backend spreads spins over the whole wheel."""
+        for kind in RNG_BACKENDS:
+            counts = [0] * 37
+            for position in make_rng(kind, 1).spin_positions(37 * 300):
+                counts[position] += 1
+            assert all(200 < count < 400 for count in counts), kind
+
+    def test_children_are_independent_and_deterministic(self):
+        """Test that spawned streams differ from each other and from their parent."""
+        for kind in RNG_BACKENDS:
+            parent = make_rng(kind, 7)
+            children = parent.spawn(4)
+            draws = [child.randbytes(16) for child in children]
+
+            assert len(set(draws)) == 4
+            assert make_rng(kind, 7).randbytes(16) not in draws
+            assert make_rng(kind, 7).child(2).randbytes(16) == draws[2]
+            # Spawning again continues with fresh indexes
+            assert parent.spawn(1)[0].spawn_key == (4,)
+
+    def test_pcg64_advance_matches_stepping(self):
+        """Test that PCG64 jump-ahead lands on the same state as stepping."""
+        stepped = PCG64RNG(5)
+        jumped = PCG64RNG(5)
+        for _ in range(1000):
+            stepped.next_uint64()
+        jumped.advance(1000)
+
+        assert stepped.next_uint64() == jumped.next_uint64()
+
+    def test_counter_jump_is_random_access(self):
+        """Test that the counter backend can jump straight to any byte."""
+        sequential = CounterRNG(9)
+        data = sequential.randbytes(1000)
+
+        jumped = CounterRNG(9)
+        jumped.jump_to(613)
+        assert jumped.randbytes(100) == data[613:713]
+        assert jumped.tell() == 713
+
+        skipped = CounterRNG(9)
+        skipped.randbytes(10)
+        skipped.advance(90)
+        assert skipped.randbytes(5) == data[100:105]
+
+    def test_wheel_and_table_accept_backends(self):
+        """Test that wheels and tables draw from a supplied backend."""
+        wheel = Wheel(rng=make_rng("pcg64", 3))
+        expected = make_rng("pcg64", 3).spin_positions(20)
+        assert wheel.spin_many(20) == expected
+
+        table = Table(rng=make_rng("counter", 3))
+        table.spin_wheel_and_payout()
+        assert table.wheel.get_ball_position()[0] == make_rng("counter", 3).spin_position()
+
+    def test_counter_spin_source_is_random_access(self):
+        """Test that any round of any session can be computed directly."""
+        source = CounterSpinSource(11, session=77)
+        sequence = [source.spin_position() for _ in range(300)]
+
+        assert [source.position_at(round_number) for round_number in range(300)] == sequence
+        assert source.tell() == 300
+        assert CounterSpinSource(11, 77).spin_positions(300).tolist() == sequence
+        assert CounterSpinSource(11, 78).spin_positions(300).tolist() != sequence
+        assert source.for_session(78).position_at(5) == CounterSpinSource(11, 78).position_at(5)
+        assert all(0 <= source.position_at(8_412_993 + offset) <= 36 for offset in range(50))
+
+    def test_counter_spin_source_covers_all_positions(self):
+        """Test that the counter spin source spreads rounds over the whole wheel."""
+        counts = [0] * 37
+        for position in CounterSpinSource(3).spin_positions(37 * 300):
+            counts[position] += 1
+        assert all(200 < count < 400 for count in counts)
+
+    def test_table_replays_a_round(self):
+        """Test that a table can spin the outcome of a chosen round."""
+        table = Table(rng=CounterSpinSource(5, session=2))
+        table.spin_wheel_and_payout(round_number=8_412_993)
+
+        assert table.wheel.get_ball_position()[0] == CounterSpinSource(5, 2).position_at(8_412_993)
+        assert table.wheel.rng.tell() == 8_412_994
+        table.spin_wheel_and_payout()
+        assert table.wheel.get_ball_position()[0] == CounterSpinSource(5, 2).position_at(8_412_994)
+
+    def test_base_classes_are_abstract(self):
+        """Test that sources must implement the methods the wheel draws with."""
+        if not PYTEST_AVAILABLE:
+            return
+        with pytest.raises(TypeError):
+            SpinSource()
+        with pytest.raises(TypeError):
+            RNGBackend(1)
+
+        class Constant(SpinSource):
+            def spin_position(self):
+                return 7
+
+        assert Constant().spin_positions(3).tolist() == [7, 7, 7]
+
+    def test_seek_requires_a_seekable_source(self):
+        """Test that replaying a round on a sequential backend is refused."""
+        if not PYTEST_AVAILABLE:
+            return
+        with pytest.raises(NotImplementedError):
+            Wheel(rng=MersenneTwisterRNG(1)).spin(round_number=3)
+        with pytest.raises(ValueError):
+            CounterSpinSource(1).position_at(-1)
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestRNGBackends()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for the binary round log.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import gc
+import os
+import tempfile
+
+from src.bet import Bet, BetType
+from src.player import Player
+from src.rng import MersenneTwisterRNG
+from src.round_log import FILE_HEADER, ROUND_HEADER, RoundRecorder, read_rounds
+from src.table import Table
+from src.wheel import WHEEL_LAYOUT, Color
+
+
+def _play(table, players, rounds):
+    """Play rounds with a red bet and a number bet per player; return positions and balances."""
+    positions = []
+    for round_index in range(rounds):
+        for index, player in enumerate(players):
+            table.reserve_and_place_bet(Bet(10, player, BetType.COLOR, Color.RED))
+            table.reserve_and_place_bet(Bet(1, player, BetType.NUMBER, (round_index + index) % 37))
+        table.spin_wheel_and_payout()
+        positions.append(table.wheel.get_ball_position()[0])
+    return positions
+
+
+class TestRoundLog:
+    """Test class for recording and streaming rounds."""
+
+    def test_records_stream_back(self):
+        """Test that every settled round is read back with its totals and deltas."""
+        players = [Player(10_000) for _ in range(3)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rounds.log")
+            table = Table(rng=MersenneTwisterRNG(5))
+            with RoundRecorder(path).attach(table):
+                positions = _play(table, players, 200)
+
+            records = list(read_rounds(path, chunk_size=100))
+
+        assert [record.round_id for record in records] == list(range(200))
+        assert [record.position for record in records] == positions
+        for record in records:
+            assert record.total_staked == 33
+            assert [player_id for player_id, _ in record.deltas] == [0, 1, 2]
+            assert sum(delta for _, delta in record.deltas) == record.total_paid - record.total_staked
+        for player_id, player in enumerate(players):
+            net = sum(dict(record.deltas)[player_id] for record in records)
+            assert player.get_balance() == 10_000 + net
+
+    def test_place_bet_stakes_are_recorded(self):
+        """Test that bets placed without a ledger reservation still log their stake."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rounds.log")
+            table = Table(rng=MersenneTwisterRNG(5))
+            player = Player(1000)
+            with RoundRecorder(path).attach(table):
+                for _ in range(20):
+                    # The caller debits the stake itself, as place_bet callers do
+                    player.subtract_from_balance(10)
+                    table.place_bet(Bet(10, player, BetType.COLOR, Color.RED))
+                    table.spin_wheel_and_payout()
+
+            records = list(read_rounds(path))
+
+        assert len(records) == 20
+        for record in records:
+            won = WHEEL_LAYOUT.color(record.position) == Color.RED
+            assert record.total_staked == 10
+            assert record.deltas == ((0, 10 if won else -10),)
+        assert player.get_balance() == 1000 + sum(delta for record in records for _, delta in record.deltas)
+
+    def test_log_is_append_only_and_fixed_size(self):
+        """Test that reopening appends and record sizes follow the layout."""
+        player = Player(1000)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rounds.log")
+            table = Table(rng=MersenneTwisterRNG(1))
+            with RoundRecorder(path).attach(table):
+                _play(table, [player], 3)
+            table = Table(rng=MersenneTwisterRNG(2))
+            with RoundRecorder(path, fsync_interval=0).attach(table):
+                _play(table, [player], 2)
+
+            size = os.path.getsize(path)
+            round_ids = [record.round_id for record in read_rounds(path)]
+
+        assert size == len(FILE_HEADER) + 5 * (ROUND_HEADER.size + 16)
+        assert round_ids == [0, 1, 2, 0, 1]
+
+    def test_player_ids_of_departed_players_are_dropped(self):
+        """Test that the recorder forgets players that are gone without reusing their ids."""
+        with tempfile.TemporaryDirectory() as directory:
+            with RoundRecorder(os.path.join(directory, "rounds.log")) as recorder:
+                players = [Player(0) for _ in range(100)]
+                assert [recorder.player_id(player) for player in players] == list(range(100))
+                assert recorder.player_id(players[7]) == 7
+                del players
+                gc.collect()
+                assert len(recorder._player_ids) == 0
+                assert recorder.player_id(Player(0)) == 100
+
+    def test_log_serves_one_table(self):
+        """Test that a recorder refuses a second table until the first is detached."""
+        with tempfile.TemporaryDirectory() as directory:
+            first = Table(rng=MersenneTwisterRNG(1))
+            second = Table(rng=MersenneTwisterRNG(2))
+            with RoundRecorder(os.path.join(directory, "rounds.log")).attach(first) as recorder:
+                if PYTEST_AVAILABLE:
+                    with pytest.raises(ValueError):
+                        recorder.attach(second)
+                recorder.detach(first)
+                recorder.attach(second)
+
+    def test_truncated_tail_is_ignored(self):
+        """Test that a partly written last round does not break the reader."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rounds.log")
+            table = Table(rng=MersenneTwisterRNG(3))
+            with RoundRecorder(path).attach(table):
+                _play(table, [Player(1000), Player(1000)], 4)
+            with open(path, "r+b") as handle:
+                handle.truncate(os.path.getsize(path) - 5)
+
+            assert len(list(read_rounds(path))) == 3
+
+            with open(path, "wb") as handle:
+                handle.write(b"not a log")
+            if PYTEST_AVAILABLE:
+                with pytest.raises(ValueError):
+                    list(read_rounds(path))
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestRoundLog()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
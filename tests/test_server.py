@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio multi-table game server.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import asyncio
+import os
+import tempfile
+
+from src.metrics import MetricsRegistry
+from src.server import RouletteServer
+
+
+class _Client:
+    """Minimal line protocol client."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, command):
+        self.writer.write(command.encode() + b"\n")
+        await self.writer.drain()
+        return (await self.reader.readline()).decode().strip()
+
+    async def close(self):
+        await self.send("QUIT")
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _connect(address):
+    return _Client(*await asyncio.open_connection(*address))
+
+
+def _run(scenario, **server_options):
+    """Run a scenario coroutine against a fresh server on a local TCP port."""
+
+    async def main():
+        server = RouletteServer(**server_options)
+        address = await server.start()
+        try:
+            return await scenario(server, address)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestRouletteServer:
+    """Test class for the line protocol game server."""
+
+    def test_full_round_settles_like_table(self):
+        """Test join, deposit, bet, spin and balance over the protocol."""
+
+        async def scenario(server, address):
+            client = await _connect(address)
+            assert await client.send("JOIN 3") == "OK JOINED 3"
+            assert await client.send("DEPOSIT 100") == "OK BALANCE 100"
+            assert await client.send("BET COLOR red 10") == "OK BET 0 90"
+            assert await client.send("BET NUMBER 17 5") == "OK BET 0 85"
+            result = (await client.send("SPIN")).split()
+            balance = await client.send("BALANCE")
+            await client.close()
+            return result, balance
+
+        result, balance = _run(scenario, round_interval=None, seed=1)
+        assert result[0] == "RESULT" and result[1] == "0"
+        position, color, winnings, final = int(result[2]), result[3], int(result[4]), int(result[5])
+        expected = (20 if color == "red" else 0) + (175 if position == 17 else 0)
+        assert winnings == expected
+        assert final == 85 + expected
+        assert balance == f"OK BALANCE {final}"
+
+    def test_validation_errors_reuse_game_controller_messages(self):
+        """Test that bad input is rejected with the interactive game's messages."""
+
+        async def scenario(server, address):
+            client = await _connect(address)
+            replies = [
+                await client.send("BET COLOR red 10"),
+                await client.send("JOIN 0"),
+                await client.send("DEPOSIT 2.5"),
+                await client.send("DEPOSIT 50"),
+                await client.send("BET NUMBER 37 5"),
+                await client.send("BET COLOR purple 5"),
+                await client.send("BET COLOR red 0"),
+                await client.send("BET COLOR red 60"),
+                await client.send("DANCE"),
+                await client.send("BALANCE"),
+            ]
+            await client.close()
+            return replies
+
+        replies = _run(scenario, round_interval=None)
+        assert replies[0] == "ERR Join a table first"
+        assert replies[2] == "ERR Deposit amount must be a whole number (no decimals)."
+        assert replies[4].startswith("ERR '37' is not a valid number choice")
+        assert replies[5] == "ERR 'purple' is not a valid color choice."
+        assert replies[6] == "ERR Bet amount must be greater than 0."
+        assert replies[7] == "ERR Insufficient balance"
+        assert replies[8] == "ERR Unknown command: DANCE"
+        assert replies[9] == "OK BALANCE 50"
+
+    def test_malformed_table_ids_get_an_error_reply(self):
+        """Test that every JOIN gets a reply, even for digits int() cannot parse."""
+
+        async def scenario(server, address):
+            client = await _connect(address)
+            replies = [
+                await client.send("JOIN \u00b2"),
+                await client.send("JOIN x"),
+                await client.send("JOIN -1"),
+                await client.send("JOIN 1"),
+            ]
+            await client.close()
+            return replies
+
+        replies = _run(scenario, round_interval=None, max_tables=4)
+        assert replies[0] == "ERR Table must be a number, not \u00b2"
+        assert replies[1] == "ERR Table must be a number, not x"
+        assert replies[2] == "ERR Table must be between 0 and 3"
+        assert replies[3] == "OK JOINED 1"
+
+    def test_tables_run_their_own_round_timers(self):
+        """Test that timed tables spin on their own and serve players independently."""
+
+        async def scenario(server, address):
+            clients = [await _connect(address) for _ in range(6)]
+            for index, client in enumerate(clients):
+                await client.send(f"JOIN {index % 2}")
+                await client.send("DEPOSIT 100")
+                await client.send("BET COLOR black 10")
+            results = await asyncio.gather(*(client.send("SPIN") for client in clients))
+            for client in clients:
+                await client.close()
+            return [result.split() for result in results], server.tables
+
+        results, tables = _run(scenario, round_interval=0.01, seed=2)
+        assert set(tables) == {0, 1}
+        for index, result in enumerate(results):
+            same_table = results[index % 2]
+            # Everyone at a table sees the same spin
+            assert result[1:4] == same_table[1:4]
+            assert int(result[5]) == 90 + int(result[4])
+
+    def test_cannot_change_tables_with_bets_in_play(self):
+        """Test that bets stay at the table they were placed on."""
+
+        async def scenario(server, address):
+            client = await _connect(address)
+            await client.send("JOIN 1")
+            await client.send("DEPOSIT 20")
+            await client.send("BET COLOR green 5")
+            refused = await client.send("JOIN 2")
+            await client.send("SPIN")
+            moved = await client.send("JOIN 2")
+            await client.close()
+            return refused, moved
+
+        refused, moved = _run(scenario, round_interval=None)
+        assert refused == "ERR Cannot change tables with bets in play"
+        assert moved == "OK JOINED 2"
+
+    def test_spin_reports_a_round_already_spun(self):
+        """Test that SPIN answers with the round holding the player's bets."""
+
+        async def scenario(server, address):
+            first, second = await _connect(address), await _connect(address)
+            for client in (first, second):
+                await client.send("JOIN 0")
+                await client.send("DEPOSIT 100")
+                await client.send("BET COLOR red 10")
+            # The first player's SPIN spins round 0 before the second asks
+            first_result = await first.send("SPIN")
+            second_result = await second.send("SPIN")
+            await first.close()
+            await second.close()
+            return first_result, second_result
+
+        first_result, second_result = _run(scenario, round_interval=None, seed=4)
+        assert first_result.split()[:5] == second_result.split()[:5]
+        assert second_result.split()[1] == "0"
+
+    def test_stats_cover_the_tables_spins(self):
+        """Test that STATS reports the table's rolling hot/cold statistics."""
+
+        async def scenario(server, address):
+            client = await _connect(address)
+            before = await client.send("STATS")
+            await client.send("JOIN 2")
+            positions = []
+            for _ in range(3):
+                positions.append(int((await client.send("SPIN")).split()[2]))
+            stats = (await client.send("STATS")).split()
+            await client.close()
+            return before, positions, stats
+
+        before, positions, stats = _run(scenario, round_interval=None, seed=9)
+        assert before == "ERR Join a table first"
+        assert stats[0] == "STATS" and stats[1] == "3"
+        hot = dict(pair.split(":") for pair in stats[3].split(","))
+        assert int(hot[str(positions[-1])]) >= 1
+        colors = {stats[index]: int(stats[index + 1]) for index in (6, 8, 10)}
+        assert sorted(colors) == ["BLACK", "GREEN", "RED"]
+        assert sum(colors.values()) == 3
+        assert stats[12] == "STREAK"
+
+    def test_tables_and_players_update_metrics(self):
+        """Test that server tables and players feed a shared metrics registry."""
+
+        async def scenario(server, address):
+            client = await _connect(address)
+            await client.send("JOIN 4")
+            await client.send("DEPOSIT 50")
+            await client.send("BET COLOR black 10")
+            await client.send("BET NUMBER 3 5")
+            result = (await client.send("SPIN")).split()
+            await client.close()
+            return int(result[4])
+
+        registry = MetricsRegistry()
+        winnings = _run(scenario, round_interval=None, seed=2, metrics=registry)
+        text = registry.render()
+        samples = dict(line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+        assert samples["roulette_rounds_total"] == "1"
+        assert samples["roulette_bets_total"] == "2"
+        assert samples["roulette_staked_total"] == "15"
+        assert samples["roulette_paid_total"] == str(winnings)
+        assert samples["roulette_player_credited_total"] == str(50 + winnings)
+        assert samples["roulette_tables_open"] == "1"
+
+    def test_unix_socket(self):
+        """Test that the server can listen on a Unix socket."""
+        if not hasattr(asyncio, "start_unix_server"):
+            return
+
+        async def main(path):
+            server = RouletteServer(round_interval=None)
+            await server.start(path=path)
+            client = _Client(*await asyncio.open_unix_connection(path))
+            reply = await client.send("BALANCE")
+            await client.close()
+            await server.close()
+            return reply
+
+        with tempfile.TemporaryDirectory() as directory:
+            assert asyncio.run(main(os.path.join(directory, "roulette.sock"))) == "OK BALANCE 0"
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestRouletteServer()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the columnar SettlementEngine used by Table._payout_bets.
+Verifies that batched settlement pays exactly what Bet.payout pays.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+from random import Random
+
+from src.bet import Bet, BetType
+from src.player import Player
+from src.settlement import SettlementEngine
+from src.table import Table
+from src.wheel import Color, WHEEL_POSITIONS
+
+
+def _random_slip(rng, player_count, count):
+    """Build a random mix of (player index, amount, bet type, value) specs."""
+    slip = []
+    for _ in range(count):
+        player_index = rng.randrange(player_count)
+        amount = rng.randint(1, 100)
+        if rng.random() < 0.5:
+            slip.append((player_index, amount, BetType.COLOR, rng.choice(list(Color))))
+        else:
+            slip.append((player_index, amount, BetType.NUMBER, rng.randint(0, 36)))
+    return slip
+
+
+class TestSettlementEngine:
+    """Test class for the columnar settlement engine."""
+
+    def test_matches_bet_payout_for_every_position(self):
+        """Test that engine payouts equal per-bet payouts on all 37 positions."""
+        rng = Random(1234)
+        for position in range(37):
+            engine_players = [Player(0) for _ in range(5)]
+            reference_players = [Player(0) for _ in range(5)]
+            slip = _random_slip(rng, 5, 200)
+
+            engine = SettlementEngine()
+            for player_index, amount, bet_type, bet_value in slip:
+                engine.add_bet(Bet(amount, engine_players[player_index], bet_type, bet_value))
+                Bet(amount, reference_players[player_index], bet_type, bet_value).payout(
+                    WHEEL_POSITIONS[position], position
+                )
+            engine.settle(position)
+
+            assert [p.get_balance() for p in engine_players] == [
+                p.get_balance() for p in reference_players
+            ]
+
+    def test_one_balance_update_per_player(self):
+        """Test that winnings are aggregated into one update per player."""
+        calls = []
+
+        class CountingPlayer(Player):
+            def add_to_balance(self, amount):
+                calls.append(amount)
+                super().add_to_balance(amount)
+
+        player = CountingPlayer(0)
+        engine = SettlementEngine()
+        for _ in range(10):
+            engine.add_bet(Bet(10, player, BetType.COLOR, Color.RED))
+
+        winnings = engine.settle(1)  # Position 1 is red
+
+        assert calls == [200]
+        assert winnings == [200]
+        assert player.get_balance() == 200
+
+    def test_bets_that_cannot_win_are_skipped(self):
+        """Test that untyped or out-of-range bets are never paid."""
+        player = Player(0)
+        engine = SettlementEngine()
+
+        assert engine.add_bet(Bet(10, player)) == -1
+        assert engine.add_bet(Bet(10, player, BetType.NUMBER, 37)) == -1
+        assert len(engine) == 0
+
+    def test_clear_resets_round(self):
+        """Test that clearing the engine drops all bets and players."""
+        player = Player(0)
+        engine = SettlementEngine()
+        engine.add_bet(Bet(10, player, BetType.NUMBER, 5))
+        engine.clear()
+
+        assert len(engine) == 0
+        assert engine.players == []
+        assert engine.settle(5) == []
+        assert player.get_balance() == 0
+
+    def test_table_settles_through_engine(self):
+        """Test that Table payouts still match the per-bet rules."""
+        player = Player(100)
+        table = Table()
+        table.place_bet(Bet(10, player, BetType.COLOR, Color.GREEN))
+        table.place_bet(Bet(10, player, BetType.NUMBER, 0))
+        table.place_bet(Bet(10, player, color=Color.RED))
+
+        table.wheel._ball_position = 0
+        table._payout_bets()
+
+        assert player.get_balance() == 100 + 10 * 35 + 10 * 35
+        assert table.bets == []
+
+    def test_table_indexes_bets_by_winning_target(self):
+        """Test that place_bet files bets under the position or color that wins them."""
+        player = Player(100)
+        table = Table()
+        table.place_bet(Bet(10, player, BetType.NUMBER, 17))
+        table.place_bet(Bet(10, player, BetType.COLOR, Color.BLACK))
+        table.place_bet(Bet(10, player, BetType.NUMBER, 17))
+
+        assert table._position_index[17] == [0, 2]
+        assert table._color_index[Color.BLACK] == [1]
+        assert table._color_index[Color.RED] == []
+
+        table.wheel._ball_position = 3
+        table._payout_bets()
+
+        assert all(not bucket for bucket in table._position_index)
+        assert all(not bucket for bucket in table._color_index.values())
+
+    def test_indexed_table_matches_bet_payout(self):
+        """Test that indexed table settlement equals per-bet payouts on all positions."""
+        rng = Random(99)
+        table = Table()
+        for position in range(37):
+            table_players = [Player(0) for _ in range(4)]
+            reference_players = [Player(0) for _ in range(4)]
+            for player_index, amount, bet_type, bet_value in _random_slip(rng, 4, 150):
+                table.place_bet(Bet(amount, table_players[player_index], bet_type, bet_value))
+                Bet(amount, reference_players[player_index], bet_type, bet_value).payout(
+                    WHEEL_POSITIONS[position], position
+                )
+
+            table.wheel._ball_position = position
+            table._payout_bets()
+
+            assert [p.get_balance() for p in table_players] == [
+                p.get_balance() for p in reference_players
+            ]
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestSettlementEngine()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
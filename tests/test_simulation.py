@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for headless simulation through GameController with betting policies.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import contextlib
+import io
+
+from src.bet import BetType
+from src.game_controller import GameController
+from src.limits import MAX_AMOUNT
+from src.simulation import (
+    BetRequest,
+    BettingPolicy,
+    FlatBetPolicy,
+    MartingalePolicy,
+    MixedSlipPolicy,
+    is_valid_bet_request,
+)
+from src.wheel import Color, Wheel, WHEEL_POSITIONS
+
+
+def _seeded_controller(seed):
+    controller = GameController()
+    controller.table.wheel = Wheel(seed=seed)
+    return controller
+
+
+class TestHeadlessSimulation:
+    """Test class for GameController headless rounds."""
+
+    def test_headless_run_produces_no_output(self):
+        """Test that a headless run never prints or prompts."""
+        controller = _seeded_controller(1)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results = controller.run_headless(
+                FlatBetPolicy(BetType.COLOR, Color.RED, 10), 50, initial_balance=1000
+            )
+
+        assert output.getvalue() == ""
+        assert 0 < len(results) <= 50
+
+    def test_round_results_track_balance(self):
+        """Test that each result's balance follows from its bets and payout."""
+        controller = _seeded_controller(2)
+        slip = [
+            BetRequest(BetType.COLOR, Color.BLACK, 5),
+            BetRequest(BetType.NUMBER, 17, 2),
+        ]
+        results = controller.run_headless(MixedSlipPolicy(slip), 200, initial_balance=500)
+
+        balance = 500
+        for result in results:
+            assert result.bets_placed == 2
+            assert result.total_bet == 7
+            assert result.winning_color == WHEEL_POSITIONS[result.winning_position]
+            balance = balance - result.total_bet + result.total_payout
+            assert result.balance == balance
+        assert controller.player.get_balance() == balance
+
+    def test_headless_run_is_reproducible(self):
+        """Test that the same seed and policy replay the same rounds."""
+        first = _seeded_controller(3).run_headless(
+            MartingalePolicy(Color.RED, 1), 100, initial_balance=200
+        )
+        second = _seeded_controller(3).run_headless(
+            MartingalePolicy(Color.RED, 1), 100, initial_balance=200
+        )
+
+        assert first == second
+
+    def test_simulation_stops_when_broke(self):
+        """Test that play stops once the player cannot cover a bet."""
+        controller = _seeded_controller(4)
+        results = controller.run_headless(
+            FlatBetPolicy(BetType.NUMBER, 0, 10), 10000, initial_balance=30
+        )
+
+        assert len(results) < 10000
+        assert controller.player.get_balance() < 10
+
+    def test_policies_must_choose_bets(self):
+        """Test that the policy base class cannot be used on its own."""
+        if PYTEST_AVAILABLE:
+            with pytest.raises(TypeError):
+                BettingPolicy()
+
+    def test_invalid_requests_are_skipped(self):
+        """Test that bets the prompts would reject are never placed."""
+        assert not is_valid_bet_request(BetRequest(BetType.NUMBER, 37, 5), 100)
+        assert not is_valid_bet_request(BetRequest(BetType.COLOR, "red", 5), 100)
+        assert not is_valid_bet_request(BetRequest(BetType.COLOR, Color.RED, 0), 100)
+        assert not is_valid_bet_request(BetRequest(BetType.COLOR, Color.RED, 101), 100)
+        assert is_valid_bet_request(BetRequest(BetType.NUMBER, 0, 100), 100)
+        assert is_valid_bet_request(BetRequest(BetType.COLOR, Color.RED, MAX_AMOUNT), MAX_AMOUNT + 1)
+        assert not is_valid_bet_request(BetRequest(BetType.COLOR, Color.RED, MAX_AMOUNT + 1), MAX_AMOUNT + 1)
+        assert GameController().validate_positive_integer(str(MAX_AMOUNT + 1), "Bet amount") is None
+
+        controller = _seeded_controller(5)
+        slip = [
+            BetRequest(BetType.NUMBER, 99, 5),
+            BetRequest(BetType.COLOR, Color.GREEN, 5),
+        ]
+        results = controller.run_headless(MixedSlipPolicy(slip), 1, initial_balance=100)
+
+        assert results[0].bets_placed == 1
+        assert results[0].total_bet == 5
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestHeadlessSimulation()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
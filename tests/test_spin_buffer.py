@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the buffered outcome source.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import threading
+
+from src.rng import CounterSpinSource, MersenneTwisterRNG, make_rng
+from src.spin_buffer import BufferedSpinSource
+from src.table import Table
+from src.wheel import Wheel
+
+
+class TestBufferedSpinSource:
+    """Test class for the pre-drawn outcome ring buffer."""
+
+    def test_order_matches_unbuffered_source(self):
+        """Test that buffering never reorders outcomes under a fixed seed."""
+        for kind in ("mt19937", "pcg64", "counter"):
+            unbuffered = make_rng(kind, 21)
+            expected = [unbuffered.spin_position() for _ in range(5000)]
+            with BufferedSpinSource(make_rng(kind, 21), 64, 16, block_size=8) as buffered:
+                drawn = [buffered.spin_position() for _ in range(1000)]
+                drawn.extend(buffered.spin_positions(3000))
+                drawn.extend(buffered.spin_position() for _ in range(1000))
+
+            assert drawn == expected, kind
+
+    def test_wheel_spins_match_unbuffered_wheel(self):
+        """Test that a wheel on a buffered source spins like a plain seeded wheel."""
+        plain = Wheel(8)
+        with BufferedSpinSource(MersenneTwisterRNG(8), capacity=32, low_water=8, block_size=8) as buffered:
+            wheel = Wheel(rng=buffered)
+            for _ in range(200):
+                plain.spin()
+                wheel.spin()
+                assert wheel.get_ball_position() == plain.get_ball_position()
+
+    def test_table_uses_buffered_source(self):
+        """Test that a table settles rounds drawn from the buffer."""
+        with BufferedSpinSource(CounterSpinSource(4), capacity=16, low_water=4, block_size=4) as buffered:
+            table = Table(rng=buffered)
+            for round_number in range(50):
+                table.spin_wheel_and_payout()
+                expected = CounterSpinSource(4).position_at(round_number)
+                assert table.wheel.get_ball_position()[0] == expected
+
+    def test_buffer_refills_in_background(self):
+        """Test that the ring is topped up after dropping below the low-water mark."""
+        with BufferedSpinSource(MersenneTwisterRNG(1), capacity=100, low_water=50, block_size=10) as buffered:
+            assert buffered.buffered == 100
+            buffered.spin_positions(60)
+            for _ in range(1000):
+                if buffered.buffered == 100:
+                    break
+                buffered._thread.join(0.001)
+            assert buffered.buffered == 100
+
+    def test_zero_low_water_refills_when_empty(self):
+        """Test that a low-water mark of 0 refills once the queue runs dry instead of hanging."""
+        reference = MersenneTwisterRNG(1)
+        expected = [reference.spin_position() for _ in range(100)]
+        drawn = []
+
+        def spin():
+            with BufferedSpinSource(MersenneTwisterRNG(1), capacity=8, low_water=0, block_size=4) as buffered:
+                drawn.extend(buffered.spin_position() for _ in range(100))
+
+        # Spin on a thread so a regression fails the test instead of hanging it
+        worker = threading.Thread(target=spin, daemon=True)
+        worker.start()
+        worker.join(10)
+        assert not worker.is_alive()
+        assert drawn == expected
+
+    def test_invalid_configuration_and_closed_source(self):
+        """Test bad buffer sizes and reads past a closed, drained buffer."""
+        if not PYTEST_AVAILABLE:
+            return
+        with pytest.raises(ValueError):
+            BufferedSpinSource(MersenneTwisterRNG(1), capacity=0)
+        with pytest.raises(ValueError):
+            BufferedSpinSource(MersenneTwisterRNG(1), capacity=10, low_water=10)
+        with pytest.raises(ValueError):
+            BufferedSpinSource(MersenneTwisterRNG(1), block_size=0)
+
+        buffered = BufferedSpinSource(MersenneTwisterRNG(1), capacity=4, low_water=0, block_size=2)
+        buffered.close()
+        assert len(buffered.spin_positions(4)) == 4
+        with pytest.raises(RuntimeError):
+            buffered.spin_position()
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestBufferedSpinSource()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
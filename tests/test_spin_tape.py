@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for memory-mapped spin tapes.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+import os
+import tempfile
+from functools import partial
+
+from src.bet import Bet, BetType
+from src.monte_carlo import run_sessions, simulate
+from src.player import Player
+from src.rng import MersenneTwisterRNG
+from src.simulation import FlatBetPolicy
+from src.spin_tape import TAPE_HEADER, SpinTape, write_tape
+from src.table import Table
+from src.wheel import Color, Wheel
+
+
+def _write(directory, spins, seed=3, batch_size=1 << 20):
+    path = os.path.join(directory, "spins.tape")
+    write_tape(path, spins, MersenneTwisterRNG(seed), batch_size)
+    return path
+
+
+class TestSpinTape:
+    """Test class for writing and reading spin tapes."""
+
+    def test_tape_round_trips_rng_draws(self):
+        """Test that a tape holds exactly the backend's batched draws, one byte each."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(directory, 1000, batch_size=64)
+            assert os.path.getsize(path) == TAPE_HEADER.size + 1000
+
+            rng = MersenneTwisterRNG(3)
+            expected = []
+            for start in range(0, 1000, 64):
+                expected.extend(rng.spin_positions(min(64, 1000 - start)))
+            tape = SpinTape(path)
+            assert len(tape) == 1000
+            assert tape.spin_positions(1000).tolist() == expected
+
+    def test_wheel_and_table_draw_from_tape(self):
+        """Test that a table settles rounds on the tape's positions in order."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(directory, 50)
+            expected = SpinTape(path).spin_positions(50).tolist()
+
+            table = Table(rng=SpinTape(path))
+            player = Player(1000)
+            positions = []
+            for _ in range(50):
+                table.reserve_and_place_bet(Bet(1, player, BetType.COLOR, Color.RED))
+                table.spin_wheel_and_payout()
+                positions.append(table.wheel.get_ball_position()[0])
+            assert positions == expected
+
+    def test_seek_and_random_access(self):
+        """Test that seek, tell and position_at address any spin."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(directory, 100)
+            tape = SpinTape(path)
+            spins = tape.spin_positions(100).tolist()
+
+            wheel = Wheel(rng=tape)
+            wheel.spin(42)
+            assert wheel.get_ball_position()[0] == spins[42]
+            assert tape.tell() == 43
+            assert tape.position_at(7) == spins[7]
+            if PYTEST_AVAILABLE:
+                with pytest.raises(IndexError):
+                    tape.position_at(100)
+                with pytest.raises(ValueError):
+                    tape.seek(101)
+
+    def test_cursors_are_independent(self):
+        """Test that cursors share the mapping but keep their own read positions."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(directory, 100)
+            tape = SpinTape(path)
+            spins = tape.spin_positions(100).tolist()
+
+            first = tape.cursor(10)
+            second = tape.cursor(60)
+            assert [first.spin_position() for _ in range(5)] == spins[10:15]
+            assert bytes(second.view(5)) == bytes(spins[60:65])
+            assert first.tell() == 15
+            assert tape.tell() == 100
+
+    def test_close_releases_view_and_mapping(self):
+        """Test that closing a cursor keeps the mapping and closing the tape releases it."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(directory, 20)
+            with SpinTape(path) as tape:
+                with tape.cursor(5) as cursor:
+                    position = cursor.spin_position()
+                assert tape.position_at(5) == position
+                assert not tape._map.closed
+            assert tape._map.closed
+            if PYTEST_AVAILABLE:
+                with pytest.raises(ValueError):
+                    tape.spin_position()
+
+    def test_exhausted_tape_raises(self):
+        """Test that reading past the end raises EOFError."""
+        with tempfile.TemporaryDirectory() as directory:
+            tape = SpinTape(_write(directory, 3))
+            tape.spin_positions(3)
+            if PYTEST_AVAILABLE:
+                with pytest.raises(EOFError):
+                    tape.spin_position()
+                with pytest.raises(EOFError):
+                    tape.cursor(2).view(2)
+
+    def test_rejects_files_that_are_not_tapes(self):
+        """Test that a bad magic or a truncated tape is refused."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bogus.tape")
+            with open(path, "wb") as handle:
+                handle.write(b"NOTATAPE" + bytes(16))
+            truncated = _write(directory, 100)
+            with open(truncated, "r+b") as handle:
+                handle.truncate(TAPE_HEADER.size + 50)
+            if PYTEST_AVAILABLE:
+                with pytest.raises(ValueError):
+                    SpinTape(path)
+                with pytest.raises(ValueError):
+                    SpinTape(truncated)
+
+    def test_simulation_reads_session_slices(self):
+        """Test that sessions read their slices of the tape, for any worker count."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = _write(directory, 8 * 20)
+            policy_factory = partial(FlatBetPolicy, BetType.COLOR, Color.RED, 10)
+
+            serial = run_sessions(policy_factory, 0, 8, 0, 20, 10_000, tape=path)
+            pooled = simulate(policy_factory, 8, 20, 10_000, workers=2, backend="process", tape=path)
+            assert pooled == serial
+            assert serial.rounds == 8 * 20
+
+            # Different seeds do not matter: the spins come from the tape
+            assert run_sessions(policy_factory, 0, 8, 99, 20, 10_000, tape=path) == serial
+            if PYTEST_AVAILABLE:
+                with pytest.raises(ValueError):
+                    simulate(policy_factory, 9, 20, 10_000, workers=1, tape=path)
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestSpinTape()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
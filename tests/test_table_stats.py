@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for rolling hot/cold table statistics.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+from random import Random
+
+from src.bet import Bet, BetType
+from src.player import Player
+from src.rng import MersenneTwisterRNG
+from src.table import Table
+from src.table_stats import RollingStats, Streak
+from src.wheel import WHEEL_LAYOUT, Color
+
+
+def _longest_run(spins, color):
+    longest = run = 0
+    for position in spins:
+        run = run + 1 if WHEEL_LAYOUT.color(position) == color else 0
+        longest = max(longest, run)
+    return longest
+
+
+class TestRollingStats:
+    """Test class for constant-time rolling statistics."""
+
+    def test_matches_recomputing_the_window(self):
+        """Test every statistic against a from-scratch count of the last N spins."""
+        rng = Random(8)
+        for window in (1, 2, 5, 40):
+            stats = RollingStats(window)
+            spins = []
+            for _ in range(300):
+                # Skewed draws make ties, long streaks and hot numbers common
+                position = rng.choice([0, 1, 2, 3, rng.randrange(37)])
+                stats.record(position)
+                spins.append(position)
+                recent = spins[-window:]
+
+                counts = [recent.count(p) for p in range(37)]
+                assert stats.frequencies() == counts
+                assert stats.spins == len(recent)
+                assert [count for _, count in stats.hot(37)] == sorted(counts, reverse=True)
+                assert [count for _, count in stats.cold(37)] == sorted(counts)
+                assert all(counts[p] == count for p, count in stats.hot(3) + stats.cold(3))
+                for color in Color:
+                    assert stats.color_counts()[color] == sum(
+                        1 for p in recent if WHEEL_LAYOUT.color(p) == color
+                    )
+                    assert stats.longest_streak(color) == _longest_run(recent, color)
+
+    def test_hot_and_cold_numbers(self):
+        """Test that the most and least frequent numbers come first."""
+        stats = RollingStats(10)
+        for position in (7, 7, 7, 12, 12, 0):
+            stats.record(position)
+        assert stats.hot(3) == [(7, 3), (12, 2), (0, 1)]
+        assert all(count == 0 for _, count in stats.cold(5))
+        assert stats.count(7) == 3
+        assert len(stats.cold(50)) == 37
+
+    def test_streaks_and_sleepers(self):
+        """Test the current streak and spins since each number last won."""
+        stats = RollingStats(4)
+        assert stats.current_streak() == Streak(None, 0)
+        for position in (1, 3, 5, 2, 4):  # red, red, red, black, black
+            stats.record(position)
+        assert stats.current_streak() == Streak(Color.BLACK, 2)
+        # The first red spin has left the window
+        assert stats.longest_streak(Color.RED) == 2
+        assert stats.spins_since(4) == 0
+        assert stats.spins_since(1) == 4
+        assert stats.spins_since(36) is None
+        assert stats.total_spins == 5
+
+    def test_tracks_table_rounds(self):
+        """Test that an attached tracker sees every round the table settles."""
+        table = Table(rng=MersenneTwisterRNG(21))
+        stats = RollingStats(25).attach(table)
+        player = Player(10_000)
+        positions = []
+        for _ in range(60):
+            table.reserve_and_place_bet(Bet(1, player, BetType.NUMBER, 17))
+            table.spin_wheel_and_payout()
+            positions.append(table.wheel.get_ball_position()[0])
+        stats.detach(table)
+        table.spin_wheel_and_payout()
+
+        assert stats.total_spins == 60
+        assert stats.frequencies() == [positions[-25:].count(p) for p in range(37)]
+
+    def test_rejects_empty_window(self):
+        """Test that a window must hold at least one spin."""
+        if PYTEST_AVAILABLE:
+            with pytest.raises(ValueError):
+                RollingStats(0)
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    test_instance = TestRollingStats()
+    test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+    passed = 0
+    failed = 0
+
+    for method_name in test_methods:
+        try:
+            getattr(test_instance, method_name)()
+            print(f"✓ {method_name}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {method_name}: {e}")
+            failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Wheel class, including the batched spin API.
+"""
+
+try:
+    import pytest
+    PYTEST_AVAILABLE = True
+except ImportError:
+    PYTEST_AVAILABLE = False
+
+from array import array
+
+from src.wheel import Color, Wheel, WHEEL_LAYOUT, WHEEL_POSITIONS, CODE_COLORS, RED_NUMBERS
+
+
+class TestWheelSpin:
+    """Test class for single and batched wheel spins."""
+
+    def test_spin_lands_on_valid_position(self):
+        """Test that a single spin produces a position with its color."""
+        wheel = Wheel(seed=7)
+        wheel.spin()
+        position, color = wheel.get_ball_position()
+
+        assert 0 <= position <= 36
+        assert color == WHEEL_POSITIONS[position]
+
+    def test_spin_is_seedable(self):
+        """Test that wheels with the same seed produce the same spins."""
+        first = Wheel(seed=42)
+        second = Wheel(seed=42)
+
+        for _ in range(20):
+            first.spin()
+            second.spin()
+            assert first.get_ball_position() == second.get_ball_position()
+
+    def test_spin_many_returns_compact_array(self):
+        """Test that spin_many returns n byte-sized positions."""
+        wheel = Wheel(seed=1)
+        positions = wheel.spin_many(1000)
+
+        assert isinstance(positions, array)
+        assert positions.typecode == "B"
+        assert len(positions) == 1000
+        assert min(positions) >= 0
+        assert max(positions) <= 36
+
+    def test_spin_many_is_seedable(self):
+        """Test that batched spins are reproducible under a fixed seed."""
+        assert Wheel(seed=3).spin_many(500) == Wheel(seed=3).spin_many(500)
+        assert Wheel(seed=3).spin_many(500) != Wheel(seed=4).spin_many(500)
+
+    def test_spin_many_covers_all_positions(self):
+        """Test that batched spins are spread over every wheel position."""
+        positions = Wheel(seed=11).spin_many(37 * 1000)
+        counts = [0] * 37
+        for position in positions:
+            counts[position] += 1
+
+        # Each position expects 1000 hits; allow a generous margin
+        assert all(800 < count < 1200 for count in counts)
+
+    def test_spin_many_zero_and_negative(self):
+        """Test edge cases for the number of batched spins."""
+        wheel = Wheel(seed=5)
+        assert len(wheel.spin_many(0)) == 0
+
+        if PYTEST_AVAILABLE:
+            with pytest.raises(ValueError):
+                wheel.spin_many(-1)
+
+    def test_get_ball_positions_colors(self):
+        """Test that batched color codes match the wheel layout."""
+        wheel = Wheel(seed=9)
+        wheel.spin_many(200)
+        positions, colors = wheel.get_ball_positions()
+
+        assert len(colors) == len(positions)
+        for position, color_code in zip(positions, colors):
+            assert CODE_COLORS[color_code] == WHEEL_POSITIONS[position]
+
+    def test_spin_many_updates_single_ball_position(self):
+        """Test that get_ball_position reports the last batched spin."""
+        wheel = Wheel(seed=2)
+        positions = wheel.spin_many(10)
+        position, color = wheel.get_ball_position()
+
+        assert position == positions[-1]
+        assert color == WHEEL_POSITIONS[position]
+        assert isinstance(color, Color)
+
+
+class TestWheelLayout:
+    """Test class for the precomputed wheel layout tables."""
+
+    def test_layout_matches_wheel_positions(self):
+        """Test that the compatibility view agrees with the layout."""
+        assert len(WHEEL_POSITIONS) == 37
+        for position in range(37):
+            assert WHEEL_LAYOUT.color(position) == WHEEL_POSITIONS[position]
+
+    def test_layout_colors(self):
+        """Test the red/black masks against the standard red numbers."""
+        assert WHEEL_LAYOUT.color(0) == Color.GREEN
+        for position in range(1, 37):
+            is_red = position in RED_NUMBERS
+            assert WHEEL_LAYOUT.red[position] == is_red
+            assert WHEEL_LAYOUT.black[position] == (not is_red)
+        assert WHEEL_LAYOUT.red[0] == 0 and WHEEL_LAYOUT.black[0] == 0
+
+    def test_layout_parity_dozen_column(self):
+        """Test parity, dozen and column tables, including the zero."""
+        assert (WHEEL_LAYOUT.even[0], WHEEL_LAYOUT.odd[0]) == (0, 0)
+        assert (WHEEL_LAYOUT.dozen[0], WHEEL_LAYOUT.column[0]) == (0, 0)
+        assert WHEEL_LAYOUT.even[36] == 1 and WHEEL_LAYOUT.odd[35] == 1
+        assert [WHEEL_LAYOUT.dozen[p] for p in (1, 12, 13, 24, 25, 36)] == [1, 1, 2, 2, 3, 3]
+        assert [WHEEL_LAYOUT.column[p] for p in (1, 2, 3, 34, 35, 36)] == [1, 2, 3, 1, 2, 3]
+
+    def test_layout_is_immutable(self):
+        """Test that neither the layout nor the compatibility view can be modified."""
+        for mutate in (
+            lambda: setattr(WHEEL_LAYOUT, "red", b""),
+            lambda: WHEEL_POSITIONS.__setitem__(0, Color.RED),
+        ):
+            try:
+                mutate()
+            except (AttributeError, TypeError):
+                continue
+            raise AssertionError("wheel layout was modified")
+
+
+def run_standalone_tests():
+    """Run tests without pytest."""
+    passed = 0
+    failed = 0
+
+    for test_class in (TestWheelSpin, TestWheelLayout):
+        test_instance = test_class()
+        test_methods = [name for name in dir(test_instance) if name.startswith("test_")]
+
+        for method_name in test_methods:
+            try:
+                getattr(test_instance, method_name)()
+                print(f"✓ {method_name}")
+                passed += 1
+            except Exception as e:
+                print(f"✗ {method_name}: {e}")
+                failed += 1
+
+    print(f"\nTest Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    if PYTEST_AVAILABLE:
+        pytest.main([__file__, "-v"])
+    else:
+        success = run_standalone_tests()
+        exit(0 if success else 1)